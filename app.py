@@ -1,134 +1,338 @@
-from flask import Flask, jsonify, request
+from flask import Flask, Response, g, jsonify, make_response, request
+from flask.json.provider import JSONProvider
+from functools import wraps
+from gh_maintainer_dashboard.core.accounting import ACCOUNT_HEADERS, REQUEST_ID_HEADER, current_account, start_account
+from gh_maintainer_dashboard.core.async_client import iter_sync
+from gh_maintainer_dashboard.core.projection import FieldSet, project
 from flask_cors import CORS
 from dotenv import load_dotenv
+import json
+import logging
 import os
+import time
 
 load_dotenv()
+# Gunicorn workers share one on-disk response cache that also survives restarts
+os.environ.setdefault("CACHE_BACKEND", "sqlite")
 
-from gh_maintainer_dashboard import MaintainerDashboard
-from milestone_celebrations import MilestoneCelebrations
-from cookie_licking_detector import CookieLickingDetector
-from oss_discovery_engine import OSSDiscoveryEngine
+from services import API_INDEX, get_registry
+from jobs import get_job_queue
+from metrics import CONTENT_TYPE_LATEST, REQUESTS_IN_FLIGHT, observe_request, render
+from encoding import COMPRESSIBLE_TYPES, chunks, dumps, encode_body, loads
+from http_cache import MAX_AGES, etag_matches, get_response_cache, view_scope
+from batch import BATCH_CONCURRENCY, batch_records, batch_usernames
+from streaming import STREAM_FORMATS, STREAM_HEADERS, encode_record, error_record, project_record, stream_format
+
+class ORJSONProvider(JSONProvider):
+    def dumps(self, obj, **kwargs):
+        return dumps(obj).decode("utf-8")
+    
+    def loads(self, s, **kwargs):
+        return loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Hands orjson's bytes straight to the response instead of round-tripping through str
+        return self._app.response_class(dumps(self._prepare_response_obj(args, kwargs)), mimetype="application/json")
 
 app = Flask(__name__)
-CORS(app)
+app.json = ORJSONProvider(app)
+CORS(app, expose_headers=list(ACCOUNT_HEADERS))
+
+@app.before_request
+def start_request_metrics():
+    g.request_started = time.perf_counter()
+    REQUESTS_IN_FLIGHT.inc()
+
+@app.before_request
+def start_upstream_account():
+    start_account(request.headers.get(REQUEST_ID_HEADER))
+
+@app.after_request
+def report_request_metrics(response):
+    route = request.url_rule.rule if request.url_rule else "unmatched"
+    method, status, started = request.method, response.status_code, g.request_started
+    
+    # Observed once the body is fully sent, so streamed responses count their whole duration
+    def finish():
+        REQUESTS_IN_FLIGHT.dec()
+        observe_request(route, method, status, started)
+    
+    response.call_on_close(finish)
+    return response
+
+@app.after_request
+def report_upstream_calls(response):
+    # Streamed bodies make their upstream calls after the headers go out, so only the log line sees those
+    account = current_account()
+    if account is not None:
+        response.headers.update(account.headers())
+        response.call_on_close(account.log)
+    return response
+
+@app.after_request
+def compress_response(response):
+    if response.is_streamed or response.status_code != 200 or not (response.mimetype or "").startswith(COMPRESSIBLE_TYPES):
+        return response
+    
+    response.vary.add('Accept-Encoding')
+    body, encoding = encode_body(response.get_data(), response.mimetype, request.headers.get('Accept-Encoding'))
+    if encoding is None:
+        return response
+    
+    response.response = chunks(body)
+    response.headers['Content-Encoding'] = encoding
+    response.headers['Content-Length'] = str(len(body))
+    if response.headers.get('ETag'):
+        # A compressed body is a different representation, so it gets its own strong validator
+        response.headers['ETag'] = response.headers['ETag'][:-1] + f'-{encoding}"'
+    return response
+
+def cached_view(view):
+    max_age = MAX_AGES[view.__name__]
+    
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if request.method not in ('GET', 'HEAD'):
+            return view(*args, **kwargs)
+        
+        # Fresh responses are replayed without touching the service, so a repeat view costs
+        # neither upstream calls nor serialization
+        response_cache = get_response_cache()
+        scope = view_scope(kwargs)
+        entry = response_cache.get(request.full_path, scope)
+        if entry is None:
+            response = make_response(view(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+            entry = response_cache.store(request.full_path, response.get_data(), response.mimetype, max_age, scope)
+        
+        headers = response_cache.headers(entry)
+        if etag_matches(request.headers.get('If-None-Match'), entry["etag"]):
+            return Response(status=304, headers=headers)
+        return Response(entry["body"], mimetype=entry["content_type"], headers=headers)
+    
+    return wrapper
 
-TOKEN = os.getenv('GITHUB_TOKEN')
+def request_fields():
+    return FieldSet.parse(request.args.get('fields'))
 
 @app.route('/')
 def home():
-    return jsonify({
-        "status": "API Running",
-        "version": "1.0.0",
-        "endpoints": {
-            "dashboard": {
-                "profile": "/api/dashboard/:username/profile",
-                "repositories": "/api/dashboard/:username/repositories",
-                "timeline": "/api/dashboard/:username/timeline",
-                "similar": "/api/dashboard/:username/similar",
-                "export_cv": "/api/dashboard/:username/export-cv"
-            },
-            "milestones": "/api/milestones/:username",
-            "stale_claims": "/api/stale-claims/:owner/:repo",
-            "discovery": "/api/discover/:username"
-        }
-    })
+    return jsonify(project(API_INDEX, request_fields()))
 
 @app.route('/api/health')
 def health():
-    return jsonify({"status": "healthy"})
+    return jsonify(project({"status": "healthy"}, request_fields()))
+
+@app.route('/metrics')
+def metrics():
+    return Response(render(), content_type=CONTENT_TYPE_LATEST)
 
 # Dashboard endpoints
 @app.route('/api/dashboard/<username>/profile')
+@cached_view
 def dashboard_profile(username):
     try:
-        service = MaintainerDashboard(TOKEN)
+        service = get_registry().get("dashboard")
         data = service.get_profile(username)
-        return jsonify({"success": True, "data": data})
+        return jsonify({"success": True, "data": project(data, request_fields())})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
 @app.route('/api/dashboard/<username>/repositories')
+@cached_view
 def dashboard_repositories(username):
     try:
-        service = MaintainerDashboard(TOKEN)
+        service = get_registry().get("dashboard")
         data = service.get_repositories(username)
-        return jsonify({"success": True, "data": data})
+        return jsonify({"success": True, "data": project(data, request_fields())})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
 @app.route('/api/dashboard/<username>/timeline')
+@cached_view
 def dashboard_timeline(username):
     try:
-        service = MaintainerDashboard(TOKEN)
+        service = get_registry().get("dashboard")
         data = service.get_timeline(username)
-        return jsonify({"success": True, "data": data})
+        return jsonify({"success": True, "data": project(data, request_fields())})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
 @app.route('/api/dashboard/<username>/similar')
+@cached_view
 def dashboard_similar(username):
     try:
-        service = MaintainerDashboard(TOKEN)
+        service = get_registry().get("dashboard")
         data = service.find_similar_maintainers(username)
-        return jsonify({"success": True, "data": data})
+        return jsonify({"success": True, "data": project(data, request_fields())})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
 @app.route('/api/dashboard/<username>/export-cv')
+@cached_view
 def dashboard_export_cv(username):
     try:
-        service = MaintainerDashboard(TOKEN)
+        service = get_registry().get("dashboard")
         data = service.export_cv(username)
-        return jsonify({"success": True, "data": data})
+        return jsonify({"success": True, "data": project(data, request_fields())})
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
+# Batch endpoints stream one record per user as each finishes
+def batch_response(name, run):
+    try:
+        service = get_registry().get(name)
+        body = request.get_json(silent=True)
+        usernames = batch_usernames(body)
+        fmt = stream_format(request.args.get('format'), request.headers.get('Accept'))
+        fields = request_fields()
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
+    
+    def generate():
+        # Per-user failures are records of their own; this catches the batch itself failing part-way
+        try:
+            for record in iter_sync(batch_records(run(service, usernames, body), fields)):
+                yield encode_record(record, fmt)
+        except Exception as e:
+            yield encode_record(error_record(e), fmt)
+    
+    return Response(generate(), mimetype=STREAM_FORMATS[fmt], headers=STREAM_HEADERS)
+
+@app.route('/api/dashboard/profiles/batch', methods=['POST'])
+def dashboard_profiles_batch():
+    return batch_response(
+        "dashboard",
+        lambda service, usernames, body: service.get_profiles_batch(usernames, concurrency=BATCH_CONCURRENCY)
+    )
+
+@app.route('/api/milestones/batch', methods=['POST'])
+def milestones_batch():
+    return batch_response(
+        "milestones",
+        lambda service, usernames, body: service.get_milestone_sections_batch(
+            usernames, body.get('repos'), concurrency=BATCH_CONCURRENCY
+        )
+    )
 
 # Milestones endpoint
 @app.route('/api/milestones/<username>')
+@cached_view
 def milestones(username):
     try:
-        service = MilestoneCelebrations(TOKEN)
+        service = get_registry().get("milestones")
         data = service.get_milestone_sections(username)
-        return jsonify({"success": True, "data": data})
+        return jsonify({"success": True, "data": project(data, request_fields())})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
 # Stale claims endpoint
 @app.route('/api/stale-claims/<owner>/<repo>')
+@cached_view
 def stale_claims(owner, repo):
     try:
-        service = CookieLickingDetector(TOKEN)
+        service = get_registry().get("stale_claims")
         limit = request.args.get('limit', 20, type=int)
-        data = service.analyze_repository(f"{owner}/{repo}", limit)
-        return jsonify({"success": True, "data": data})
+        fields = request_fields()
+        data = service.analyze_repository(f"{owner}/{repo}", limit, fields=fields)
+        return jsonify({"success": True, "data": project(data, fields)})
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
+@app.route('/api/stale-claims/<owner>/<repo>/stream')
+def stale_claims_stream(owner, repo):
+    try:
+        service = get_registry().get("stale_claims")
+        limit = request.args.get('limit', 20, type=int)
+        fmt = stream_format(request.args.get('format'), request.headers.get('Accept'))
+        fields = request_fields()
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+    
+    def generate():
+        try:
+            for record in service.analyze_repository_iter(f"{owner}/{repo}", limit, fields):
+                record = project_record(record, fields, "all_claimed_issues")
+                if record is not None:
+                    yield encode_record(record, fmt)
+        except Exception as e:
+            yield encode_record(error_record(e), fmt)
+    
+    return Response(generate(), mimetype=STREAM_FORMATS[fmt], headers=STREAM_HEADERS)
+
 # Discovery endpoint
+def discover_params():
+    if request.method == 'POST':
+        body = request.get_json()
+        intent = body.get('intent', 'solve_issues')
+        query = body.get('query', '')
+        filters = body.get('filters', {})
+        limit = body.get('limit', 10)
+    else:
+        intent = request.args.get('intent', 'solve_issues')
+        query = request.args.get('query', '')
+        limit = int(request.args.get('limit', 10))
+        filters = {}
+    return intent, query, filters, limit
+
 @app.route('/api/discover/<username>', methods=['GET', 'POST'])
+@cached_view
 def discover(username):
     try:
-        service = OSSDiscoveryEngine(TOKEN)
+        service = get_registry().get("discovery")
+        intent, query, filters, limit = discover_params()
+        fields = request_fields()
+        
+        data = service.discover_projects(username, intent, query, filters, limit, fields=fields)
+        return jsonify({"success": True, "data": project(data, fields)})
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
+# Background scan jobs
+@app.route('/api/stale-claims/<owner>/<repo>/jobs', methods=['POST'])
+def stale_claims_job(owner, repo):
+    try:
+        service = get_registry().get("stale_claims")
+        limit = request.args.get('limit', 20, type=int)
+        full_name = f"{owner}/{repo}"
+        fields = request_fields()
         
-        if request.method == 'POST':
-            body = request.get_json()
-            intent = body.get('intent', 'solve_issues')
-            query = body.get('query', '')
-            filters = body.get('filters', {})
-            limit = body.get('limit', 10)
-        else:
-            intent = request.args.get('intent', 'solve_issues')
-            query = request.args.get('query', '')
-            limit = int(request.args.get('limit', 10))
-            filters = {}
+        job = get_job_queue().submit(
+            "stale_claims", (full_name, limit, request.args.get('fields')),
+            lambda progress: project(service.analyze_repository(full_name, limit, progress, fields), fields)
+        )
+        return jsonify({"success": True, "data": job.to_dict()}), 202
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
+@app.route('/api/discover/<username>/jobs', methods=['POST'])
+def discover_job(username):
+    try:
+        service = get_registry().get("discovery")
+        intent, query, filters, limit = discover_params()
+        fields = request_fields()
+        key = (username, intent, query, json.dumps(filters, sort_keys=True), limit, request.args.get('fields'))
         
-        data = service.discover_projects(username, intent, query, filters, limit)
-        return jsonify({"success": True, "data": data})
+        job = get_job_queue().submit(
+            "discovery", key,
+            lambda progress: project(service.discover_projects(username, intent, query, filters, limit, progress, fields), fields)
+        )
+        return jsonify({"success": True, "data": job.to_dict()}), 202
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
+@app.route('/api/jobs/<job_id>')
+def job_status(job_id):
+    job = get_job_queue().get(job_id)
+    if job is None:
+        return jsonify({"success": False, "error": f"Job {job_id} not found"}), 404
+    return jsonify({"success": True, "data": project(job.to_dict(), request_fields())})
+
 if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
     print("\n" + "="*60)
     print("  🚀 Unified OSS API")
     print("="*60)
@@ -0,0 +1,417 @@
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+from dotenv import load_dotenv
+from contextlib import asynccontextmanager
+from functools import wraps
+from gh_maintainer_dashboard.core.async_client import AsyncGitHubClient
+from gh_maintainer_dashboard.core.accounting import ACCOUNT_HEADERS, REQUEST_ID_HEADER, start_account
+from gh_maintainer_dashboard.core.projection import FieldSet, project
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+import asyncio
+import json
+import logging
+import os
+import time
+
+load_dotenv()
+# Gunicorn workers share one on-disk response cache that also survives restarts
+os.environ.setdefault("CACHE_BACKEND", "sqlite")
+
+from services import API_INDEX, default_registry, get_registry, set_registry
+from encoding import COMPRESSIBLE_TYPES, chunks, dumps, encode_body
+from jobs import get_job_queue
+from metrics import CONTENT_TYPE_LATEST, REQUESTS_IN_FLIGHT, observe_request, render
+from http_cache import MAX_AGES, etag_matches, get_response_cache, view_scope
+from batch import BATCH_CONCURRENCY, batch_records, batch_usernames
+from streaming import STREAM_FORMATS, STREAM_HEADERS, encode_record, error_record, project_record, stream_format
+
+
+class ORJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        
+        started = time.perf_counter()
+        status = 500
+        
+        async def observed_send(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+        
+        REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, observed_send)
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
+            # The router records the matched route on the scope, giving a template rather than a raw path
+            route = scope.get("route")
+            observe_request(route.path if route else "unmatched", scope["method"], status, started)
+
+
+class UpstreamAccountingMiddleware:
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        
+        # Set before the app runs so every task and worker thread it spawns shares this account
+        account = start_account(Headers(scope=scope).get(REQUEST_ID_HEADER))
+        
+        async def accounted_send(message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in account.headers().items():
+                    headers[name] = value
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, accounted_send)
+        finally:
+            account.log()
+
+
+class CompressionMiddleware:
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        
+        accept_encoding = Headers(scope=scope).get("accept-encoding")
+        start = None
+        body = []
+        
+        async def buffered_send(message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body":
+                return await send(message)
+            
+            if start is not None and message.get("more_body") and not body:
+                # Streamed responses (NDJSON, SSE) go out as written, uncompressed
+                await send(start)
+                start = None
+            if start is None:
+                return await send(message)
+            
+            body.append(message.get("body", b""))
+            if not message.get("more_body"):
+                await self._send_encoded(start, b"".join(body), accept_encoding, send)
+        
+        await self.app(scope, receive, buffered_send)
+    
+    async def _send_encoded(self, start, body: bytes, accept_encoding, send) -> None:
+        headers = MutableHeaders(raw=start["headers"])
+        content_type = headers.get("content-type", "")
+        if start["status"] == 200 and content_type.startswith(COMPRESSIBLE_TYPES):
+            headers.add_vary_header("Accept-Encoding")
+            body, encoding = encode_body(body, content_type, accept_encoding)
+            if encoding:
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+                if headers.get("etag"):
+                    headers["ETag"] = headers["etag"][:-1] + f'-{encoding}"'
+        
+        await send(start)
+        parts = list(chunks(body)) or [b""]
+        for index, part in enumerate(parts):
+            await send({"type": "http.response.body", "body": part, "more_body": index < len(parts) - 1})
+
+
+def request_fields(request) -> Optional[FieldSet]:
+    return FieldSet.parse(request.query_params.get('fields'))
+
+async def respond(name: str, call: Callable[[Any], Awaitable], status_code: int = 200,
+                  fields: Optional[FieldSet] = None) -> ORJSONResponse:
+    try:
+        data = await call(get_registry().get(name))
+        return ORJSONResponse({"success": True, "data": project(data, fields)}, status_code=status_code)
+    except Exception as e:
+        return ORJSONResponse({"success": False, "error": str(e)}, status_code=500)
+
+def cached_view(view):
+    max_age = MAX_AGES[view.__name__]
+    
+    @wraps(view)
+    async def wrapper(request):
+        if request.method not in ('GET', 'HEAD'):
+            return await view(request)
+        
+        key = request.url.path + (f"?{request.url.query}" if request.url.query else "?")
+        response_cache = get_response_cache()
+        scope = view_scope(request.path_params)
+        # The default backend is SQLite on disk, so lookups and writes stay off the event loop
+        entry = await asyncio.to_thread(response_cache.get, key, scope)
+        if entry is None:
+            response = await view(request)
+            if response.status_code != 200:
+                return response
+            entry = await asyncio.to_thread(response_cache.store, key, response.body, response.media_type,
+                                            max_age, scope)
+        
+        headers = response_cache.headers(entry)
+        if etag_matches(request.headers.get('if-none-match'), entry["etag"]):
+            return Response(status_code=304, headers=headers)
+        return Response(entry["body"], media_type=entry["content_type"], headers=headers)
+    
+    return wrapper
+
+async def home(request):
+    return ORJSONResponse(project(API_INDEX, request_fields(request)))
+
+async def health(request):
+    return ORJSONResponse(project({"status": "healthy"}, request_fields(request)))
+
+async def metrics(request):
+    return Response(render(), headers={"Content-Type": CONTENT_TYPE_LATEST})
+
+# Dashboard endpoints
+@cached_view
+async def dashboard_profile(request):
+    return await respond(
+        "dashboard", lambda service: service.get_profile_async(request.path_params["username"]),
+        fields=request_fields(request)
+    )
+
+@cached_view
+async def dashboard_repositories(request):
+    return await respond(
+        "dashboard", lambda service: service.get_repositories_async(request.path_params["username"]),
+        fields=request_fields(request)
+    )
+
+@cached_view
+async def dashboard_timeline(request):
+    return await respond(
+        "dashboard", lambda service: service.get_timeline_async(request.path_params["username"]),
+        fields=request_fields(request)
+    )
+
+@cached_view
+async def dashboard_similar(request):
+    return await respond(
+        "dashboard", lambda service: service.find_similar_maintainers_async(request.path_params["username"]),
+        fields=request_fields(request)
+    )
+
+@cached_view
+async def dashboard_export_cv(request):
+    return await respond(
+        "dashboard", lambda service: service.export_cv_async(request.path_params["username"]),
+        fields=request_fields(request)
+    )
+
+# Batch endpoints stream one record per user as each finishes
+async def batch_response(request, name, run):
+    try:
+        service = get_registry().get(name)
+        try:
+            body = await request.json()
+        except ValueError:
+            body = None
+        usernames = batch_usernames(body)
+        fmt = stream_format(request.query_params.get('format'), request.headers.get('accept'))
+        fields = request_fields(request)
+    except ValueError as e:
+        return ORJSONResponse({"success": False, "error": str(e)}, status_code=400)
+    except Exception as e:
+        return ORJSONResponse({"success": False, "error": str(e)}, status_code=500)
+    
+    async def generate():
+        # Per-user failures are records of their own; this catches the batch itself failing part-way
+        try:
+            async for record in batch_records(run(service, usernames, body), fields):
+                yield encode_record(record, fmt)
+        except Exception as e:
+            yield encode_record(error_record(e), fmt)
+    
+    return StreamingResponse(generate(), media_type=STREAM_FORMATS[fmt], headers=STREAM_HEADERS)
+
+async def dashboard_profiles_batch(request):
+    return await batch_response(
+        request, "dashboard",
+        lambda service, usernames, body: service.get_profiles_batch(usernames, concurrency=BATCH_CONCURRENCY)
+    )
+
+async def milestones_batch(request):
+    return await batch_response(
+        request, "milestones",
+        lambda service, usernames, body: service.get_milestone_sections_batch(
+            usernames, body.get('repos'), concurrency=BATCH_CONCURRENCY
+        )
+    )
+
+# Milestones endpoint
+@cached_view
+async def milestones(request):
+    return await respond(
+        "milestones", lambda service: service.get_milestone_sections_async(request.path_params["username"]),
+        fields=request_fields(request)
+    )
+
+# Stale claims endpoint
+@cached_view
+async def stale_claims(request):
+    fields = request_fields(request)
+    
+    async def run(service):
+        limit = int(request.query_params.get('limit', 20))
+        repo = f"{request.path_params['owner']}/{request.path_params['repo']}"
+        return await service.analyze_repository_async(repo, limit, fields=fields)
+    
+    return await respond("stale_claims", run, fields=fields)
+
+async def stale_claims_stream(request):
+    try:
+        service = get_registry().get("stale_claims")
+        limit = int(request.query_params.get('limit', 20))
+        fmt = stream_format(request.query_params.get('format'), request.headers.get('accept'))
+        fields = request_fields(request)
+    except Exception as e:
+        return ORJSONResponse({"success": False, "error": str(e)}, status_code=500)
+    
+    async def generate():
+        repo = f"{request.path_params['owner']}/{request.path_params['repo']}"
+        try:
+            async for record in service.analyze_repository_stream(repo, limit, fields):
+                record = project_record(record, fields, "all_claimed_issues")
+                if record is not None:
+                    yield encode_record(record, fmt)
+        except Exception as e:
+            yield encode_record(error_record(e), fmt)
+    
+    return StreamingResponse(generate(), media_type=STREAM_FORMATS[fmt], headers=STREAM_HEADERS)
+
+# Discovery endpoint
+async def discover_params(request):
+    if request.method == 'POST':
+        body = await request.json()
+        intent = body.get('intent', 'solve_issues')
+        query = body.get('query', '')
+        filters = body.get('filters', {})
+        limit = body.get('limit', 10)
+    else:
+        intent = request.query_params.get('intent', 'solve_issues')
+        query = request.query_params.get('query', '')
+        limit = int(request.query_params.get('limit', 10))
+        filters = {}
+    return intent, query, filters, limit
+
+@cached_view
+async def discover(request):
+    fields = request_fields(request)
+    
+    async def run(service):
+        intent, query, filters, limit = await discover_params(request)
+        return await service.discover_projects_async(
+            request.path_params["username"], intent, query, filters, limit, fields=fields
+        )
+    
+    return await respond("discovery", run, fields=fields)
+
+# Background scan jobs; each job runs the blocking entry point on the job queue's worker pool
+async def stale_claims_job(request):
+    async def submit(service):
+        limit = int(request.query_params.get('limit', 20))
+        repo = f"{request.path_params['owner']}/{request.path_params['repo']}"
+        fields = request_fields(request)
+        job = get_job_queue().submit(
+            "stale_claims", (repo, limit, request.query_params.get('fields')),
+            lambda progress: project(service.analyze_repository(repo, limit, progress, fields), fields)
+        )
+        return job.to_dict()
+    
+    return await respond("stale_claims", submit, status_code=202)
+
+async def discover_job(request):
+    async def submit(service):
+        username = request.path_params["username"]
+        intent, query, filters, limit = await discover_params(request)
+        fields = request_fields(request)
+        key = (username, intent, query, json.dumps(filters, sort_keys=True), limit, request.query_params.get('fields'))
+        job = get_job_queue().submit(
+            "discovery", key,
+            lambda progress: project(service.discover_projects(username, intent, query, filters, limit, progress, fields), fields)
+        )
+        return job.to_dict()
+    
+    return await respond("discovery", submit, status_code=202)
+
+async def job_status(request):
+    job_id = request.path_params["job_id"]
+    job = get_job_queue().get(job_id)
+    if job is None:
+        return ORJSONResponse({"success": False, "error": f"Job {job_id} not found"}, status_code=404)
+    return ORJSONResponse({"success": True, "data": project(job.to_dict(), request_fields(request))})
+
+routes = [
+    Route('/', home),
+    Route('/api/health', health),
+    Route('/metrics', metrics),
+    Route('/api/dashboard/{username}/profile', dashboard_profile),
+    Route('/api/dashboard/{username}/repositories', dashboard_repositories),
+    Route('/api/dashboard/{username}/timeline', dashboard_timeline),
+    Route('/api/dashboard/{username}/similar', dashboard_similar),
+    Route('/api/dashboard/{username}/export-cv', dashboard_export_cv),
+    Route('/api/dashboard/profiles/batch', dashboard_profiles_batch, methods=['POST']),
+    Route('/api/milestones/batch', milestones_batch, methods=['POST']),
+    Route('/api/milestones/{username}', milestones),
+    Route('/api/stale-claims/{owner}/{repo}', stale_claims),
+    Route('/api/stale-claims/{owner}/{repo}/stream', stale_claims_stream),
+    Route('/api/discover/{username}', discover, methods=['GET', 'POST']),
+    Route('/api/stale-claims/{owner}/{repo}/jobs', stale_claims_job, methods=['POST']),
+    Route('/api/discover/{username}/jobs', discover_job, methods=['POST']),
+    Route('/api/jobs/{job_id}', job_status),
+]
+
+@asynccontextmanager
+async def lifespan(app: Starlette) -> AsyncIterator[None]:
+    # One client per worker: every request's GitHub calls share its connection pool instead of
+    # opening and tearing down a session per call
+    client = await AsyncGitHubClient().open()
+    set_registry(default_registry(async_client=client))
+    try:
+        yield
+    finally:
+        set_registry(None)
+        await client.close()
+
+
+app = Starlette(routes=routes, lifespan=lifespan, middleware=[
+    Middleware(MetricsMiddleware),
+    Middleware(UpstreamAccountingMiddleware),
+    Middleware(CORSMiddleware, allow_origins=["*"], expose_headers=list(ACCOUNT_HEADERS)),
+    Middleware(CompressionMiddleware),
+])
+
+if __name__ == '__main__':
+    import uvicorn
+    
+    logging.basicConfig(level=logging.INFO)
+    print("\n" + "="*60)
+    print("  🚀 Unified OSS API (async)")
+    print("="*60)
+    print("  Running on: http://localhost:5001")
+    print("  Health: http://localhost:5001/api/health")
+    print("  Docs: http://localhost:5001/")
+    print("="*60 + "\n")
+    uvicorn.run(app, host='0.0.0.0', port=5001)
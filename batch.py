@@ -0,0 +1,30 @@
+import os
+from typing import AsyncIterator, Dict, List, Optional
+
+from gh_maintainer_dashboard.core.projection import FieldSet, project
+
+BATCH_MAX_USERS = int(os.getenv("BATCH_MAX_USERS", "50"))
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "5"))
+
+
+def batch_usernames(body: Optional[Dict]) -> List[str]:
+    usernames = (body or {}).get("usernames")
+    if not isinstance(usernames, list) or not usernames:
+        raise ValueError("Request body needs a non-empty 'usernames' list")
+    
+    usernames = list(dict.fromkeys(str(username) for username in usernames))
+    if len(usernames) > BATCH_MAX_USERS:
+        raise ValueError(f"At most {BATCH_MAX_USERS} usernames can be requested in one batch")
+    return usernames
+
+
+async def batch_records(results: AsyncIterator[Dict], fields: Optional[FieldSet] = None) -> AsyncIterator[Dict]:
+    total = 0
+    failed = 0
+    async for result in results:
+        total += 1
+        failed += 0 if result["success"] else 1
+        if result["success"]:
+            result = {**result, "data": project(result["data"], fields)}
+        yield {"type": "user", "data": result}
+    yield {"type": "summary", "data": {"total": total, "succeeded": total - failed, "failed": failed}}
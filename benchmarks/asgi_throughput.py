@@ -0,0 +1,102 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class MockGitHubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    latency = 0.1
+    
+    def do_GET(self):
+        # Every path looks like a search with a few hits; the milestones route only needs counts
+        time.sleep(self.latency)
+        payload = json.dumps({"total_count": 3, "items": [{"number": number} for number in range(3)]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+class MockGitHubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 drops connections long before the app under test saturates
+    request_queue_size = 1024
+
+
+def start_mock_github(latency: float) -> ThreadingHTTPServer:
+    MockGitHubHandler.latency = latency
+    server = MockGitHubServer(("127.0.0.1", 0), MockGitHubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def run(requests: int, concurrency: int) -> None:
+    import httpx
+    from asgi import app
+    from gh_maintainer_dashboard.core.rate_limiter import RateLimiter
+    from gh_maintainer_dashboard.core.transport import get_transport
+    
+    # The mock has no quota; lift the local search budget (30/min) so this measures serving, not throttling
+    pool = get_transport().token_pool
+    for token in [None, *pool.tokens]:
+        pool.limiters[token] = RateLimiter(max_calls=10 ** 6, limits={"search": 10 ** 6, "graphql": 10 ** 6})
+    
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def milestones(i: int) -> int:
+            async with semaphore:
+                # Distinct users so the response cache and request coalescing never short-circuit a call
+                response = await client.get(f"/api/milestones/bench-user-{i}")
+                return response.status_code
+        
+        async def health_latency() -> float:
+            await asyncio.sleep(0.05)
+            started = time.perf_counter()
+            await client.get("/api/health")
+            return time.perf_counter() - started
+        
+        started = time.perf_counter()
+        statuses, health = await asyncio.gather(
+            asyncio.gather(*(milestones(i) for i in range(requests))),
+            health_latency(),
+        )
+        elapsed = time.perf_counter() - started
+    
+    print(f"requests:        {requests} (concurrency {concurrency})")
+    print(f"succeeded:       {statuses.count(200)}")
+    print(f"elapsed:         {elapsed:.2f}s")
+    print(f"throughput:      {requests / elapsed:.1f} req/s")
+    print(f"health latency:  {health * 1000:.1f}ms while busy")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Drive the ASGI app against a local mock GitHub API")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.1, help="Seconds the mock GitHub API sleeps per call")
+    args = parser.parse_args()
+    
+    server = start_mock_github(args.latency)
+    os.environ["GITHUB_API_URL"] = f"http://127.0.0.1:{server.server_address[1]}"
+    os.environ.setdefault("CACHE_BACKEND", "memory")
+    os.environ.setdefault("HTTP_POOL_MAXSIZE", str(args.concurrency))
+    
+    asyncio.run(run(args.requests, args.concurrency))
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from encoding import brotli, compress, dumps
+
+REPORT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cookie_licking_detector", "report.json")
+
+
+def flask_default_dumps(data) -> bytes:
+    # What Flask's DefaultJSONProvider did before: stdlib json with a str() fallback for datetimes
+    return json.dumps(data, default=str, ensure_ascii=True, sort_keys=True).encode("utf-8")
+
+
+def timed(fn, rounds: int) -> float:
+    started = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - started) / rounds * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serialization time and bytes on the wire for a stale-claims report")
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+    
+    with open(REPORT_PATH, encoding="utf-8") as f:
+        report = json.load(f)
+    # Services hand back datetimes from pydantic .dict() calls; include some so both encoders pay for them
+    payload = {"success": True, "data": {**report, "generated_at": datetime.now()}}
+    
+    print(f"{'encoder':<12}{'ms/response':>14}{'bytes':>12}")
+    for name, encoder in (("json", flask_default_dumps), ("orjson", dumps)):
+        body = encoder(payload)
+        print(f"{name:<12}{timed(lambda: encoder(payload), args.rounds):>14.3f}{len(body):>12}")
+    
+    body = dumps(payload)
+    encodings = ["gzip"] + (["br"] if brotli is not None else [])
+    print(f"\n{'encoding':<12}{'ms/response':>14}{'bytes':>12}{'ratio':>10}")
+    print(f"{'identity':<12}{0:>14.3f}{len(body):>12}{1:>10.2f}")
+    for encoding in encodings:
+        compressed = compress(body, encoding)
+        elapsed = timed(lambda: compress(body, encoding), args.rounds)
+        print(f"{encoding:<12}{elapsed:>14.3f}{len(compressed):>12}{len(body) / len(compressed):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
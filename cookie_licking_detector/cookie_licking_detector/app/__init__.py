@@ -3,97 +3,177 @@ from .user_profiler import UserProfiler
 from .staleness_analyzer import StalenessAnalyzer
 from .ai_analyzer import AIAnalyzer
 from .message_generator import MessageGenerator
-from typing import Dict, List
+from gh_maintainer_dashboard.core.async_client import AsyncGitHubClient, iter_bounded, iter_sync, run_sync, use_client
+from gh_maintainer_dashboard.core.projection import FieldSet, wants
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
+import asyncio
 
 class CookieLickingDetector:
-    def __init__(self, github_token: str = None):
+    def __init__(self, github_token: str = None, concurrency: int = 10,
+                 async_client: Optional[AsyncGitHubClient] = None):
+        self.github_token = github_token
+        self.async_client = async_client
+        self.concurrency = concurrency
         self.claim_detector = ClaimDetector(github_token)
         self.user_profiler = UserProfiler(github_token)
         self.staleness_analyzer = StalenessAnalyzer()
         self.ai_analyzer = AIAnalyzer()
         self.message_generator = MessageGenerator()
     
-    def analyze_repository(self, repo: str, limit: int = 20) -> Dict:
+    def analyze_repository(self, repo: str, limit: int = 20,
+                           progress_callback: Optional[Callable[[int, int], None]] = None,
+                           fields: Optional[FieldSet] = None) -> Dict:
+        return run_sync(self.analyze_repository_async(repo, limit, progress_callback, fields))
+    
+    async def analyze_repository_async(self, repo: str, limit: int = 20,
+                                       progress_callback: Optional[Callable[[int, int], None]] = None,
+                                       fields: Optional[FieldSet] = None) -> Dict:
         scan_start = datetime.now()
+        scored = [item async for item in self._scan_repository(repo, limit, progress_callback, fields)]
         
-        print(f"🍪 Scanning {repo} (limit: {limit} issues)...\n")
+        # Records arrive in completion order; the report keeps the issue listing order
+        all_issues_data = [issue_data for idx, issue_data in sorted(scored, key=lambda item: item[0])]
+        return self._build_report(repo, scan_start, all_issues_data)
+    
+    async def analyze_repository_stream(self, repo: str, limit: int = 20,
+                                        fields: Optional[FieldSet] = None) -> AsyncIterator[Dict]:
+        scan_start = datetime.now()
+        summary = self._new_summary()
         
-        claimed_issues = self.claim_detector.detect_claimed_issues(repo, limit=limit)
+        async for idx, issue_data in self._scan_repository(repo, limit, fields=fields):
+            self._add_to_summary(summary, issue_data)
+            yield {"type": "issue", "data": issue_data}
         
-        all_issues_data = []
-        summary_by_user = {}
+        yield {"type": "summary", "data": self._summary_report(repo, scan_start, summary)}
+    
+    def analyze_repository_iter(self, repo: str, limit: int = 20, fields: Optional[FieldSet] = None) -> Iterator[Dict]:
+        return iter_sync(self.analyze_repository_stream(repo, limit, fields))
+    
+    async def _scan_repository(self, repo: str, limit: int,
+                               progress_callback: Optional[Callable[[int, int], None]] = None,
+                               fields: Optional[FieldSet] = None) -> AsyncIterator[Tuple[int, Dict]]:
+        # Sub-computations that only feed the report are skipped when the caller did not ask for them
+        include_past_performance = (wants(fields, "all_claimed_issues", "past_performance")
+                                    or wants(fields, "all_claimed_issues", "claimant_details", "past_performance"))
+        include_messages = wants(fields, "all_claimed_issues", "generated_messages")
         
-        for idx, item in enumerate(claimed_issues, 1):
-            print(f"[{idx}/{len(claimed_issues)}] Analyzing claimed issue...")
-            
-            issue = item["issue"]
-            claim_info = item["claim_info"]
-            
-            claimed_by = claim_info["claimed_by"]
-            
-            user_profile = self.user_profiler.get_user_profile(claimed_by, repo)
-            
-            progress = self.claim_detector.get_issue_progress(repo, issue["number"], claimed_by)
-            
-            reliability_score = user_profile["reliability_metrics"]["reliability_score"]
-            
-            staleness = self.staleness_analyzer.analyze_staleness(claim_info, progress, reliability_score)
-            
-            ai_analysis = self.ai_analyzer.analyze_claim(issue, user_profile, staleness, progress)
-            
-            suggested_actions = self._generate_actions(ai_analysis, staleness)
+        print(f"🍪 Scanning {repo} (limit: {limit} issues)...\n")
+        
+        async with use_client(self.async_client, self.github_token) as client:
+            claimed_issues = await self.claim_detector.detect_claimed_issues_async(
+                client, repo, limit=limit, concurrency=self.concurrency
+            )
             
-            messages = self.message_generator.generate_messages(issue, user_profile, staleness, ai_analysis)
+            # The repo's PR list is the same for every issue, so fetch it once per scan, and only
+            # when some issue missed the GraphQL bulk fetch and needs the REST progress path
+            needs_rest = any(item["details"] is None for item in claimed_issues)
+            prs = await client.get_pull_requests(repo, state="all") if needs_rest else []
+            profiles = {}
+            if progress_callback:
+                progress_callback(0, len(claimed_issues))
             
-            issue_data = {
-                "issue_id": f"issue_{issue['number']}",
-                "issue_details": {
-                    "number": issue["number"],
-                    "title": issue["title"],
-                    "url": issue["html_url"],
-                    "state": issue["state"],
-                    "labels": issue.get("labels", []),
-                    "created_at": issue["created_at"],
-                    "updated_at": issue["updated_at"],
-                    "claimed_at": claim_info["claimed_at"],
-                    "days_since_claim": staleness["days_stale"]
-                },
-                "claimant_details": user_profile,
-                "reliability_metrics": user_profile["reliability_metrics"],
-                "recent_activity_30d": user_profile["recent_activity_30d"],
-                "past_performance": user_profile["past_performance"],
-                "progress_tracking": progress,
-                "staleness_analysis": staleness,
-                "ai_analysis": ai_analysis,
-                "suggested_actions": suggested_actions,
-                "generated_messages": messages,
-                "health_status": staleness["status"]
-            }
+            async def profile_for(username: str) -> Dict:
+                if username not in profiles:
+                    profiles[username] = asyncio.ensure_future(
+                        self.user_profiler.get_user_profile_async(
+                            client, username, repo, include_past_performance=include_past_performance
+                        )
+                    )
+                return await profiles[username]
             
-            all_issues_data.append(issue_data)
+            async def analyze(idx: int, item: Dict) -> Tuple[int, Dict]:
+                issue = item["issue"]
+                claimed_by = item["claim_info"]["claimed_by"]
+                
+                user_profile, progress = await asyncio.gather(
+                    profile_for(claimed_by),
+                    self.claim_detector.get_issue_progress_async(
+                        client, repo, issue["number"], claimed_by, prs=prs, details=item["details"]
+                    ),
+                )
+                
+                print(f"[{idx}/{len(claimed_issues)}] Analyzed claimed issue #{issue['number']}")
+                return idx, self._score_issue(issue, item["claim_info"], user_profile, progress, include_messages)
             
-            if claimed_by not in summary_by_user:
-                summary_by_user[claimed_by] = {
-                    "total_claimed": 0,
-                    "critical": 0,
-                    "healthy": 0,
-                    "reliability_score": reliability_score
-                }
-            summary_by_user[claimed_by]["total_claimed"] += 1
-            if staleness["status"] == "critical":
-                summary_by_user[claimed_by]["critical"] += 1
-            elif staleness["status"] == "healthy":
-                summary_by_user[claimed_by]["healthy"] += 1
+            analyzed = 0
+            async for result in iter_bounded(
+                (analyze(idx, item) for idx, item in enumerate(claimed_issues, 1)),
+                limit=self.concurrency,
+            ):
+                analyzed += 1
+                if progress_callback:
+                    progress_callback(analyzed, len(claimed_issues))
+                yield result
+    
+    def _score_issue(self, issue: Dict, claim_info: Dict, user_profile: Dict, progress: Dict,
+                     include_messages: bool = True) -> Dict:
+        reliability_score = user_profile["reliability_metrics"]["reliability_score"]
         
-        scan_duration = (datetime.now() - scan_start).total_seconds()
+        staleness = self.staleness_analyzer.analyze_staleness(claim_info, progress, reliability_score)
         
-        status_counts = {
-            "healthy": len([i for i in all_issues_data if i["health_status"] == "healthy"]),
-            "needs_monitoring": len([i for i in all_issues_data if i["health_status"] == "needs_monitoring"]),
-            "needs_nudge": len([i for i in all_issues_data if i["health_status"] == "needs_nudge"]),
-            "critical": len([i for i in all_issues_data if i["health_status"] == "critical"])
+        ai_analysis = self.ai_analyzer.analyze_claim(issue, user_profile, staleness, progress)
+        
+        suggested_actions = self._generate_actions(ai_analysis, staleness)
+        
+        issue_data = {
+            "issue_id": f"issue_{issue['number']}",
+            "issue_details": {
+                "number": issue["number"],
+                "title": issue["title"],
+                "url": issue["html_url"],
+                "state": issue["state"],
+                "labels": issue.get("labels", []),
+                "created_at": issue["created_at"],
+                "updated_at": issue["updated_at"],
+                "claimed_at": claim_info["claimed_at"],
+                "days_since_claim": staleness["days_stale"]
+            },
+            "claimant_details": user_profile,
+            "reliability_metrics": user_profile["reliability_metrics"],
+            "recent_activity_30d": user_profile["recent_activity_30d"],
+            "past_performance": user_profile["past_performance"],
+            "progress_tracking": progress,
+            "staleness_analysis": staleness,
+            "ai_analysis": ai_analysis,
+            "suggested_actions": suggested_actions,
+            "health_status": staleness["status"]
         }
+        if include_messages:
+            issue_data["generated_messages"] = self.message_generator.generate_messages(issue, user_profile, staleness, ai_analysis)
+        return issue_data
+    
+    def _new_summary(self) -> Dict:
+        return {
+            "total": 0,
+            "status_counts": {"healthy": 0, "needs_monitoring": 0, "needs_nudge": 0, "critical": 0},
+            "summary_by_user": {},
+        }
+    
+    def _add_to_summary(self, summary: Dict, issue_data: Dict) -> None:
+        summary_by_user = summary["summary_by_user"]
+        claimed_by = issue_data["claimant_details"]["username"]
+        
+        if claimed_by not in summary_by_user:
+            summary_by_user[claimed_by] = {
+                "total_claimed": 0,
+                "critical": 0,
+                "healthy": 0,
+                "reliability_score": issue_data["reliability_metrics"]["reliability_score"]
+            }
+        summary_by_user[claimed_by]["total_claimed"] += 1
+        if issue_data["health_status"] == "critical":
+            summary_by_user[claimed_by]["critical"] += 1
+        elif issue_data["health_status"] == "healthy":
+            summary_by_user[claimed_by]["healthy"] += 1
+        
+        summary["total"] += 1
+        if issue_data["health_status"] in summary["status_counts"]:
+            summary["status_counts"][issue_data["health_status"]] += 1
+    
+    def _summary_report(self, repo: str, scan_start: datetime, summary: Dict) -> Dict:
+        scan_duration = (datetime.now() - scan_start).total_seconds()
+        status_counts = summary["status_counts"]
         
         return {
             "scan_metadata": {
@@ -102,17 +182,30 @@ class CookieLickingDetector:
                 "scan_duration_seconds": round(scan_duration, 2)
             },
             "repository_stats": {
-                "total_claimed_issues": len(all_issues_data),
+                "total_claimed_issues": summary["total"],
                 **status_counts
             },
-            "all_claimed_issues": all_issues_data,
-            "summary_by_user": summary_by_user,
+            "summary_by_user": summary["summary_by_user"],
             "recommendations_summary": {
                 "immediate_action_required": status_counts["critical"],
                 "monitor_closely": status_counts["needs_monitoring"]
             }
         }
     
+    def _build_report(self, repo: str, scan_start: datetime, all_issues_data: List[Dict]) -> Dict:
+        summary = self._new_summary()
+        for issue_data in all_issues_data:
+            self._add_to_summary(summary, issue_data)
+        
+        report = self._summary_report(repo, scan_start, summary)
+        return {
+            "scan_metadata": report["scan_metadata"],
+            "repository_stats": report["repository_stats"],
+            "all_claimed_issues": all_issues_data,
+            "summary_by_user": report["summary_by_user"],
+            "recommendations_summary": report["recommendations_summary"]
+        }
+    
     def _generate_actions(self, ai_analysis: Dict, staleness: Dict) -> List[Dict]:
         actions = []
         
@@ -1,40 +1,54 @@
+import asyncio
 from typing import Dict, List, Optional
 from datetime import datetime
-from .github_client import GitHubClient
+from gh_maintainer_dashboard.core.async_client import AsyncGitHubClient, gather_bounded
+from gh_maintainer_dashboard.core.bulk_issues import fetch_issues_bulk_async
+from gh_maintainer_dashboard.core.pagination import pages_for
 from .config import Config
 
 class ClaimDetector:
     def __init__(self, github_token: str = None):
-        self.client = GitHubClient(github_token)
         self.config = Config()
     
-    def detect_claimed_issues(self, repo: str, limit: int = 20) -> List[Dict]:
-        claimed_issues = []
+    async def detect_claimed_issues_async(self, client: AsyncGitHubClient, repo: str, limit: int = 20,
+                                          concurrency: int = 10) -> List[Dict]:
+        issues = await client.get_repo_issues(repo, state="open", max_pages=pages_for(limit))
+        issues = [issue for issue in issues[:limit] if not issue.get("pull_request")]
         
-        issues = self.client.get_repo_issues(repo, state="open")
+        print(f"Found {len(issues)} open issues. Checking claims concurrently...")
         
-        print(f"Found {len(issues)} open issues. Processing first {limit}...")
+        details = await self._fetch_issue_details_async(client, repo, [issue["number"] for issue in issues])
         
-        for idx, issue in enumerate(issues[:limit], 1):
-            if issue.get("pull_request"):
-                continue
-            
-            print(f"  [{idx}/{limit}] Checking issue #{issue['number']}...", end=" ")
-            
-            claim_info = self._detect_claim(repo, issue)
+        async def detect(issue: Dict) -> Optional[Dict]:
+            claim_info = self._claim_from_assignees(issue)
             if claim_info:
-                print(f"✓ Claimed by @{claim_info['claimed_by']}")
-                claimed_issues.append({
-                    "issue": issue,
-                    "claim_info": claim_info
-                })
-            else:
-                print("✗ Not claimed")
+                return claim_info
+            issue_details = details.get(issue["number"])
+            if issue_details:
+                return self._claim_from_comments(issue_details["comments"])
+            comments = await client.get_issue_comments(repo, issue["number"])
+            return self._claim_from_comments(comments)
+        
+        claims = await gather_bounded((detect(issue) for issue in issues), limit=concurrency)
+        
+        claimed_issues = [
+            {"issue": issue, "claim_info": claim_info, "details": details.get(issue["number"])}
+            for issue, claim_info in zip(issues, claims)
+            if claim_info
+        ]
         
         print(f"\nFound {len(claimed_issues)} claimed issues.\n")
         return claimed_issues
     
-    def _detect_claim(self, repo: str, issue: Dict) -> Optional[Dict]:
+    async def _fetch_issue_details_async(self, client: AsyncGitHubClient, repo: str,
+                                         numbers: List[int]) -> Dict[int, Dict]:
+        try:
+            return await fetch_issues_bulk_async(client.graphql, repo, numbers)
+        except Exception as e:
+            print(f"GraphQL error, falling back to REST: {e}")
+            return {}
+    
+    def _claim_from_assignees(self, issue: Dict) -> Optional[Dict]:
         assignees = issue.get("assignees", [])
         if assignees:
             return {
@@ -42,9 +56,9 @@ class ClaimDetector:
                 "claimed_at": issue.get("updated_at"),
                 "claim_method": "assigned"
             }
-        
-        comments = self.client.get_issue_comments(repo, issue["number"])
-        
+        return None
+    
+    def _claim_from_comments(self, comments: List[Dict]) -> Optional[Dict]:
         for comment in comments:
             comment_body = comment.get("body", "").lower()
             
@@ -59,15 +73,36 @@ class ClaimDetector:
         
         return None
     
-    def get_issue_progress(self, repo: str, issue_number: int, claimed_by: str) -> Dict:
-        prs = self.client.get_pull_requests(repo, state="all")
+    async def get_issue_progress_async(self, client: AsyncGitHubClient, repo: str, issue_number: int,
+                                       claimed_by: str, prs: List[Dict] = None, details: Dict = None) -> Dict:
+        if details:
+            return self._progress_from_details(issue_number, claimed_by, details)
+        
+        if prs is None:
+            prs, commits, comments = await asyncio.gather(
+                client.get_pull_requests(repo, state="all"),
+                client.get_commits(repo, author=claimed_by),
+                client.get_issue_comments(repo, issue_number),
+            )
+        else:
+            commits, comments = await asyncio.gather(
+                client.get_commits(repo, author=claimed_by),
+                client.get_issue_comments(repo, issue_number),
+            )
+        
+        return self._build_progress(issue_number, claimed_by, prs, commits, comments)
+    
+    def _progress_from_details(self, issue_number: int, claimed_by: str, details: Dict) -> Dict:
+        commits = [c for c in details["referenced_commits"] if c["author"]["login"] == claimed_by]
+        return self._build_progress(issue_number, claimed_by, details["linked_prs"], commits, details["comments"])
+    
+    def _build_progress(self, issue_number: int, claimed_by: str, prs: List[Dict],
+                        commits: List[Dict], comments: List[Dict]) -> Dict:
         linked_prs = [pr for pr in prs if f"#{issue_number}" in pr.get("body", "") or 
                       pr.get("user", {}).get("login") == claimed_by]
         
-        commits = self.client.get_commits(repo, author=claimed_by)
         issue_commits = [c for c in commits if f"#{issue_number}" in c["commit"]["message"]]
         
-        comments = self.client.get_issue_comments(repo, issue_number)
         user_comments = [c for c in comments if c["user"]["login"] == claimed_by]
         
         last_activity = None
@@ -1,6 +1,7 @@
-import requests
 from typing import Dict, List, Optional
 from datetime import datetime
+from gql import gql, Client
+from gh_maintainer_dashboard.core.transport import PooledGraphQLTransport, get_transport
 from .config import Config
 
 class GitHubClient:
@@ -11,65 +12,61 @@ class GitHubClient:
             "Authorization": f"token {self.token}",
             "Accept": "application/vnd.github.v3+json"
         }
+        self.transport = get_transport()
+        self.graphql_client = Client(transport=PooledGraphQLTransport(
+            url=f"{self.base_url}/graphql",
+            transport=self.transport,
+            headers=self.headers,
+            use_json=True,
+        ))
     
-    def get_repo_issues(self, repo: str, state: str = "open") -> List[Dict]:
+    def graphql(self, query: str, variables: Optional[Dict] = None) -> Dict:
+        return self.graphql_client.execute(gql(query), variable_values=variables)
+    
+    def get_repo_issues(self, repo: str, state: str = "open", max_pages: Optional[int] = None) -> List[Dict]:
         url = f"{self.base_url}/repos/{repo}/issues"
         params = {"state": state, "per_page": 100}
-        response = requests.get(url, headers=self.headers, params=params)
-        response.raise_for_status()
-        return response.json()
+        return list(self.transport.paginate(url, headers=self.headers, params=params, max_pages=max_pages))
     
     def get_issue_comments(self, repo: str, issue_number: int) -> List[Dict]:
         url = f"{self.base_url}/repos/{repo}/issues/{issue_number}/comments"
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
+        return list(self.transport.paginate(url, headers=self.headers, params={"per_page": 100}))
     
     def get_issue_events(self, repo: str, issue_number: int) -> List[Dict]:
         url = f"{self.base_url}/repos/{repo}/issues/{issue_number}/events"
-        response = requests.get(url, headers=self.headers)
-        response.raise_for_status()
-        return response.json()
+        return list(self.transport.paginate(url, headers=self.headers, params={"per_page": 100}))
     
     def get_user_info(self, username: str) -> Dict:
         url = f"{self.base_url}/users/{username}"
-        response = requests.get(url, headers=self.headers)
+        response = self.transport.get(url, headers=self.headers)
         response.raise_for_status()
         return response.json()
     
-    def get_user_repos(self, username: str) -> List[Dict]:
+    def get_user_repos(self, username: str, max_pages: Optional[int] = None) -> List[Dict]:
         url = f"{self.base_url}/users/{username}/repos"
         params = {"per_page": 100}
-        response = requests.get(url, headers=self.headers, params=params)
-        response.raise_for_status()
-        return response.json()
+        return list(self.transport.paginate(url, headers=self.headers, params=params, max_pages=max_pages))
     
     def get_user_events(self, username: str) -> List[Dict]:
         url = f"{self.base_url}/users/{username}/events"
         params = {"per_page": 100}
-        response = requests.get(url, headers=self.headers, params=params)
-        response.raise_for_status()
-        return response.json()
+        return list(self.transport.paginate(url, headers=self.headers, params=params))
     
     def search_issues(self, query: str) -> List[Dict]:
         url = f"{self.base_url}/search/issues"
         params = {"q": query, "per_page": 100}
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self.transport.get(url, headers=self.headers, params=params)
         response.raise_for_status()
         return response.json().get("items", [])
     
-    def get_pull_requests(self, repo: str, state: str = "open") -> List[Dict]:
+    def get_pull_requests(self, repo: str, state: str = "open", max_pages: Optional[int] = None) -> List[Dict]:
         url = f"{self.base_url}/repos/{repo}/pulls"
         params = {"state": state, "per_page": 100}
-        response = requests.get(url, headers=self.headers, params=params)
-        response.raise_for_status()
-        return response.json()
+        return list(self.transport.paginate(url, headers=self.headers, params=params, max_pages=max_pages))
     
-    def get_commits(self, repo: str, author: str = None) -> List[Dict]:
+    def get_commits(self, repo: str, author: str = None, max_pages: Optional[int] = None) -> List[Dict]:
         url = f"{self.base_url}/repos/{repo}/commits"
         params = {"per_page": 100}
         if author:
             params["author"] = author
-        response = requests.get(url, headers=self.headers, params=params)
-        response.raise_for_status()
-        return response.json()
+        return list(self.transport.paginate(url, headers=self.headers, params=params, max_pages=max_pages))
@@ -1,5 +1,7 @@
+import asyncio
 from typing import Dict, List
 from datetime import datetime, timedelta, timezone
+from gh_maintainer_dashboard.core.async_client import AsyncGitHubClient
 from .github_client import GitHubClient
 
 class UserProfiler:
@@ -11,12 +13,37 @@ class UserProfiler:
         
         claimed_issues = self._get_user_claimed_issues(username, repo)
         
-        reliability = self._calculate_reliability(claimed_issues)
-        
         recent_activity = self._get_recent_activity(username)
         
         past_performance = self._get_past_performance(username)
         
+        return self._build_profile(username, user_info, claimed_issues, recent_activity, past_performance)
+    
+    async def get_user_profile_async(self, client: AsyncGitHubClient, username: str, repo: str = None,
+                                     include_past_performance: bool = True) -> Dict:
+        user_info, claimed_issues, events = await asyncio.gather(
+            client.get_user_info(username),
+            client.search_issues(self._claimed_issues_query(username, repo)),
+            client.get_user_events(username),
+        )
+        
+        # Past performance costs a repo listing plus one search per repo and feeds nothing but the report
+        past_performance = []
+        if include_past_performance:
+            repos = (await client.get_user_repos(username, max_pages=1))[:5]
+            closed_issues = await asyncio.gather(*(
+                client.search_issues(self._closed_issues_query(username, r["full_name"])) for r in repos
+            ))
+            past_performance = self._summarize_past_performance(repos, closed_issues)
+        
+        recent_activity = self._summarize_recent_activity(events)
+        
+        return self._build_profile(username, user_info, claimed_issues, recent_activity, past_performance)
+    
+    def _build_profile(self, username: str, user_info: Dict, claimed_issues: List[Dict],
+                       recent_activity: Dict, past_performance: List[Dict]) -> Dict:
+        reliability = self._calculate_reliability(claimed_issues)
+        
         return {
             "username": username,
             "name": user_info.get("name"),
@@ -35,11 +62,16 @@ class UserProfiler:
         }
     
     def _get_user_claimed_issues(self, username: str, repo: str = None) -> List[Dict]:
+        return self.client.search_issues(self._claimed_issues_query(username, repo))
+    
+    def _claimed_issues_query(self, username: str, repo: str = None) -> str:
         query = f"author:{username} type:issue"
         if repo:
             query += f" repo:{repo}"
-        
-        return self.client.search_issues(query)
+        return query
+    
+    def _closed_issues_query(self, username: str, repo_full_name: str) -> str:
+        return f"author:{username} repo:{repo_full_name} type:issue is:closed"
     
     def _calculate_reliability(self, claimed_issues: List[Dict]) -> Dict:
         total = len(claimed_issues)
@@ -69,8 +101,9 @@ class UserProfiler:
             return "low"
     
     def _get_recent_activity(self, username: str) -> Dict:
-        events = self.client.get_user_events(username)
-        
+        return self._summarize_recent_activity(self.client.get_user_events(username))
+    
+    def _summarize_recent_activity(self, events: List[Dict]) -> Dict:
         thirty_days_ago = datetime.now(timezone.utc) - timedelta(days=30)
         
         commits = 0
@@ -101,12 +134,13 @@ class UserProfiler:
         }
     
     def _get_past_performance(self, username: str) -> List[Dict]:
-        repos = self.client.get_user_repos(username)
-        
+        repos = self.client.get_user_repos(username, max_pages=1)[:5]
+        closed_issues = [self.client.search_issues(self._closed_issues_query(username, repo["full_name"])) for repo in repos]
+        return self._summarize_past_performance(repos, closed_issues)
+    
+    def _summarize_past_performance(self, repos: List[Dict], closed_issues: List[List[Dict]]) -> List[Dict]:
         performance = []
-        for repo in repos[:5]:
-            issues = self.client.search_issues(f"author:{username} repo:{repo['full_name']} type:issue is:closed")
-            
+        for repo, issues in zip(repos, closed_issues):
             if len(issues) > 0:
                 performance.append({
                     "repo": repo["full_name"],
@@ -0,0 +1,77 @@
+import gzip
+import os
+from typing import Any, Iterator, Optional, Tuple
+
+import orjson
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESS_MIN_BYTES = int(os.getenv("COMPRESS_MIN_BYTES", "1024"))
+COMPRESSIBLE_TYPES = ("application/json",)
+CHUNK_SIZE = 64 * 1024
+
+
+def _default(obj: Any) -> Any:
+    # orjson covers dicts, lists, datetimes and dataclasses; pydantic models and sets still need a hand
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump()
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(data: Any) -> bytes:
+    return orjson.dumps(data, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def loads(data) -> Any:
+    return orjson.loads(data)
+
+
+def _accepted(accept_encoding: Optional[str]) -> dict:
+    accepted = {}
+    for part in (accept_encoding or "").split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name.strip().lower()] = quality
+    return accepted
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    accepted = _accepted(accept_encoding)
+    # Brotli wins when both are offered: JSON reports come out noticeably smaller than with gzip
+    for encoding in ("br", "gzip"):
+        if encoding == "br" and brotli is None:
+            continue
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=5)
+    return gzip.compress(body, compresslevel=6)
+
+
+def encode_body(body: bytes, content_type: Optional[str], accept_encoding: Optional[str]) -> Tuple[bytes, Optional[str]]:
+    if len(body) < COMPRESS_MIN_BYTES or not (content_type or "").startswith(COMPRESSIBLE_TYPES):
+        return body, None
+    encoding = choose_encoding(accept_encoding)
+    if encoding is None:
+        return body, None
+    return compress(body, encoding), encoding
+
+
+def chunks(body: bytes) -> Iterator[bytes]:
+    for start in range(0, len(body), CHUNK_SIZE):
+        yield body[start:start + CHUNK_SIZE]
@@ -1,4 +1,7 @@
-from gh_maintainer_dashboard.core.github_client import GitHubClient
+import asyncio
+from typing import AsyncIterator, Optional
+from gh_maintainer_dashboard.core.async_client import AsyncGitHubClient, iter_user_batch, use_client
+from gh_maintainer_dashboard.core.github_client import USER_READS, GitHubClient, UserSnapshot
 from gh_maintainer_dashboard.models.maintainer import MaintainerProfile
 from gh_maintainer_dashboard.models.repository import RepositoryData
 from gh_maintainer_dashboard.analyzers.activity_analyzer import ActivityAnalyzer
@@ -13,13 +16,14 @@ __all__ = [
 
 
 class MaintainerDashboard:
-    def __init__(self, github_token: str = None):
+    def __init__(self, github_token: str = None, async_client: Optional[AsyncGitHubClient] = None):
         from gh_maintainer_dashboard.core.config import Config
         
         self.config = Config(github_token=github_token)
+        self.async_client = async_client
         self.github_client = GitHubClient(self.config)
         self.activity_analyzer = ActivityAnalyzer(self.github_client)
-        
+    
     def get_profile(self, username: str) -> dict:
         from gh_maintainer_dashboard.analyzers.activity_analyzer import ActivityAnalyzer
         
@@ -49,3 +53,45 @@ class MaintainerDashboard:
         
         analyzer = TimelineAnalyzer(self.github_client)
         return analyzer.get_activity_timeline(username, period)
+    
+    async def _snapshot(self, username: str, reads: tuple) -> UserSnapshot:
+        async with use_client(self.async_client, self.config.github_token) as client:
+            return await self.github_client.snapshot_user(client, username, reads)
+    
+    # The async views fetch through AsyncGitHubClient, then run the same analyzers over the snapshot
+    async def get_profile_async(self, username: str) -> dict:
+        async with use_client(self.async_client, self.config.github_token) as client:
+            return await self._profile_async(client, username)
+    
+    async def _profile_async(self, client: AsyncGitHubClient, username: str) -> dict:
+        snapshot = await self.github_client.snapshot_user(client, username)
+        # Sentiment scoring is CPU-bound, so it still runs off the event loop
+        return await asyncio.to_thread(ActivityAnalyzer(snapshot).get_full_profile, username)
+    
+    async def export_cv_async(self, username: str, format: str = "json") -> dict:
+        from gh_maintainer_dashboard.exporters.cv_generator import CVGenerator
+        
+        snapshot = await self._snapshot(username, USER_READS)
+        return await asyncio.to_thread(CVGenerator(snapshot).generate_cv, username, format)
+    
+    async def find_similar_maintainers_async(self, username: str, limit: int = 10) -> list:
+        return self.find_similar_maintainers(username, limit)
+    
+    async def get_repositories_async(self, username: str) -> dict:
+        from gh_maintainer_dashboard.analyzers.repo_analyzer import RepoAnalyzer
+        
+        snapshot = await self._snapshot(username, ("get_user_repos",))
+        return RepoAnalyzer(snapshot).get_repository_breakdown(username)
+    
+    async def get_timeline_async(self, username: str, period: str = "30d") -> dict:
+        from gh_maintainer_dashboard.analyzers.timeline_analyzer import TimelineAnalyzer
+        
+        snapshot = await self._snapshot(username, ("get_user_events",))
+        return TimelineAnalyzer(snapshot).get_activity_timeline(username, period)
+    
+    async def get_profiles_batch(self, usernames: list, concurrency: int = 5) -> AsyncIterator[dict]:
+        # Every worker shares these clients, so their caches answer lookups that overlap across users
+        async with use_client(self.async_client, self.config.github_token) as client:
+            async for result in iter_user_batch(usernames, lambda username: self._profile_async(client, username),
+                                                limit=concurrency):
+                yield result
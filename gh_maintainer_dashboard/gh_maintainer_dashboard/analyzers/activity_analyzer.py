@@ -1,6 +1,7 @@
 from typing import Dict
 from datetime import datetime
 from gh_maintainer_dashboard.core.github_client import GitHubClient
+from gh_maintainer_dashboard.collectors.events import EventDispatcher
 from gh_maintainer_dashboard.collectors.review_collector import ReviewCollector
 from gh_maintainer_dashboard.collectors.issue_collector import IssueCollector
 from gh_maintainer_dashboard.collectors.comment_collector import CommentCollector
@@ -14,24 +15,32 @@ from gh_maintainer_dashboard.models.maintainer import MaintainerProfile, Maintai
 class ActivityAnalyzer:
     def __init__(self, github_client: GitHubClient):
         self.client = github_client
-        self.review_collector = ReviewCollector(github_client)
-        self.issue_collector = IssueCollector(github_client)
-        self.comment_collector = CommentCollector(github_client)
-        self.commit_collector = CommitCollector(github_client)
+        self.dispatcher = EventDispatcher()
+        self.review_collector = ReviewCollector(github_client, self.dispatcher)
+        self.issue_collector = IssueCollector(github_client, self.dispatcher)
+        self.comment_collector = CommentCollector(github_client, self.dispatcher)
+        self.commit_collector = CommitCollector(github_client, self.dispatcher)
         self.repo_collector = RepoCollector(github_client)
         self.sentiment_analyzer = SentimentAnalyzer()
         self.metrics_calculator = MetricsCalculator()
     
     def get_full_profile(self, username: str) -> Dict:
+        with self.client.prefetch_user(username):
+            return self._build_profile(username)
+    
+    def _build_profile(self, username: str) -> Dict:
         user_data = self.client.get_user(username)
         
-        review_stats = self.review_collector.get_review_stats(username)
-        issue_stats = self.issue_collector.get_issue_stats(username)
-        comment_stats = self.comment_collector.get_comment_stats(username)
-        commit_stats = self.commit_collector.get_commit_stats(username)
+        # Every activity list and stats dict below comes from this one walk over the user's events
+        events = self.dispatcher.decompose_user(self.client, username)
+        
+        review_stats = self.review_collector.get_review_stats(username, events)
+        issue_stats = self.issue_collector.get_issue_stats(username, events)
+        comment_stats = self.comment_collector.get_comment_stats(username, events)
+        commit_stats = self.commit_collector.get_commit_stats(username, events)
         
-        reviews = self.review_collector.collect_user_reviews(username)
-        comments = self.comment_collector.collect_user_comments(username)
+        reviews = self.review_collector.collect_user_reviews(username, events)
+        comments = self.comment_collector.collect_user_comments(username, events)
         comment_texts = [c.comment_body for c in comments]
         
         sentiment = self.sentiment_analyzer.analyze_maintainer_sentiment(
@@ -1,6 +1,7 @@
 from typing import Dict, List
 from datetime import datetime
 from gh_maintainer_dashboard.core.github_client import GitHubClient
+from gh_maintainer_dashboard.collectors.events import EventDispatcher
 from gh_maintainer_dashboard.collectors.review_collector import ReviewCollector
 from gh_maintainer_dashboard.collectors.issue_collector import IssueCollector
 from gh_maintainer_dashboard.collectors.comment_collector import CommentCollector
@@ -12,18 +13,21 @@ from gh_maintainer_dashboard.models.metrics import DailyMetrics
 class TimelineAnalyzer:
     def __init__(self, github_client: GitHubClient):
         self.client = github_client
-        self.review_collector = ReviewCollector(github_client)
-        self.issue_collector = IssueCollector(github_client)
-        self.comment_collector = CommentCollector(github_client)
+        self.dispatcher = EventDispatcher()
+        self.review_collector = ReviewCollector(github_client, self.dispatcher)
+        self.issue_collector = IssueCollector(github_client, self.dispatcher)
+        self.comment_collector = CommentCollector(github_client, self.dispatcher)
         self.date_helpers = DateHelpers()
         self.metrics_calculator = MetricsCalculator()
     
     def get_activity_timeline(self, username: str, period: str = "30d") -> Dict:
         start_date, end_date = self.date_helpers.get_date_range(period)
         
-        reviews = self.review_collector.collect_user_reviews(username)
-        issues = self.issue_collector.collect_user_issue_activities(username)
-        comments = self.comment_collector.collect_user_comments(username)
+        events = self.dispatcher.decompose_user(self.client, username, kinds=["reviews", "issues", "comments"])
+        
+        reviews = self.review_collector.collect_user_reviews(username, events)
+        issues = self.issue_collector.collect_user_issue_activities(username, events)
+        comments = self.comment_collector.collect_user_comments(username, events)
         
         all_activities = reviews + issues + comments
         
@@ -1,3 +1,4 @@
+from gh_maintainer_dashboard.collectors.events import EventDecomposition, EventDispatcher
 from gh_maintainer_dashboard.collectors.review_collector import ReviewCollector
 from gh_maintainer_dashboard.collectors.issue_collector import IssueCollector
 from gh_maintainer_dashboard.collectors.comment_collector import CommentCollector
@@ -5,6 +6,8 @@ from gh_maintainer_dashboard.collectors.commit_collector import CommitCollector
 from gh_maintainer_dashboard.collectors.repo_collector import RepoCollector
 
 __all__ = [
+    "EventDecomposition",
+    "EventDispatcher",
     "ReviewCollector",
     "IssueCollector",
     "CommentCollector",
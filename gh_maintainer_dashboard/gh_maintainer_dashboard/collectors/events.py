@@ -0,0 +1,265 @@
+from typing import Dict, Iterable, List, Optional, Tuple, Type
+from datetime import datetime
+from gh_maintainer_dashboard.core.github_client import GitHubClient
+from gh_maintainer_dashboard.models.activity import (
+    ActivityRecord, ActivityType, CommentActivity, CommitActivity, IssueActivity, ReviewActivity
+)
+
+CI_KEYWORDS = ["ci", "travis", "github actions", "workflow", "pipeline", "build"]
+DOC_KEYWORDS = ["readme", "docs", "documentation", "comment"]
+
+
+def _event_fields(event: Dict) -> Dict:
+    repo = event.get("repo", {})
+    return {
+        "repository": repo.get("name", "").split("/")[-1],
+        "repository_full_name": repo.get("name", ""),
+        "timestamp": datetime.fromisoformat(event.get("created_at", "").replace("Z", "+00:00")),
+    }
+
+
+def categorize_commits(commits: List[CommitActivity]) -> Dict[str, List[CommitActivity]]:
+    ci_commits = []
+    doc_commits = []
+    regular_commits = []
+    
+    for commit in commits:
+        message_lower = commit.message.lower()
+        
+        if any(keyword in message_lower for keyword in CI_KEYWORDS):
+            ci_commits.append(commit)
+        elif any(keyword in message_lower for keyword in DOC_KEYWORDS):
+            doc_commits.append(commit)
+        else:
+            regular_commits.append(commit)
+    
+    return {
+        "ci_fixes": ci_commits,
+        "documentation": doc_commits,
+        "regular": regular_commits,
+    }
+
+
+class ActivityBuilder:
+    event_types: Tuple[str, ...] = ()
+    
+    def __init__(self):
+        self.activities: List[ActivityRecord] = []
+    
+    def add(self, event: Dict) -> None:
+        self.activities.extend(self.build(event))
+    
+    def build(self, event: Dict) -> List[ActivityRecord]:
+        raise NotImplementedError
+    
+    def stats(self) -> Dict:
+        raise NotImplementedError
+
+
+class ReviewBuilder(ActivityBuilder):
+    event_types = ("PullRequestReviewEvent",)
+    
+    def build(self, event: Dict) -> List[ReviewActivity]:
+        payload = event.get("payload", {})
+        review = payload.get("review", {})
+        pr = payload.get("pull_request", {})
+        
+        return [ReviewActivity(
+            id=f"review_{event.get('id')}",
+            type=ActivityType.REVIEW,
+            **_event_fields(event),
+            title=pr.get("title", ""),
+            url=pr.get("html_url", ""),
+            pr_number=pr.get("number", 0),
+            review_state=review.get("state", ""),
+            comments_count=len(review.get("body", "")),
+            requested_changes=review.get("state") == "changes_requested",
+            metadata={
+                "pr_url": pr.get("html_url"),
+                "review_id": review.get("id"),
+            }
+        )]
+    
+    def stats(self) -> Dict:
+        total_reviews = len(self.activities)
+        approved = sum(1 for r in self.activities if r.review_state == "approved")
+        changes_requested = sum(1 for r in self.activities if r.requested_changes)
+        
+        return {
+            "total_reviews": total_reviews,
+            "approved": approved,
+            "changes_requested": changes_requested,
+            "approval_rate": approved / total_reviews if total_reviews > 0 else 0,
+            "request_changes_rate": changes_requested / total_reviews if total_reviews > 0 else 0,
+        }
+
+
+class IssueBuilder(ActivityBuilder):
+    event_types = ("IssuesEvent",)
+    
+    def build(self, event: Dict) -> List[IssueActivity]:
+        payload = event.get("payload", {})
+        issue = payload.get("issue", {})
+        
+        return [IssueActivity(
+            id=f"issue_{event.get('id')}",
+            type=ActivityType.ISSUE_TRIAGE,
+            **_event_fields(event),
+            title=issue.get("title", ""),
+            url=issue.get("html_url", ""),
+            issue_number=issue.get("number", 0),
+            action=payload.get("action", ""),
+            labels_added=[label.get("name", "") for label in issue.get("labels", [])],
+            metadata={
+                "issue_url": issue.get("html_url"),
+                "issue_state": issue.get("state"),
+            }
+        )]
+    
+    def stats(self) -> Dict:
+        total_issues = len(self.activities)
+        opened = sum(1 for a in self.activities if a.action == "opened")
+        closed = sum(1 for a in self.activities if a.action == "closed")
+        labeled = sum(1 for a in self.activities if a.labels_added)
+        
+        return {
+            "total_issue_activities": total_issues,
+            "opened": opened,
+            "closed": closed,
+            "labeled": labeled,
+            "closure_rate": closed / opened if opened > 0 else 0,
+        }
+
+
+class CommentBuilder(ActivityBuilder):
+    event_types = ("IssueCommentEvent", "PullRequestReviewCommentEvent")
+    
+    def build(self, event: Dict) -> List[CommentActivity]:
+        payload = event.get("payload", {})
+        comment = payload.get("comment", {})
+        issue_or_pr = payload.get("issue") or payload.get("pull_request", {})
+        body = comment.get("body", "")
+        
+        return [CommentActivity(
+            id=f"comment_{event.get('id')}",
+            type=ActivityType.PR_COMMENT if "PullRequest" in event.get("type") else ActivityType.ISSUE_COMMENT,
+            **_event_fields(event),
+            title=issue_or_pr.get("title", ""),
+            url=comment.get("html_url", ""),
+            target_number=issue_or_pr.get("number", 0),
+            comment_body=body,
+            word_count=len(body.split()),
+            is_first_time_contributor=issue_or_pr.get("author_association", "") in ["FIRST_TIME_CONTRIBUTOR", "FIRST_TIMER"],
+            metadata={
+                "comment_url": comment.get("html_url"),
+                "comment_id": comment.get("id"),
+            }
+        )]
+    
+    def stats(self) -> Dict:
+        total_comments = len(self.activities)
+        pr_comments = sum(1 for c in self.activities if c.type == ActivityType.PR_COMMENT)
+        issue_comments = sum(1 for c in self.activities if c.type == ActivityType.ISSUE_COMMENT)
+        mentorship_comments = sum(1 for c in self.activities if c.is_first_time_contributor)
+        avg_word_count = sum(c.word_count for c in self.activities) / total_comments if total_comments > 0 else 0
+        
+        return {
+            "total_comments": total_comments,
+            "pr_comments": pr_comments,
+            "issue_comments": issue_comments,
+            "mentorship_interactions": mentorship_comments,
+            "avg_word_count": round(avg_word_count, 2),
+        }
+
+
+class CommitBuilder(ActivityBuilder):
+    event_types = ("PushEvent",)
+    
+    def build(self, event: Dict) -> List[CommitActivity]:
+        fields = _event_fields(event)
+        return [
+            CommitActivity(
+                id=f"commit_{commit.get('sha')}",
+                type=ActivityType.COMMIT,
+                **fields,
+                title=commit.get("message", "").split("\n")[0],
+                url=commit.get("url", ""),
+                sha=commit.get("sha", ""),
+                message=commit.get("message", ""),
+                metadata={
+                    "commit_url": commit.get("url"),
+                }
+            )
+            for commit in event.get("payload", {}).get("commits", [])
+        ]
+    
+    def stats(self) -> Dict:
+        categorized = categorize_commits(self.activities)
+        
+        return {
+            "total_commits": len(self.activities),
+            "ci_fixes": len(categorized["ci_fixes"]),
+            "documentation_commits": len(categorized["documentation"]),
+            "regular_commits": len(categorized["regular"]),
+        }
+
+
+DEFAULT_BUILDERS: Dict[str, Type[ActivityBuilder]] = {
+    "reviews": ReviewBuilder,
+    "issues": IssueBuilder,
+    "comments": CommentBuilder,
+    "commits": CommitBuilder,
+}
+
+
+class EventDecomposition:
+    def __init__(self, activities: Dict[str, List[ActivityRecord]], stats: Dict[str, Dict]):
+        self.activities = activities
+        self.stats = stats
+
+
+class EventDispatcher:
+    def __init__(self, builders: Optional[Dict[str, Type[ActivityBuilder]]] = None):
+        self.builders = dict(DEFAULT_BUILDERS if builders is None else builders)
+        self.routes: Dict[str, List[str]] = {}
+        for name, builder in self.builders.items():
+            for event_type in builder.event_types:
+                self.routes.setdefault(event_type, []).append(name)
+    
+    def dispatch(self, events: Iterable[Dict], kinds: Optional[Iterable[str]] = None) -> EventDecomposition:
+        kinds = self.builders.keys() if kinds is None else kinds
+        builders = {name: self.builders[name]() for name in kinds}
+        routes = {event_type: [builders[name] for name in names if name in builders]
+                  for event_type, names in self.routes.items()}
+        
+        # One walk over the events; each is parsed only by the builders registered for its type
+        for event in events:
+            for builder in routes.get(event.get("type"), ()):
+                builder.add(event)
+        
+        return EventDecomposition(
+            {name: builder.activities for name, builder in builders.items()},
+            {name: builder.stats() for name, builder in builders.items()},
+        )
+    
+    def decompose_user(self, client: GitHubClient, username: str,
+                       kinds: Optional[Iterable[str]] = None) -> EventDecomposition:
+        return self.dispatch(client.get_user_events(username), kinds)
+
+
+class EventView:
+    kind = ""
+    
+    def __init__(self, github_client: GitHubClient, dispatcher: Optional[EventDispatcher] = None):
+        self.client = github_client
+        self.dispatcher = dispatcher or EventDispatcher()
+    
+    def _decomposition(self, username: str, decomposition: Optional[EventDecomposition]) -> EventDecomposition:
+        # Called on its own, a view only builds its own kind of activity
+        return decomposition or self.dispatcher.decompose_user(self.client, username, kinds=[self.kind])
+    
+    def _activities(self, username: str, decomposition: Optional[EventDecomposition]) -> List[ActivityRecord]:
+        return self._decomposition(username, decomposition).activities[self.kind]
+    
+    def _stats(self, username: str, decomposition: Optional[EventDecomposition]) -> Dict:
+        return self._decomposition(username, decomposition).stats[self.kind]
@@ -0,0 +1,123 @@
+import json
+import logging
+import time
+import uuid
+from contextvars import ContextVar
+from threading import Lock
+from typing import Callable, Dict, Optional
+from urllib.parse import urlsplit
+
+REQUEST_ID_HEADER = "X-Request-Id"
+ACCOUNT_HEADERS = (REQUEST_ID_HEADER, "X-Upstream-Calls", "X-Upstream-Cache", "Server-Timing")
+CACHE_OUTCOMES = ("cache_hits", "revalidated", "misses", "shared")
+
+logger = logging.getLogger("upstream_calls")
+
+
+class RequestAccount:
+    def __init__(self, request_id: Optional[str] = None, service: Optional[str] = None):
+        self.request_id = request_id or uuid.uuid4().hex
+        self.service = service
+        self.endpoints: Dict[str, Dict[str, int]] = {}
+        self.budget_used: Dict[str, int] = {}
+        self.upstream_seconds = 0.0
+        self.limiter_wait_seconds = 0.0
+        self.lock = Lock()
+    
+    def _endpoint(self, url: str) -> Dict[str, int]:
+        path = urlsplit(url).path
+        if path not in self.endpoints:
+            self.endpoints[path] = {"calls": 0, "errors": 0, "bytes": 0, **{outcome: 0 for outcome in CACHE_OUTCOMES}}
+        return self.endpoints[path]
+    
+    def record_call(self, url: str, status: Optional[int], size: int, resource: str, elapsed: float,
+                    waited: float) -> None:
+        with self.lock:
+            endpoint = self._endpoint(url)
+            endpoint["calls"] += 1
+            endpoint["bytes"] += size
+            self.upstream_seconds += elapsed
+            self.limiter_wait_seconds += waited
+            # No status means the call never got a response; GitHub does not charge 304s either
+            if status is None:
+                endpoint["errors"] += 1
+            elif status != 304:
+                self.budget_used[resource] = self.budget_used.get(resource, 0) + 1
+    
+    def record_cache(self, url: str, outcome: str) -> None:
+        with self.lock:
+            self._endpoint(url)[outcome] += 1
+    
+    def to_dict(self) -> Dict:
+        with self.lock:
+            endpoints = {path: dict(counts) for path, counts in self.endpoints.items()}
+            budget_used = dict(self.budget_used)
+        
+        return {
+            "request_id": self.request_id,
+            "service": self.service,
+            "upstream_calls": sum(counts["calls"] for counts in endpoints.values()),
+            "upstream_errors": sum(counts["errors"] for counts in endpoints.values()),
+            "bytes": sum(counts["bytes"] for counts in endpoints.values()),
+            "cache": {outcome: sum(counts[outcome] for counts in endpoints.values()) for outcome in CACHE_OUTCOMES},
+            "rate_limit_used": budget_used,
+            "upstream_ms": round(self.upstream_seconds * 1000, 1),
+            "rate_limit_wait_ms": round(self.limiter_wait_seconds * 1000, 1),
+            "endpoints": endpoints,
+        }
+    
+    def headers(self) -> Dict[str, str]:
+        report = self.to_dict()
+        cache = report["cache"]
+        return {
+            REQUEST_ID_HEADER: self.request_id,
+            "X-Upstream-Calls": str(report["upstream_calls"]),
+            "X-Upstream-Cache": f"hits={cache['cache_hits']}, revalidated={cache['revalidated']}, "
+                                f"misses={cache['misses']}, shared={cache['shared']}",
+            "Server-Timing": f"upstream;dur={report['upstream_ms']}, ratelimit-wait;dur={report['rate_limit_wait_ms']}",
+        }
+    
+    def log(self) -> None:
+        logger.info(json.dumps(self.to_dict()))
+
+
+# Set per inbound request; asyncio tasks and asyncio.to_thread inherit it, plain thread pools need copy_context()
+_current_account: ContextVar[Optional[RequestAccount]] = ContextVar("request_account", default=None)
+# Called as observer(service, resource, status, seconds) for every upstream call, inside a request or not
+_call_observer: Optional[Callable[[Optional[str], str, Optional[int], float], None]] = None
+
+
+def start_account(request_id: Optional[str] = None, service: Optional[str] = None) -> RequestAccount:
+    account = RequestAccount(request_id, service)
+    _current_account.set(account)
+    return account
+
+
+def current_account() -> Optional[RequestAccount]:
+    return _current_account.get()
+
+
+def set_call_observer(observer: Optional[Callable[[Optional[str], str, Optional[int], float], None]]) -> None:
+    global _call_observer
+    _call_observer = observer
+
+
+def tag_request(headers: Dict) -> None:
+    account = _current_account.get()
+    if account is not None:
+        headers[REQUEST_ID_HEADER] = account.request_id
+
+
+def record_call(url: str, status: Optional[int], size: int, resource: str, started: float, waited: float) -> None:
+    elapsed = time.monotonic() - started
+    account = _current_account.get()
+    if account is not None:
+        account.record_call(url, status, size, resource, elapsed, waited)
+    if _call_observer is not None:
+        _call_observer(account.service if account else None, resource, status, elapsed)
+
+
+def record_cache(url: str, outcome: str) -> None:
+    account = _current_account.get()
+    if account is not None:
+        account.record_cache(url, outcome)
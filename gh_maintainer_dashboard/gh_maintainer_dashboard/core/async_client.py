@@ -0,0 +1,352 @@
+import asyncio
+import contextvars
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import aiohttp
+import requests
+from gql import Client, gql
+from gql.transport.async_transport import AsyncTransport
+from graphql import DocumentNode, ExecutionResult, print_ast
+from requests.structures import CaseInsensitiveDict
+from yarl import URL
+
+from gh_maintainer_dashboard.core.accounting import record_cache, record_call, tag_request
+from gh_maintainer_dashboard.core.cache import ConditionalCache
+from gh_maintainer_dashboard.core.pagination import paginate_async, parse_links
+from gh_maintainer_dashboard.core.rate_limiter import RateLimiter
+from gh_maintainer_dashboard.core.single_flight import SingleFlight, request_key
+from gh_maintainer_dashboard.core.token_pool import TokenPool
+from gh_maintainer_dashboard.core.transport import get_transport
+
+
+async def gather_bounded(aws: Iterable[Awaitable], limit: int = 10, return_exceptions: bool = False) -> List[Any]:
+    semaphore = asyncio.Semaphore(limit)
+    
+    async def run(aw: Awaitable) -> Any:
+        async with semaphore:
+            return await aw
+    
+    return await asyncio.gather(*(run(aw) for aw in aws), return_exceptions=return_exceptions)
+
+
+async def iter_bounded(aws: Iterable[Awaitable], limit: int = 10) -> AsyncIterator:
+    # Yields results in completion order and starts new work only as slots free up, so neither
+    # pending coroutines nor finished results pile up while a slow consumer drains the stream
+    aws = iter(aws)
+    pending = set()
+    try:
+        while True:
+            for aw in aws:
+                pending.add(asyncio.ensure_future(aw))
+                if len(pending) >= limit:
+                    break
+            if not pending:
+                return
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def iter_user_batch(usernames: Iterable[str], fetch: Callable[[str], Awaitable], limit: int = 10) -> AsyncIterator[Dict]:
+    async def run(username: str) -> Dict:
+        # One user's failure is reported in its own record instead of aborting the whole batch
+        try:
+            return {"username": username, "success": True, "data": await fetch(username)}
+        except Exception as e:
+            return {"username": username, "success": False, "error": str(e)}
+    
+    async for result in iter_bounded((run(username) for username in usernames), limit=limit):
+        yield result
+
+
+def run_sync(coro: Awaitable) -> Any:
+    # asyncio.run refuses to nest, so a caller already inside a loop (a notebook, an async view) gets the
+    # coroutine run on a worker thread instead; the caller's loop is blocked until it finishes either way
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(contextvars.copy_context().run, asyncio.run, coro).result()
+
+
+def iter_sync(stream: AsyncIterator) -> Iterator:
+    # Drives an async generator from blocking code, e.g. a streaming WSGI response
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(stream.__anext__())
+            except StopAsyncIteration:
+                return
+    finally:
+        loop.run_until_complete(stream.aclose())
+        loop.close()
+
+
+class PooledAsyncGraphQLTransport(AsyncTransport):
+    def __init__(self, client: "AsyncGitHubClient"):
+        self.client = client
+    
+    async def connect(self) -> None:
+        # The aiohttp session belongs to the AsyncGitHubClient and outlives each gql session
+        pass
+    
+    async def close(self) -> None:
+        pass
+    
+    async def execute(self, document: DocumentNode, variable_values: Optional[Dict[str, Any]] = None,
+                      operation_name: Optional[str] = None) -> ExecutionResult:
+        payload = {"query": print_ast(document)}
+        if variable_values:
+            payload["variables"] = variable_values
+        if operation_name:
+            payload["operationName"] = operation_name
+        
+        status, headers, body = await self.client._send(self.client.graphql_url, method="POST", payload=payload)
+        result = json.loads(body)
+        return ExecutionResult(data=result.get("data"), errors=result.get("errors"), extensions=result.get("extensions"))
+    
+    def subscribe(self, document: DocumentNode, variable_values: Optional[Dict[str, Any]] = None,
+                  operation_name: Optional[str] = None):
+        raise NotImplementedError("GitHub's GraphQL API does not support subscriptions")
+
+
+class AsyncGitHubClient:
+    def __init__(self, token: Optional[str] = None, base_url: Optional[str] = None,
+                 pool_maxsize: Optional[int] = None, timeout: Optional[float] = None,
+                 conditional_cache: Optional[ConditionalCache] = None, token_pool: Optional[TokenPool] = None,
+                 single_flight: Optional[SingleFlight] = None):
+        self.token = token or os.getenv("GITHUB_TOKEN")
+        self.base_url = base_url or os.getenv("GITHUB_API_URL", "https://api.github.com")
+        self.graphql_url = f"{self.base_url}/graphql"
+        self.pool_maxsize = pool_maxsize or int(os.getenv("HTTP_POOL_MAXSIZE", "10"))
+        self.timeout = timeout or float(os.getenv("HTTP_TIMEOUT", "30"))
+        self.headers = {
+            "Authorization": f"token {self.token}",
+            "Accept": "application/vnd.github.v3+json"
+        }
+        # Share the sync transport's validators and budget so both paths see the same state
+        self.conditional_cache = conditional_cache or get_transport().conditional_cache
+        self.token_pool = token_pool or get_transport().token_pool
+        self.single_flight = single_flight or get_transport().single_flight
+        self._session: Optional[aiohttp.ClientSession] = None
+        # The loop the session's connector lives on; only callers on that loop may share this client
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    async def __aenter__(self) -> "AsyncGitHubClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit_per_host=self.pool_maxsize)
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self.loop = asyncio.get_running_loop()
+        return self._session
+    
+    async def open(self) -> "AsyncGitHubClient":
+        self._get_session()
+        return self
+    
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    async def _send(self, url: str, headers: Optional[Dict] = None, method: str = "GET", payload: Optional[Dict] = None):
+        resource = RateLimiter.resource_for(url)
+        headers = {**self.headers, **(headers or {})}
+        started = time.monotonic()
+        token = await self.token_pool.authorize_async(headers, resource)
+        waited = time.monotonic() - started
+        tag_request(headers)
+        
+        session = self._get_session()
+        started = time.monotonic()
+        try:
+            async with session.request(method, URL(url, encoded=True), headers=headers, json=payload) as response:
+                self.token_pool.update_from_headers(token, response.headers, response.status, resource)
+                body = await response.read()
+                record_call(url, response.status, len(body), resource, started, waited)
+                if response.status != 304:
+                    response.raise_for_status()
+                return response.status, response.headers, await response.text()
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            record_call(url, None, 0, resource, started, waited)
+            raise
+    
+    def _url(self, endpoint: str, params: Optional[Dict] = None) -> str:
+        return requests.Request("GET", f"{self.base_url}/{endpoint}", params=params).prepare().url
+    
+    async def _get_page(self, url: str) -> Tuple[Any, Dict[str, str]]:
+        # Sync callers share Response objects under the plain key; async callers share the raw body
+        key = ("async",) + request_key("GET", url, self.headers)
+        body, link = await self.single_flight.do_async(key, lambda: self._fetch(url), on_shared=lambda: record_cache(url, "shared"))
+        return json.loads(body), parse_links(link)
+    
+    async def _get(self, endpoint: str, params: Optional[Dict] = None) -> Any:
+        data, links = await self._get_page(self._url(endpoint, params))
+        return data
+    
+    def paginate(self, endpoint: str, params: Optional[Dict] = None, max_pages: Optional[int] = None,
+                 items_key: Optional[str] = None) -> AsyncIterator:
+        return paginate_async(self._get_page, self._url(endpoint, params), max_pages=max_pages, items_key=items_key)
+    
+    async def _get_all(self, endpoint: str, params: Optional[Dict] = None, max_pages: Optional[int] = None) -> List:
+        return [item async for item in self.paginate(endpoint, params, max_pages=max_pages)]
+    
+    async def _fetch(self, url: str) -> Tuple[str, Optional[str]]:
+        cache = self.conditional_cache
+        if cache is None:
+            status, headers, body = await self._send(url)
+            return body, headers.get("Link")
+        
+        # The validator store may sit on SQLite or Redis; its blocking calls run on worker threads
+        key = cache.make_key(url, self.headers)
+        entry = await asyncio.to_thread(cache.get, key)
+        if entry and cache.is_fresh(entry):
+            cache.record_hit()
+            record_cache(url, "cache_hits")
+            return entry["body"], CaseInsensitiveDict(entry["headers"]).get("Link")
+        
+        status, headers, body = await self._send(url, headers=cache.validators(entry) if entry else None)
+        
+        if status == 304 and entry:
+            cache.record_revalidation()
+            record_cache(url, "revalidated")
+            await asyncio.to_thread(cache.refresh, key, entry, headers)
+            return entry["body"], CaseInsensitiveDict(entry["headers"]).get("Link")
+        
+        cache.record_miss()
+        record_cache(url, "misses")
+        if status == 200:
+            await asyncio.to_thread(cache.store, key, url, headers, body)
+        return body, headers.get("Link")
+    
+    async def graphql(self, query: str, variables: Optional[Dict] = None) -> Dict:
+        client = Client(transport=PooledAsyncGraphQLTransport(self), execute_timeout=self.timeout)
+        async with client as session:
+            return await session.execute(gql(query), variable_values=variables)
+    
+    # Users
+    
+    async def get_user(self, username: str) -> Dict:
+        return await self._get(f"users/{username}")
+    
+    async def get_user_info(self, username: str) -> Dict:
+        return await self.get_user(username)
+    
+    async def get_user_profile(self, username: str) -> Dict:
+        return await self.get_user(username)
+    
+    async def get_user_repos(self, username: str, sort: Optional[str] = None,
+                             max_pages: Optional[int] = None) -> List[Dict]:
+        params = {"per_page": 100}
+        if sort:
+            params["sort"] = sort
+        return await self._get_all(f"users/{username}/repos", params=params, max_pages=max_pages)
+    
+    async def get_user_events(self, username: str, max_pages: Optional[int] = None) -> List[Dict]:
+        return await self._get_all(f"users/{username}/events", params={"per_page": 100}, max_pages=max_pages)
+    
+    async def get_user_prs(self, username: str, repo: Optional[str] = None) -> List[Dict]:
+        query = f"author:{username} type:pr is:merged"
+        if repo:
+            query += f" repo:{repo}"
+        return await self.search_issues(query)
+    
+    async def get_user_issues(self, username: str, repo: Optional[str] = None) -> List[Dict]:
+        query = f"author:{username} type:issue"
+        if repo:
+            query += f" repo:{repo}"
+        return await self.search_issues(query)
+    
+    # Search
+    
+    async def search_issues(self, query: str) -> List[Dict]:
+        data = await self._get("search/issues", params={"q": query, "per_page": 100})
+        return data.get("items", [])
+    
+    async def search_repositories(self, query: str, language: Optional[str] = None,
+                                  sort: str = "stars", per_page: int = 30) -> List[Dict]:
+        search_query = query
+        if language:
+            search_query += f" language:{language}"
+        
+        data = await self._get("search/repositories", params={"q": search_query, "sort": sort, "per_page": per_page})
+        return data.get("items", [])
+    
+    # Repositories
+    
+    async def get_repo_info(self, repo: str) -> Dict:
+        return await self._get(f"repos/{repo}")
+    
+    async def get_repo_details(self, repo: str) -> Dict:
+        return await self.get_repo_info(repo)
+    
+    async def get_repo_stats(self, repo: str) -> Dict:
+        return await self.get_repo_info(repo)
+    
+    async def get_repo_languages(self, repo: str) -> Dict:
+        return await self._get(f"repos/{repo}/languages")
+    
+    async def get_repo_contributors(self, repo: str) -> List[Dict]:
+        return await self._get(f"repos/{repo}/contributors", params={"per_page": 30})
+    
+    async def get_repo_issues(self, repo: str, state: str = "open", labels: Optional[str] = None,
+                              max_pages: Optional[int] = None) -> List[Dict]:
+        params = {"state": state, "per_page": 100}
+        if labels:
+            params["labels"] = labels
+        return await self._get_all(f"repos/{repo}/issues", params=params, max_pages=max_pages)
+    
+    async def get_issue_comments(self, repo: str, issue_number: int) -> List[Dict]:
+        return await self._get_all(f"repos/{repo}/issues/{issue_number}/comments", params={"per_page": 100})
+    
+    async def get_issue_events(self, repo: str, issue_number: int) -> List[Dict]:
+        return await self._get_all(f"repos/{repo}/issues/{issue_number}/events", params={"per_page": 100})
+    
+    async def get_pull_requests(self, repo: str, state: str = "open", max_pages: Optional[int] = None) -> List[Dict]:
+        return await self._get_all(f"repos/{repo}/pulls", params={"state": state, "per_page": 100}, max_pages=max_pages)
+    
+    async def get_pull_request_reviews(self, repo: str, pr_number: int) -> List[Dict]:
+        return await self._get_all(f"repos/{repo}/pulls/{pr_number}/reviews", params={"per_page": 100})
+    
+    async def get_commits(self, repo: str, author: Optional[str] = None, since: Optional[str] = None,
+                          max_pages: Optional[int] = None) -> List[Dict]:
+        params = {"per_page": 100}
+        if author:
+            params["author"] = author
+        if since:
+            params["since"] = since
+        return await self._get_all(f"repos/{repo}/commits", params=params, max_pages=max_pages)
+    
+    async def get_repo_commits(self, repo: str, since: Optional[str] = None,
+                               max_pages: Optional[int] = None) -> List[Dict]:
+        return await self.get_commits(repo, since=since, max_pages=max_pages)
+
+
+@asynccontextmanager
+async def use_client(client: Optional[AsyncGitHubClient], token: Optional[str] = None) -> AsyncIterator[AsyncGitHubClient]:
+    # A long-lived client is reused on the loop it was opened on; asyncio.run callers (Flask views,
+    # job threads) each run their own loop and get a private client for the call
+    if client is not None and client.loop is asyncio.get_running_loop():
+        yield client
+        return
+    async with AsyncGitHubClient(token) as own:
+        yield own
@@ -0,0 +1,190 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from gql.transport.exceptions import TransportQueryError
+
+BULK_LIMIT = 50
+COMMENTS_PER_PAGE = 100
+
+COMMENT_FIELDS = """
+    pageInfo { hasNextPage endCursor }
+    nodes { author { login } body createdAt }
+"""
+
+ISSUE_FIELDS = f"""
+    number
+    title
+    url
+    state
+    createdAt
+    updatedAt
+    assignees(first: 10) {{ nodes {{ login }} }}
+    labels(first: 20) {{ nodes {{ name }} }}
+    comments(first: {COMMENTS_PER_PAGE}) {{ {COMMENT_FIELDS} }}
+    timelineItems(first: 100, itemTypes: [CROSS_REFERENCED_EVENT, REFERENCED_EVENT]) {{
+        nodes {{
+            __typename
+            ... on CrossReferencedEvent {{
+                source {{
+                    ... on PullRequest {{ number title url state body createdAt author {{ login }} }}
+                }}
+            }}
+            ... on ReferencedEvent {{
+                actor {{ login }}
+                commit {{ oid url message committedDate }}
+            }}
+        }}
+    }}
+"""
+
+
+def _login(node: Optional[Dict]) -> str:
+    # Deleted accounts come back as null authors
+    return (node or {}).get("login") or "ghost"
+
+
+def _comment(node: Dict) -> Dict:
+    return {"user": {"login": _login(node.get("author"))}, "body": node.get("body") or "", "created_at": node["createdAt"]}
+
+
+def _pull_request(node: Dict) -> Dict:
+    return {
+        "number": node["number"],
+        "title": node["title"],
+        "html_url": node["url"],
+        "state": node["state"].lower(),
+        "body": node.get("body") or "",
+        "created_at": node["createdAt"],
+        "user": {"login": _login(node.get("author"))},
+    }
+
+
+def _commit(node: Dict, actor: Optional[Dict]) -> Dict:
+    return {
+        "sha": node["oid"],
+        "html_url": node["url"],
+        "author": {"login": _login(actor)},
+        "commit": {"message": node["message"], "committer": {"date": node["committedDate"]}},
+    }
+
+
+def _issue(node: Dict) -> Dict:
+    linked_prs = []
+    referenced_commits = []
+    for item in node["timelineItems"]["nodes"]:
+        if item["__typename"] == "CrossReferencedEvent" and (item.get("source") or {}).get("number"):
+            linked_prs.append(_pull_request(item["source"]))
+        elif item["__typename"] == "ReferencedEvent" and item.get("commit"):
+            referenced_commits.append(_commit(item["commit"], item.get("actor")))
+    
+    # Shaped like the REST issue payload so the REST and GraphQL paths share downstream code
+    return {
+        "number": node["number"],
+        "title": node["title"],
+        "html_url": node["url"],
+        "state": node["state"].lower(),
+        "created_at": node["createdAt"],
+        "updated_at": node["updatedAt"],
+        "assignees": [{"login": assignee["login"]} for assignee in node["assignees"]["nodes"]],
+        "labels": [{"name": label["name"]} for label in node["labels"]["nodes"]],
+        "comments": [_comment(comment) for comment in node["comments"]["nodes"]],
+        "linked_prs": linked_prs,
+        "referenced_commits": referenced_commits,
+    }
+
+
+class IssueBulkQuery:
+    def __init__(self, repo: str, numbers: List[int]):
+        if len(numbers) > BULK_LIMIT:
+            raise ValueError(f"At most {BULK_LIMIT} issues can be fetched in one query")
+        self.owner, self.name = repo.split("/", 1)
+        self.numbers = [int(number) for number in numbers]
+        self.results: Dict[int, Dict] = {}
+        self.cursors: Dict[int, str] = {}
+    
+    def initial_query(self) -> Tuple[str, Dict]:
+        fields = "\n".join(f"i{number}: issue(number: {number}) {{ {ISSUE_FIELDS} }}" for number in self.numbers)
+        query = f"query($owner: String!, $name: String!) {{ repository(owner: $owner, name: $name) {{ {fields} }} }}"
+        return query, {"owner": self.owner, "name": self.name}
+    
+    def comments_query(self) -> Tuple[str, Dict]:
+        variables = {"owner": self.owner, "name": self.name}
+        cursor_args = []
+        fields = []
+        for number, cursor in self.cursors.items():
+            variables[f"c{number}"] = cursor
+            cursor_args.append(f"$c{number}: String")
+            fields.append(
+                f"i{number}: issue(number: {number}) {{ "
+                f"comments(first: {COMMENTS_PER_PAGE}, after: $c{number}) {{ {COMMENT_FIELDS} }} }}"
+            )
+        
+        query = (f"query($owner: String!, $name: String!, {', '.join(cursor_args)}) "
+                 f"{{ repository(owner: $owner, name: $name) {{ {' '.join(fields)} }} }}")
+        return query, variables
+    
+    def absorb(self, data: Dict) -> Optional[Tuple[str, Dict]]:
+        repository = (data or {}).get("repository") or {}
+        cursors = {}
+        
+        for number in list(self.cursors) or self.numbers:
+            node = repository.get(f"i{number}")
+            if not node:
+                continue
+            
+            if number in self.results:
+                self.results[number]["comments"].extend(_comment(comment) for comment in node["comments"]["nodes"])
+            else:
+                self.results[number] = _issue(node)
+            
+            page_info = node["comments"]["pageInfo"]
+            if page_info["hasNextPage"]:
+                cursors[number] = page_info["endCursor"]
+        
+        self.cursors = cursors
+        return self.comments_query() if cursors else None
+
+
+def _chunks(numbers: List[int]) -> List[List[int]]:
+    return [numbers[start:start + BULK_LIMIT] for start in range(0, len(numbers), BULK_LIMIT)]
+
+
+def _partial_data(error: TransportQueryError) -> Dict:
+    # Missing or transferred issues come back as NOT_FOUND errors next to the data we asked for
+    if error.data is None:
+        raise error
+    return error.data
+
+
+def fetch_issues_bulk(execute: Callable[[str, Dict], Dict], repo: str, numbers: List[int]) -> Dict[int, Dict]:
+    results = {}
+    for chunk in _chunks(numbers):
+        bulk = IssueBulkQuery(repo, chunk)
+        next_query = bulk.initial_query()
+        while next_query:
+            try:
+                data = execute(*next_query)
+            except TransportQueryError as error:
+                data = _partial_data(error)
+            next_query = bulk.absorb(data)
+        results.update(bulk.results)
+    return results
+
+
+async def fetch_issues_bulk_async(execute: Callable[[str, Dict], Awaitable[Dict]], repo: str,
+                                  numbers: List[int]) -> Dict[int, Dict]:
+    async def run(chunk: List[int]) -> Dict[int, Dict]:
+        bulk = IssueBulkQuery(repo, chunk)
+        next_query = bulk.initial_query()
+        while next_query:
+            try:
+                data = await execute(*next_query)
+            except TransportQueryError as error:
+                data = _partial_data(error)
+            next_query = bulk.absorb(data)
+        return bulk.results
+    
+    results = {}
+    for chunk_results in await asyncio.gather(*(run(chunk) for chunk in _chunks(numbers))):
+        results.update(chunk_results)
+    return results
@@ -1,75 +1,792 @@
+import contextvars
+import hashlib
+import heapq
 import json
+import logging
+import os
+import re
+import sqlite3
+import sys
+import threading
 import time
-from typing import Optional, Any
+import weakref
+import zlib
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from threading import Lock
+from typing import Optional, Any, Callable, Dict, Iterable, Iterator, List, Tuple
 from functools import wraps
 
+import orjson
+
+from gh_maintainer_dashboard.core.accounting import current_account, start_account
+from gh_maintainer_dashboard.core.config import Config, redis_settings
+from gh_maintainer_dashboard.core.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Stale-while-revalidate refreshes run here, off the request path; each is one upstream fetch
+_refresh_executor = ThreadPoolExecutor(max_workers=int(os.getenv("CACHE_REFRESH_WORKERS", "4")),
+                                       thread_name_prefix="cache-refresh")
+
+# Bump when cached shapes change across the board; a single function bumps its own `version` in @cached
+CACHE_SCHEMA_VERSION = 1
+GLOBAL_SCOPE = "global"
+
+
+def user_scope(username: str, *args, **kwargs) -> str:
+    # Logins are case-insensitive, so every spelling of a user lands in one scope
+    return f"user:{username.lower()}"
+
+
+def repo_scope(owner: str, repo: str, *args, **kwargs) -> str:
+    return f"repo:{owner.lower()}/{repo.lower()}"
+
+
+def scoped_key(scope: str, *parts: str) -> str:
+    # The scope leads every key so a whole user or repository can be dropped by prefix
+    return "|".join((scope, *parts))
+
+
+def approximate_size(value: Any) -> int:
+    # Walks the value instead of serializing it; close enough to hold a memory budget
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, dict):
+        return sum(approximate_size(key) + approximate_size(item) for key, item in value.items())
+    if isinstance(value, (list, tuple, set)):
+        return sum(approximate_size(item) for item in value)
+    if hasattr(value, "__dict__"):
+        return approximate_size(vars(value))
+    return sys.getsizeof(value)
+
 
 class InMemoryCache:
-    def __init__(self, ttl: int = 3600):
-        self._cache = {}
+    # Rough per-entry cost of the dict slot, tuple and expiry record on top of the value itself
+    ENTRY_OVERHEAD = 128
+    SWEEP_INTERVAL = 30
+    
+    def __init__(self, ttl: int = 3600, max_entries: Optional[int] = None, max_bytes: Optional[int] = None):
         self._ttl = ttl
+        if max_entries is None:
+            max_entries = int(os.getenv("CACHE_MEMORY_MAX_ENTRIES", "10000"))
+        if max_bytes is None:
+            max_bytes = int(os.getenv("CACHE_MEMORY_MAX_BYTES", str(64 * 1024 * 1024)))
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[Any, float, int]]" = OrderedDict()
+        self._expiry: List[Tuple[float, str]] = []
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.lock = Lock()
+        _register_for_sweeping(self)
     
     def get(self, key: str) -> Optional[Any]:
-        if key in self._cache:
-            data, timestamp = self._cache[key]
-            if time.time() - timestamp < self._ttl:
-                return data
-            else:
-                del self._cache[key]
-        return None
+        with self.lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            value, expires_at, _ = entry
+            if expires_at <= time.time():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
     
-    def set(self, key: str, value: Any) -> None:
-        self._cache[key] = (value, time.time())
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        size = approximate_size(key) + approximate_size(value) + self.ENTRY_OVERHEAD
+        expires_at = time.time() + (ttl or self._ttl)
+        
+        with self.lock:
+            self._insert(key, value, expires_at, size)
+    
+    def add(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        size = approximate_size(key) + approximate_size(value) + self.ENTRY_OVERHEAD
+        now = time.time()
+        
+        with self.lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > now:
+                return False
+            self._insert(key, value, now + (ttl or self._ttl), size)
+            return key in self._entries
+    
+    def _insert(self, key: str, value: Any, expires_at: float, size: int) -> None:
+        if key in self._entries:
+            self._remove(key)
+        # A single value larger than the whole budget would only flush everything else out
+        if size > self.max_bytes:
+            return
+        
+        self._entries[key] = (value, expires_at, size)
+        self._bytes += size
+        heapq.heappush(self._expiry, (expires_at, key))
+        
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._bytes -= self._entries.popitem(last=False)[1][2]
+            self.evictions += 1
+        
+        # Overwritten and evicted keys leave dead expiry records behind; rebuild before they pile up
+        if len(self._expiry) > 2 * len(self._entries) + 1000:
+            self._expiry = [(expires_at, key) for key, (_, expires_at, _) in self._entries.items()]
+            heapq.heapify(self._expiry)
     
     def delete(self, key: str) -> None:
-        if key in self._cache:
-            del self._cache[key]
+        with self.lock:
+            if key in self._entries:
+                self._remove(key)
     
     def clear(self) -> None:
-        self._cache.clear()
+        with self.lock:
+            self._entries.clear()
+            self._expiry.clear()
+            self._bytes = 0
+    
+    def delete_prefix(self, prefix: str) -> int:
+        with self.lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                self._remove(key)
+        return len(keys)
+    
+    def sweep(self) -> int:
+        removed = 0
+        now = time.time()
+        with self.lock:
+            while self._expiry and self._expiry[0][0] <= now:
+                expires_at, key = heapq.heappop(self._expiry)
+                entry = self._entries.get(key)
+                # Skip records left behind by a later set() of the same key
+                if entry is not None and entry[1] == expires_at:
+                    self._remove(key)
+                    removed += 1
+            self.expirations += removed
+        return removed
+    
+    def _remove(self, key: str) -> None:
+        self._bytes -= self._entries.pop(key)[2]
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get_stats(self) -> Dict:
+        with self.lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_ratio": round(self.hits / total, 2) if total > 0 else 0.0,
+            }
+
+
+# One daemon thread per process expires entries for every live in-memory cache, so unread keys don't linger
+_swept_caches: "weakref.WeakSet[InMemoryCache]" = weakref.WeakSet()
+_sweeper_lock = Lock()
+_sweeper_pid: Optional[int] = None
+
+
+def _register_for_sweeping(cache: InMemoryCache) -> None:
+    with _sweeper_lock:
+        _swept_caches.add(cache)
+        _start_sweeper()
+
+
+def _start_sweeper() -> None:
+    global _sweeper_pid
+    if _sweeper_pid != os.getpid():
+        _sweeper_pid = os.getpid()
+        threading.Thread(target=_sweep_forever, name="cache-sweeper", daemon=True).start()
+
+
+def _sweep_forever() -> None:
+    while True:
+        time.sleep(InMemoryCache.SWEEP_INTERVAL)
+        with _sweeper_lock:
+            caches = list(_swept_caches)
+        for cache in caches:
+            cache.sweep()
+
+
+def _restart_sweeper_after_fork() -> None:
+    # Threads do not survive fork; caches built before a preloading server forks still need sweeping
+    global _sweeper_lock, _sweeper_pid
+    _sweeper_lock = Lock()
+    _sweeper_pid = None
+    if len(_swept_caches):
+        _start_sweeper()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_sweeper_after_fork)
+
+
+class SQLiteCache:
+    DEFAULT_PATH = os.path.join(os.path.expanduser("~"), ".cache", "gh_maintainer_dashboard", "cache.sqlite3")
+    # Size is only re-checked every N writes; eviction trims down to this fraction of the budget
+    EVICTION_CHECK_INTERVAL = 100
+    EVICTION_TARGET = 0.9
+    
+    def __init__(self, path: Optional[str] = None, max_bytes: Optional[int] = None):
+        self.path = path or os.getenv("CACHE_PATH", self.DEFAULT_PATH)
+        self.max_bytes = max_bytes or int(os.getenv("CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+        self._local = threading.local()
+        self._writes = 0
+        
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        conn = self._conn()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)")
+    
+    def _conn(self) -> sqlite3.Connection:
+        # One connection per thread and per process: sqlite3 connections must not cross a fork
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+    
+    def get(self, key: str) -> Optional[Any]:
+        conn = self._conn()
+        row = conn.execute("SELECT value, expires_at, accessed_at FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        
+        value, expires_at, accessed_at = row
+        now = time.time()
+        if expires_at <= now:
+            conn.execute("DELETE FROM entries WHERE key = ? AND expires_at <= ?", (key, now))
+            return None
+        
+        # Recency only needs to be coarse for LRU eviction; skip the write on hot keys
+        if now - accessed_at > 60:
+            conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+        return json.loads(value)
+    
+    def set(self, key: str, value: Any, ttl: int = 3600) -> None:
+        data = json.dumps(value)
+        now = time.time()
+        self._conn().execute(
+            "INSERT OR REPLACE INTO entries (key, value, expires_at, accessed_at, size) VALUES (?, ?, ?, ?, ?)",
+            (key, data, now + ttl, now, len(key) + len(data)),
+        )
+        
+        self._writes += 1
+        if self._writes % self.EVICTION_CHECK_INTERVAL == 0:
+            self.evict()
+    
+    def add(self, key: str, value: Any, ttl: int = 3600) -> bool:
+        data = json.dumps(value)
+        now = time.time()
+        conn = self._conn()
+        # INSERT OR IGNORE makes the claim atomic between processes; an expired holder is cleared first
+        conn.execute("DELETE FROM entries WHERE key = ? AND expires_at <= ?", (key, now))
+        cursor = conn.execute(
+            "INSERT OR IGNORE INTO entries (key, value, expires_at, accessed_at, size) VALUES (?, ?, ?, ?, ?)",
+            (key, data, now + ttl, now, len(key) + len(data)),
+        )
+        return cursor.rowcount == 1
+    
+    def delete(self, key: str) -> None:
+        self._conn().execute("DELETE FROM entries WHERE key = ?", (key,))
+    
+    def clear(self) -> None:
+        self._conn().execute("DELETE FROM entries")
+    
+    def delete_prefix(self, prefix: str) -> int:
+        # A range on the primary key instead of LIKE, so the index does the work
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        return self._conn().execute("DELETE FROM entries WHERE key >= ? AND key < ?", (prefix, upper)).rowcount
+    
+    def size(self) -> int:
+        return self._conn().execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+    
+    def evict(self) -> int:
+        conn = self._conn()
+        # BEGIN IMMEDIATE serializes eviction between gunicorn workers sharing the file
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            removed = conn.execute("DELETE FROM entries WHERE expires_at <= ?", (time.time(),)).rowcount
+            total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total > self.max_bytes:
+                excess = total - int(self.max_bytes * self.EVICTION_TARGET)
+                victims = self._least_recently_used(conn, excess)
+                conn.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key in victims])
+                removed += len(victims)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return removed
+    
+    def _least_recently_used(self, conn: sqlite3.Connection, excess: int) -> List[str]:
+        victims = []
+        freed = 0
+        for key, size in conn.execute("SELECT key, size FROM entries ORDER BY accessed_at"):
+            if freed >= excess:
+                break
+            victims.append(key)
+            freed += size
+        return victims
+
+
+_sqlite_caches: Dict[str, SQLiteCache] = {}
+_sqlite_lock = Lock()
+
+
+def get_sqlite_cache(path: Optional[str] = None) -> SQLiteCache:
+    path = path or os.getenv("CACHE_PATH", SQLiteCache.DEFAULT_PATH)
+    with _sqlite_lock:
+        if path not in _sqlite_caches:
+            _sqlite_caches[path] = SQLiteCache(path)
+        return _sqlite_caches[path]
+
+
+class RedisCache:
+    # Values are orjson bytes behind a one-byte tag; payloads past the threshold (event lists) are zlib-compressed
+    RAW = b"j"
+    COMPRESSED = b"z"
+    
+    def __init__(self, client: Optional[Any] = None, host: Optional[str] = None, port: Optional[int] = None,
+                 db: Optional[int] = None, compress_min_bytes: Optional[int] = None):
+        if client is None:
+            import redis
+            client = redis.Redis(host=host, port=port, db=db)
+        self.client = client
+        self.compress_min_bytes = compress_min_bytes or int(os.getenv("REDIS_COMPRESS_MIN_BYTES", "1024"))
+    
+    def encode(self, value: Any) -> bytes:
+        data = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        if len(data) >= self.compress_min_bytes:
+            return self.COMPRESSED + zlib.compress(data, 1)
+        return self.RAW + data
+    
+    def decode(self, data: Optional[bytes]) -> Optional[Any]:
+        if data is None:
+            return None
+        tag, payload = data[:1], data[1:]
+        if tag == self.COMPRESSED:
+            return orjson.loads(zlib.decompress(payload))
+        if tag == self.RAW:
+            return orjson.loads(payload)
+        # Untagged entries are json.dumps text written before the binary format
+        return orjson.loads(data)
+    
+    def get(self, key: str) -> Optional[Any]:
+        return self.decode(self.client.get(key))
+    
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        if not keys:
+            return {}
+        values = (self.decode(data) for data in self.client.mget(keys))
+        return {key: value for key, value in zip(keys, values) if value is not None}
+    
+    def set(self, key: str, value: Any, ttl: int = 3600) -> None:
+        self.set_many({key: value}, ttl)
+    
+    def set_many(self, items: Dict[str, Any], ttl: int = 3600) -> None:
+        if ttl <= 0:
+            self.client.delete(*items)
+            return
+        # One round trip for the whole batch; no MULTI since entries are independent
+        pipe = self.client.pipeline(transaction=False)
+        for key, value in items.items():
+            pipe.set(key, self.encode(value), ex=int(ttl))
+        pipe.execute()
+    
+    def add(self, key: str, value: Any, ttl: int = 3600) -> bool:
+        return bool(self.client.set(key, self.encode(value), ex=max(int(ttl), 1), nx=True))
+    
+    def delete(self, key: str) -> None:
+        self.client.delete(key)
+    
+    def delete_prefix(self, prefix: str) -> int:
+        # SCAN walks the keyspace incrementally instead of blocking the server like KEYS would
+        pattern = re.sub(r"([*?\[\]\\])", r"\\\1", prefix) + "*"
+        removed = 0
+        batch = []
+        for key in self.client.scan_iter(match=pattern, count=1000):
+            batch.append(key)
+            if len(batch) >= 500:
+                removed += self.client.unlink(*batch)
+                batch = []
+        if batch:
+            removed += self.client.unlink(*batch)
+        return removed
+
+
+_redis_caches: Dict[Tuple, RedisCache] = {}
+_redis_lock = Lock()
+
+
+def get_redis_cache(host: str, port: int, db: int) -> RedisCache:
+    # One client per server and process; redis-py's connection pool resets itself after a fork
+    with _redis_lock:
+        if (host, port, db) not in _redis_caches:
+            _redis_caches[(host, port, db)] = RedisCache(host=host, port=port, db=db)
+        return _redis_caches[(host, port, db)]
+
+
+# Every live manager, so invalidating a scope reaches caches owned by any service
+_managers: "weakref.WeakSet[CacheManager]" = weakref.WeakSet()
+_managers_lock = Lock()
+
+# Entries read ahead by CacheManager.prefetch, per manager; scoped to the enclosing with-block
+_prefetched: ContextVar[Optional[Dict["CacheManager", Dict[str, Any]]]] = ContextVar("cache_prefetched", default=None)
 
 
 class CacheManager:
-    def __init__(self, ttl: int = 3600, use_redis: bool = False):
+    def __init__(self, ttl: int = 3600, use_redis: bool = False, backend: Optional[str] = None,
+                 config: Optional[Config] = None, name: str = "default"):
         self.ttl = ttl
-        self.use_redis = use_redis
+        # Label under which /metrics reports this manager, summed with others of the same name
+        self.name = name
+        self.backend = backend or os.getenv("CACHE_BACKEND", "redis" if use_redis else "memory")
+        self.use_redis = self.backend == "redis"
+        # Plain counters: a lost increment under contention is cheaper than a lock on every read
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.single_flight = SingleFlight()
+        self.refreshing: Dict[str, Future] = {}
+        self.refresh_lock = Lock()
         
-        if use_redis:
+        if self.backend == "sqlite":
             try:
-                import redis
-                self.cache = redis.Redis(host='localhost', port=6379, db=0, decode_responses=True)
-                self.cache.ping()
+                # Shared per process so clients built per request reuse one set of connections
+                self.cache = get_sqlite_cache()
             except Exception:
                 self.cache = InMemoryCache(ttl)
+                self.backend = "memory"
+        elif self.use_redis:
+            try:
+                settings = redis_settings() if config is None else {
+                    "host": config.redis_host, "port": config.redis_port, "db": config.redis_db,
+                }
+                self.cache = get_redis_cache(**settings)
+                self.cache.client.ping()
+            except Exception:
+                self.cache = InMemoryCache(ttl)
+                self.backend = "memory"
                 self.use_redis = False
         else:
             self.cache = InMemoryCache(ttl)
+        
+        with _managers_lock:
+            _managers.add(self)
+    
+    def _prefetched(self) -> Optional[Dict[str, Any]]:
+        prefetched = _prefetched.get()
+        return prefetched.get(self) if prefetched else None
+    
+    def _count(self, value: Any) -> None:
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
     
     def get(self, key: str) -> Optional[Any]:
-        if self.use_redis:
-            data = self.cache.get(key)
-            return json.loads(data) if data else None
-        return self.cache.get(key)
+        prefetched = self._prefetched()
+        if prefetched is not None and key in prefetched:
+            value = prefetched[key]
+        else:
+            value = self.cache.get(key)
+        self._count(value)
+        return value
+    
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        keys = list(keys)
+        found = self._read_many(keys)
+        for key in keys:
+            self._count(found.get(key))
+        return found
+    
+    def _read_many(self, keys: List[str]) -> Dict[str, Any]:
+        if hasattr(self.cache, "get_many"):
+            return self.cache.get_many(keys)
+        found = {}
+        for key in keys:
+            value = self.cache.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+    
+    @contextmanager
+    def prefetch(self, keys: Iterable[str]) -> Iterator[None]:
+        # Reads the keys in one round trip; get() inside the block answers them, including misses, from memory
+        keys = list(keys)
+        found = self._read_many(keys)
+        prefetched = dict(_prefetched.get() or {})
+        prefetched[self] = {key: found.get(key) for key in keys}
+        token = _prefetched.set(prefetched)
+        try:
+            yield
+        finally:
+            _prefetched.reset(token)
     
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        self.set_many({key: value}, ttl)
+    
+    def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> None:
         ttl = ttl or self.ttl
-        if self.use_redis:
-            self.cache.setex(key, ttl, json.dumps(value))
+        if hasattr(self.cache, "set_many"):
+            self.cache.set_many(items, ttl)
         else:
-            self.cache.set(key, value)
+            for key, value in items.items():
+                self.cache.set(key, value, ttl)
+        
+        prefetched = self._prefetched()
+        if prefetched is not None:
+            for key in prefetched.keys() & items.keys():
+                prefetched[key] = items[key]
+    
+    def add(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
+        # Stores only when the key is absent, atomically on shared backends; True if this call stored it
+        return self.cache.add(key, value, ttl or self.ttl)
     
     def delete(self, key: str) -> None:
-        if self.use_redis:
-            self.cache.delete(key)
-        else:
-            self.cache.delete(key)
+        self.cache.delete(key)
+        prefetched = self._prefetched()
+        if prefetched is not None and key in prefetched:
+            prefetched[key] = None
+    
+    def invalidate(self, scope: str) -> int:
+        return self.cache.delete_prefix(scoped_key(scope, ""))
+    
+    def get_or_load(self, key: str, loader: Callable[[], Any], ttl: Optional[int] = None, stale_ttl: int = 0) -> Any:
+        # Entries live for ttl + stale_ttl; after ttl they are served as-is while one refresh runs behind them
+        ttl = ttl or self.ttl
+        entry = self.get_entry(key, loader, ttl, stale_ttl)
+        if entry is not None:
+            return entry["value"]
+        
+        # Past the hard TTL callers wait, but concurrent ones share a single load
+        return self.single_flight.do(key, lambda: self._load(key, loader, ttl, stale_ttl))
+    
+    def get_entry(self, key: str, loader: Callable[[], Any], ttl: Optional[int] = None,
+                  stale_ttl: int = 0) -> Optional[Dict]:
+        # Cache-only half of get_or_load: None past the hard TTL, a stale entry starts its refresh
+        entry = self.get(key)
+        if not (isinstance(entry, dict) and "fresh_until" in entry):
+            return None
+        if entry["fresh_until"] <= time.time():
+            self.stale_hits += 1
+            self.refresh(key, loader, ttl or self.ttl, stale_ttl)
+        return entry
+    
+    def refresh(self, key: str, loader: Callable[[], Any], ttl: int, stale_ttl: int) -> Future:
+        with self.refresh_lock:
+            future = self.refreshing.get(key)
+            if future is None:
+                account = current_account()
+                # A fresh context keeps the refresh off the books of a request that has already been answered
+                future = _refresh_executor.submit(contextvars.Context().run, self._refresh, key, loader, ttl,
+                                                  stale_ttl, account.service if account else None)
+                self.refreshing[key] = future
+            return future
+    
+    def _refresh(self, key: str, loader: Callable[[], Any], ttl: int, stale_ttl: int,
+                 service: Optional[str]) -> None:
+        start_account(service=service)
+        try:
+            self.single_flight.do(key, lambda: self._load(key, loader, ttl, stale_ttl))
+        except Exception:
+            # The stale entry keeps being served until its hard TTL; the next stale read retries
+            logger.warning("Background refresh of %s failed", key, exc_info=True)
+        finally:
+            with self.refresh_lock:
+                self.refreshing.pop(key, None)
+    
+    def _load(self, key: str, loader: Callable[[], Any], ttl: int, stale_ttl: int) -> Any:
+        value = loader()
+        self.set_entry(key, value, ttl, stale_ttl)
+        return value
+    
+    def set_entry(self, key: str, value: Any, ttl: int, stale_ttl: int) -> None:
+        self.set(key, {"value": value, "fresh_until": time.time() + ttl}, ttl + stale_ttl)
+    
+    def get_stats(self) -> Dict:
+        hits, misses = self.hits, self.misses
+        return {
+            "backend": self.backend,
+            "hits": hits,
+            "misses": misses,
+            "hit_ratio": round(hits / (hits + misses), 2) if hits + misses > 0 else 0.0,
+        }
+
+
+def get_managers() -> List[CacheManager]:
+    with _managers_lock:
+        return list(_managers)
+
+
+def invalidate_scope(scope: str) -> int:
+    managers = get_managers()
+    
+    removed = 0
+    seen = set()
+    for manager in managers:
+        # SQLite and Redis backends are shared between managers; clear each store once
+        if id(manager.cache) in seen:
+            continue
+        seen.add(id(manager.cache))
+        removed += manager.invalidate(scope)
+    return removed
+
+
+def invalidate_user(username: str) -> int:
+    return invalidate_scope(user_scope(username))
+
+
+def invalidate_repo(owner: str, repo: str) -> int:
+    return invalidate_scope(repo_scope(owner, repo))
+
+
+class ConditionalCache:
+    # Headers that describe the wire encoding of one response rather than the cached body
+    UNCACHED_HEADERS = {"content-length", "content-encoding", "transfer-encoding", "connection", "keep-alive", "date"}
+    # How long validators and bodies are kept per endpoint; anything unmatched uses `ttl`
+    ENDPOINT_TTLS = (
+        (r"/search/", 3600),
+        (r"/users/[^/]+/events", 6 * 3600),
+        (r"/repos/[^/]+/[^/]+/(languages|contributors)", 7 * 86400),
+        (r"/users/[^/]+$", 7 * 86400),
+    )
+    
+    def __init__(self, cache: Optional[CacheManager] = None, ttl: int = 86400,
+                 endpoint_ttls: Optional[Tuple[Tuple[str, int], ...]] = None):
+        self.ttl = ttl
+        self.cache = cache or CacheManager(ttl=ttl, name="conditional")
+        self.endpoint_ttls = [(re.compile(pattern), seconds)
+                              for pattern, seconds in (self.ENDPOINT_TTLS if endpoint_ttls is None else endpoint_ttls)]
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        self.lock = Lock()
+    
+    def make_key(self, url: str, headers: Dict) -> str:
+        # Responses can differ per credential, so never share entries across tokens
+        scope = hashlib.sha256(headers.get("Authorization", "").encode()).hexdigest()[:16]
+        return f"conditional:{scope}:{headers.get('Accept', '')}:{url}"
+    
+    def get(self, key: str) -> Optional[Dict]:
+        return self.cache.get(key)
+    
+    def is_fresh(self, entry: Dict) -> bool:
+        return entry.get("fresh_until", 0) > time.time()
+    
+    def ttl_for(self, url: str) -> int:
+        path = url.split("?", 1)[0]
+        for pattern, seconds in self.endpoint_ttls:
+            if pattern.search(path):
+                return seconds
+        return self.ttl
+    
+    def validators(self, entry: Dict) -> Dict:
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+    
+    def store(self, key: str, url: str, headers, body: str) -> None:
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return
+        self.cache.set(key, {
+            "url": url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "headers": self._storable_headers(headers),
+            "body": body,
+            "fresh_until": time.time() + self._max_age(headers),
+        }, self.ttl_for(url))
+    
+    def refresh(self, key: str, entry: Dict, headers) -> Dict:
+        entry["headers"].update(self._storable_headers(headers))
+        entry["fresh_until"] = time.time() + self._max_age(headers)
+        self.cache.set(key, entry, self.ttl_for(entry["url"]))
+        return entry
+    
+    def _max_age(self, headers) -> int:
+        cache_control = headers.get("Cache-Control", "")
+        if "no-cache" in cache_control or "no-store" in cache_control:
+            return 0
+        match = re.search(r"max-age=(\d+)", cache_control)
+        return int(match.group(1)) if match else 0
+    
+    def _storable_headers(self, headers) -> Dict:
+        return {name: value for name, value in headers.items()
+                if name.lower() not in self.UNCACHED_HEADERS}
+    
+    def record_hit(self) -> None:
+        with self.lock:
+            self.hits += 1
+    
+    def record_revalidation(self) -> None:
+        with self.lock:
+            self.revalidations += 1
+    
+    def record_miss(self) -> None:
+        with self.lock:
+            self.misses += 1
+    
+    def get_stats(self) -> Dict:
+        with self.lock:
+            total = self.hits + self.revalidations + self.misses
+            return {
+                "hits": self.hits,
+                "revalidations": self.revalidations,
+                "misses": self.misses,
+                "hit_ratio": round((self.hits + self.revalidations) / total, 2) if total > 0 else 0.0,
+            }
 
 
-def cached(ttl: int = 3600):
+def cached(ttl: int = 3600, stale_ttl: int = 0, scope: Optional[Callable[..., str]] = None, version: int = 1):
     def decorator(func):
+        name = f"{func.__module__}.{func.__qualname__}"
+        
+        def make_key(*args, **kwargs) -> str:
+            # JSON keeps argument boundaries unambiguous; sorted kwargs make call spelling irrelevant
+            params = orjson.dumps([args, kwargs], default=str, option=orjson.OPT_SORT_KEYS).decode()
+            return scoped_key(scope(*args, **kwargs) if scope else GLOBAL_SCOPE, name,
+                              f"v{CACHE_SCHEMA_VERSION}.{version}", params)
+        
         @wraps(func)
         def wrapper(self, *args, **kwargs):
-            cache_key = f"{func.__name__}:{':'.join(map(str, args))}"
+            cache_key = make_key(*args, **kwargs)
+            
+            if stale_ttl and hasattr(self, 'cache'):
+                return self.cache.get_or_load(cache_key, lambda: func(self, *args, **kwargs), ttl, stale_ttl)
             
             if hasattr(self, 'cache'):
                 cached_result = self.cache.get(cache_key)
@@ -82,5 +799,25 @@ def cached(ttl: int = 3600):
                 self.cache.set(cache_key, result, ttl)
             
             return result
+        def peek(self, *args, **kwargs) -> Optional[Any]:
+            # Cache-only read for callers that fetch misses themselves, e.g. through the async client
+            cache_key = make_key(*args, **kwargs)
+            if stale_ttl:
+                entry = self.cache.get_entry(cache_key, lambda: func(self, *args, **kwargs), ttl, stale_ttl)
+                return entry["value"] if entry is not None else None
+            return self.cache.get(cache_key)
+        
+        def fill(self, value: Any, *args, **kwargs) -> None:
+            # Stores a value fetched elsewhere in the layout this wrapper reads back
+            cache_key = make_key(*args, **kwargs)
+            if stale_ttl:
+                self.cache.set_entry(cache_key, value, ttl, stale_ttl)
+            else:
+                self.cache.set(cache_key, value, ttl)
+        
+        # Lets callers compute the key without calling, e.g. to prefetch several in one round trip
+        wrapper.cache_key = make_key
+        wrapper.peek = peek
+        wrapper.fill = fill
         return wrapper
     return decorator
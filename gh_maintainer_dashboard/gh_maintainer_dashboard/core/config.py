@@ -1,19 +1,28 @@
 import os
-from typing import Optional
+from typing import Dict, Optional
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
+def redis_settings() -> Dict:
+    return {
+        "host": os.getenv("REDIS_HOST", "localhost"),
+        "port": int(os.getenv("REDIS_PORT", "6379")),
+        "db": int(os.getenv("REDIS_DB", "0")),
+    }
+
+
 class Config:
     def __init__(self, github_token: Optional[str] = None):
-        self.github_token = github_token or os.getenv("GITHUB_TOKEN")
+        self.github_token = github_token or os.getenv("GITHUB_TOKEN") or os.getenv("GITHUB_TOKENS", "").split(",")[0].strip()
         if not self.github_token:
-            raise ValueError("GitHub token is required. Set GITHUB_TOKEN environment variable or pass it to Config.")
+            raise ValueError("GitHub token is required. Set GITHUB_TOKEN (or GITHUB_TOKENS) environment variable or pass it to Config.")
         
-        self.redis_host = os.getenv("REDIS_HOST", "localhost")
-        self.redis_port = int(os.getenv("REDIS_PORT", "6379"))
-        self.redis_db = int(os.getenv("REDIS_DB", "0"))
+        redis = redis_settings()
+        self.redis_host = redis["host"]
+        self.redis_port = redis["port"]
+        self.redis_db = redis["db"]
         self.cache_ttl = int(os.getenv("CACHE_TTL", "3600"))
         self.api_rate_limit = int(os.getenv("API_RATE_LIMIT", "5000"))
         
@@ -1,79 +1,154 @@
-import requests
-from typing import Dict, List, Optional, Any
+import asyncio
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, ContextManager, Dict, Iterable, Iterator, List, Optional
 from gql import gql, Client
-from gql.transport.requests import RequestsHTTPTransport
+from graphql import DocumentNode
 
+from gh_maintainer_dashboard.core.async_client import AsyncGitHubClient
 from gh_maintainer_dashboard.core.config import Config
-from gh_maintainer_dashboard.core.cache import CacheManager, cached
-from gh_maintainer_dashboard.core.rate_limiter import RateLimiter
+from gh_maintainer_dashboard.core.cache import CacheManager, cached, repo_scope, user_scope
+from gh_maintainer_dashboard.core.schema import get_schema, introspection_payload, sdl_from_introspection
+from gh_maintainer_dashboard.core.transport import PooledGraphQLTransport, get_transport
+
+
+# The cached per-user reads the dashboard views are built from, as fetched through the async client
+ASYNC_USER_READS: Dict[str, Callable[[AsyncGitHubClient, str], Awaitable[Any]]] = {
+    "get_user": lambda client, username: client.get_user(username),
+    "get_user_repos": lambda client, username: client.get_user_repos(username),
+    "get_user_events": lambda client, username: client.get_user_events(username, max_pages=3),
+}
+USER_READS = tuple(ASYNC_USER_READS)
+
+
+@lru_cache(maxsize=128)
+def _parse_query(query: str) -> DocumentNode:
+    return gql(query)
+
+
+class UserSnapshot:
+    # Answers the analyzers' GitHubClient reads from data fetched up front, so analysis does no I/O
+    def __init__(self, username: str, data: Dict[str, Any]):
+        self.username = username
+        self.data = data
+    
+    def _read(self, name: str, username: str) -> Any:
+        if username != self.username or name not in self.data:
+            raise KeyError(f"{name}({username!r}) is not part of this snapshot")
+        return self.data[name]
+    
+    @contextmanager
+    def prefetch_user(self, username: str) -> Iterator[None]:
+        yield
+    
+    def get_user(self, username: str) -> Dict:
+        return self._read("get_user", username)
+    
+    def get_user_repos(self, username: str) -> List[Dict]:
+        return self._read("get_user_repos", username)
+    
+    def get_user_events(self, username: str) -> List[Dict]:
+        return self._read("get_user_events", username)
 
 
 class GitHubClient:
     def __init__(self, config: Config):
         self.config = config
-        self.cache = CacheManager(ttl=config.cache_ttl)
-        self.rate_limiter = RateLimiter(max_calls=config.api_rate_limit)
+        self.cache = CacheManager(ttl=config.cache_ttl, config=config, name="github")
+        self.transport = get_transport()
+        self.token_pool = self.transport.token_pool
         
         self.headers = {
             "Authorization": f"Bearer {config.github_token}",
             "Accept": "application/vnd.github.v3+json"
         }
         
-        transport = RequestsHTTPTransport(
+        transport = PooledGraphQLTransport(
             url=config.github_graphql_url,
+            transport=self.transport,
             headers=self.headers,
             use_json=True,
         )
-        self.graphql_client = Client(transport=transport, fetch_schema_from_transport=True)
+        # The schema is loaded lazily from a process-wide disk cache instead of being introspected
+        # by every new client, so constructing one per HTTP request stays free of network calls
+        self.graphql_client = Client(transport=transport)
     
     def _make_rest_request(self, endpoint: str, params: Optional[Dict] = None) -> Any:
-        self.rate_limiter.wait_if_needed()
         url = f"{self.config.github_api_url}/{endpoint}"
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self.transport.get(url, headers=self.headers, params=params)
         response.raise_for_status()
         return response.json()
     
+    def _paginate_rest_request(self, endpoint: str, params: Optional[Dict] = None,
+                               max_pages: Optional[int] = None) -> List[Any]:
+        url = f"{self.config.github_api_url}/{endpoint}"
+        return list(self.transport.paginate(url, headers=self.headers, params=params, max_pages=max_pages))
+    
+    def _fetch_schema_sdl(self) -> str:
+        response = self.transport.post(self.config.github_graphql_url, headers=self.headers, json=introspection_payload())
+        response.raise_for_status()
+        return sdl_from_introspection(response.json())
+    
     def _make_graphql_request(self, query: str, variables: Optional[Dict] = None) -> Any:
-        self.rate_limiter.wait_if_needed()
-        return self.graphql_client.execute(gql(query), variable_values=variables)
+        # Cheap once loaded; picks up the refetched schema when the saved copy expires
+        self.graphql_client.schema = get_schema(self._fetch_schema_sdl)
+        return self.graphql_client.execute(_parse_query(query), variable_values=variables)
+    
+    def prefetch_user(self, username: str) -> ContextManager[None]:
+        # A profile reads all three; fetch them from the cache backend in one round trip up front
+        return self.cache.prefetch([
+            self.get_user.cache_key(username),
+            self.get_user_repos.cache_key(username),
+            self.get_user_events.cache_key(username),
+        ])
     
-    @cached(ttl=1800)
+    async def snapshot_user(self, client: AsyncGitHubClient, username: str,
+                            reads: Iterable[str] = USER_READS) -> UserSnapshot:
+        # Cache hits come from one backend round trip off the event loop; misses are fetched
+        # concurrently through the async client and written back where the sync reads find them
+        reads = list(reads)
+        
+        def peek() -> Dict[str, Any]:
+            with self.cache.prefetch([getattr(self, name).cache_key(username) for name in reads]):
+                return {name: getattr(GitHubClient, name).peek(self, username) for name in reads}
+        
+        def fill(fetched: Dict[str, Any]) -> None:
+            for name, value in fetched.items():
+                getattr(GitHubClient, name).fill(self, value, username)
+        
+        data = await asyncio.to_thread(peek)
+        missing = [name for name in reads if data[name] is None]
+        if missing:
+            fetched = dict(zip(missing, await asyncio.gather(
+                *(ASYNC_USER_READS[name](client, username) for name in missing)
+            )))
+            await asyncio.to_thread(fill, fetched)
+            data.update(fetched)
+        return UserSnapshot(username, data)
+    
+    @cached(ttl=1800, scope=user_scope)
     def get_user(self, username: str) -> Dict:
         return self._make_rest_request(f"users/{username}")
     
-    @cached(ttl=1800)
+    # Served stale for up to a day while a background fetch refreshes them
+    @cached(ttl=1800, stale_ttl=86400, scope=user_scope)
     def get_user_repos(self, username: str) -> List[Dict]:
-        repos = []
-        page = 1
-        while True:
-            batch = self._make_rest_request(f"users/{username}/repos", params={"page": page, "per_page": 100})
-            if not batch:
-                break
-            repos.extend(batch)
-            page += 1
-        return repos
-    
-    @cached(ttl=900)
+        return self._paginate_rest_request(f"users/{username}/repos", params={"per_page": 100})
+    
+    @cached(ttl=900, stale_ttl=6 * 3600, scope=user_scope)
     def get_user_events(self, username: str) -> List[Dict]:
-        events = []
-        page = 1
-        while page <= 3:
-            batch = self._make_rest_request(f"users/{username}/events", params={"page": page, "per_page": 100})
-            if not batch:
-                break
-            events.extend(batch)
-            page += 1
-        return events
-    
-    @cached(ttl=1800)
+        # The events API never serves more than 3 pages
+        return self._paginate_rest_request(f"users/{username}/events", params={"per_page": 100}, max_pages=3)
+    
+    @cached(ttl=1800, scope=repo_scope)
     def get_repo_info(self, owner: str, repo: str) -> Dict:
         return self._make_rest_request(f"repos/{owner}/{repo}")
     
     def get_pull_request_reviews(self, owner: str, repo: str, pr_number: int) -> List[Dict]:
-        return self._make_rest_request(f"repos/{owner}/{repo}/pulls/{pr_number}/reviews")
+        return self._paginate_rest_request(f"repos/{owner}/{repo}/pulls/{pr_number}/reviews", params={"per_page": 100})
     
     def get_issue_comments(self, owner: str, repo: str, issue_number: int) -> List[Dict]:
-        return self._make_rest_request(f"repos/{owner}/{repo}/issues/{issue_number}/comments")
+        return self._paginate_rest_request(f"repos/{owner}/{repo}/issues/{issue_number}/comments", params={"per_page": 100})
     
     def get_user_contributions_graphql(self, username: str) -> Dict:
         query = """
@@ -0,0 +1,140 @@
+import asyncio
+import contextvars
+import logging
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from requests.utils import parse_header_links
+
+DEFAULT_MAX_PAGES = int(os.getenv("GITHUB_MAX_PAGES", "10"))
+DEFAULT_PREFETCH = int(os.getenv("GITHUB_PAGE_PREFETCH", "4"))
+
+# Sized like the connection pool so prefetching never queues behind a socket
+_executor = ThreadPoolExecutor(max_workers=int(os.getenv("HTTP_POOL_MAXSIZE", "10")), thread_name_prefix="github-pages")
+
+logger = logging.getLogger(__name__)
+
+
+def pages_for(limit: int, per_page: int = 100) -> int:
+    # Callers that only keep the first `limit` items shouldn't pay for the default page budget
+    return max(1, -(-limit // per_page))
+
+
+def parse_links(value: Optional[str]) -> Dict[str, str]:
+    if not value:
+        return {}
+    return {link["rel"]: link["url"] for link in parse_header_links(value) if "rel" in link}
+
+
+def page_number(url: str) -> Optional[int]:
+    page = dict(parse_qsl(urlsplit(url).query)).get("page")
+    return int(page) if page and page.isdigit() else None
+
+
+def with_page(url: str, page: int) -> str:
+    parts = urlsplit(url)
+    query = [(name, value) for name, value in parse_qsl(parts.query) if name != "page"]
+    query.append(("page", str(page)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def _warn_truncated(url: str, max_pages: int, last_page: Optional[int] = None) -> None:
+    total = f"of {last_page} " if last_page else ""
+    logger.warning("Stopped listing %s after %d %spages; raise max_pages or GITHUB_MAX_PAGES for the rest",
+                   url, max_pages, total)
+
+
+def _remaining_page_urls(url: str, links: Dict[str, str], max_pages: int) -> Optional[List[str]]:
+    last_page = page_number(links["last"]) if "last" in links else None
+    if last_page is None:
+        return None
+    if last_page > max_pages:
+        _warn_truncated(url, max_pages, last_page)
+    return [with_page(links["last"], page) for page in range(2, min(last_page, max_pages) + 1)]
+
+
+def _items(data: Any, items_key: Optional[str]) -> List:
+    if items_key:
+        return data.get(items_key, [])
+    return data if isinstance(data, list) else [data]
+
+
+def paginate(get_page: Callable[[str], Tuple[Any, Dict[str, str]]], url: str, max_pages: Optional[int] = None,
+             prefetch: Optional[int] = None, items_key: Optional[str] = None) -> Iterator:
+    max_pages = DEFAULT_MAX_PAGES if max_pages is None else max_pages
+    prefetch = prefetch or DEFAULT_PREFETCH
+    if max_pages <= 0:
+        return
+    
+    data, links = get_page(url)
+    yield from _items(data, items_key)
+    
+    urls = _remaining_page_urls(url, links, max_pages)
+    if urls is None:
+        # No "last" relation (cursor-style endpoints); follow "next" one page at a time
+        fetched = 1
+        while links.get("next") and fetched < max_pages:
+            data, links = get_page(links["next"])
+            fetched += 1
+            yield from _items(data, items_key)
+        if links.get("next"):
+            _warn_truncated(url, max_pages)
+        return
+    
+    # Keep at most `prefetch` pages in flight so a caller that stops early wastes little budget
+    pending = deque()
+    try:
+        for page_url in urls:
+            # Prefetched pages still count against the inbound request that asked for them
+            pending.append(_executor.submit(contextvars.copy_context().run, get_page, page_url))
+            if len(pending) >= prefetch:
+                yield from _items(pending.popleft().result()[0], items_key)
+        while pending:
+            yield from _items(pending.popleft().result()[0], items_key)
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def paginate_async(get_page: Callable[[str], Awaitable[Tuple[Any, Dict[str, str]]]], url: str,
+                         max_pages: Optional[int] = None, prefetch: Optional[int] = None,
+                         items_key: Optional[str] = None) -> AsyncIterator:
+    max_pages = DEFAULT_MAX_PAGES if max_pages is None else max_pages
+    prefetch = prefetch or DEFAULT_PREFETCH
+    if max_pages <= 0:
+        return
+    
+    data, links = await get_page(url)
+    for item in _items(data, items_key):
+        yield item
+    
+    urls = _remaining_page_urls(url, links, max_pages)
+    if urls is None:
+        fetched = 1
+        while links.get("next") and fetched < max_pages:
+            data, links = await get_page(links["next"])
+            fetched += 1
+            for item in _items(data, items_key):
+                yield item
+        if links.get("next"):
+            _warn_truncated(url, max_pages)
+        return
+    
+    pending = deque()
+    try:
+        for page_url in urls:
+            pending.append(asyncio.ensure_future(get_page(page_url)))
+            if len(pending) >= prefetch:
+                data, _ = await pending.popleft()
+                for item in _items(data, items_key):
+                    yield item
+        while pending:
+            data, _ = await pending.popleft()
+            for item in _items(data, items_key):
+                yield item
+    finally:
+        for task in pending:
+            task.cancel()
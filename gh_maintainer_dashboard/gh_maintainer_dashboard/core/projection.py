@@ -0,0 +1,63 @@
+from typing import Any, Dict, Optional
+
+
+class FieldSet:
+    def __init__(self, tree: Dict[str, Dict]):
+        # An empty subtree selects everything below that key
+        self.tree = tree
+    
+    @classmethod
+    def parse(cls, value: Optional[str]) -> Optional["FieldSet"]:
+        paths = [path.strip() for path in (value or "").split(",") if path.strip()]
+        if not paths:
+            return None
+        
+        tree = {}
+        for path in paths:
+            node = tree
+            for key in path.split("."):
+                # A shorter path wins over a longer one under it: "a" already selects all of "a.b"
+                if key in node and not node[key]:
+                    break
+                node = node.setdefault(key, {})
+            else:
+                node.clear()
+        return cls(tree)
+    
+    def _node(self, path) -> Optional[Dict]:
+        node = self.tree
+        for key in path:
+            if not node:
+                return {}
+            if key not in node:
+                return None
+            node = node[key]
+        return node
+    
+    def wants(self, *path: str) -> bool:
+        return self._node(path) is not None
+    
+    def child(self, *path: str) -> Optional["FieldSet"]:
+        node = self._node(path)
+        return FieldSet(node) if node else None
+    
+    def project(self, data: Any) -> Any:
+        return _project(data, self.tree)
+
+
+def _project(data: Any, tree: Dict[str, Dict]) -> Any:
+    if not tree:
+        return data
+    if isinstance(data, list):
+        return [_project(item, tree) for item in data]
+    if isinstance(data, dict):
+        return {key: _project(data[key], subtree) for key, subtree in tree.items() if key in data}
+    return data
+
+
+def wants(fields: Optional[FieldSet], *path: str) -> bool:
+    return fields is None or fields.wants(*path)
+
+
+def project(data: Any, fields: Optional[FieldSet]) -> Any:
+    return data if fields is None else fields.project(data)
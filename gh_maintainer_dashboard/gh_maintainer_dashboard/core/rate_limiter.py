@@ -1,42 +1,165 @@
+import asyncio
 import time
-from collections import deque
-from threading import Lock
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from threading import Condition
+from typing import Dict, Optional
+
+
+def retry_after_deadline(value: str, now: float) -> Optional[float]:
+    # Retry-After is either delay-seconds or an HTTP-date; anything else is ignored
+    try:
+        return now + max(int(value), 0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    # HTTP-dates are always GMT, even when the zone is missing
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return retry_at.timestamp()
+
+
+class RateLimitBucket:
+    def __init__(self, limit: int, time_window: int):
+        self.limit = limit
+        self.time_window = time_window
+        self.remaining = limit
+        self.reset_at = 0.0
+        self.blocked_until = 0.0
+        self.synced = False
+    
+    def roll_window(self, now: float) -> None:
+        # Until a response reports the real reset we fall back to a fixed local window
+        if now >= self.reset_at:
+            self.remaining = self.limit
+            self.reset_at = now + self.time_window
+            self.synced = False
+    
+    def delay(self, now: float) -> float:
+        if self.blocked_until > now:
+            return self.blocked_until - now
+        self.roll_window(now)
+        if self.remaining <= 0:
+            return self.reset_at - now
+        return 0.0
 
 
 class RateLimiter:
-    def __init__(self, max_calls: int = 5000, time_window: int = 3600):
+    DEFAULT_LIMITS = {"core": 5000, "search": 30, "graphql": 5000}
+    DEFAULT_WINDOWS = {"core": 3600, "search": 60, "graphql": 3600}
+    
+    def __init__(self, max_calls: int = 5000, time_window: int = 3600, limits: Optional[Dict[str, int]] = None):
+        limits = {**self.DEFAULT_LIMITS, "core": max_calls, **(limits or {})}
+        windows = {**self.DEFAULT_WINDOWS, "core": time_window}
+        
         self.max_calls = max_calls
         self.time_window = time_window
-        self.calls = deque()
-        self.lock = Lock()
-    
-    def _clean_old_calls(self):
-        current_time = time.time()
-        while self.calls and current_time - self.calls[0] > self.time_window:
-            self.calls.popleft()
-    
-    def can_make_call(self) -> bool:
-        with self.lock:
-            self._clean_old_calls()
-            return len(self.calls) < self.max_calls
-    
-    def record_call(self):
-        with self.lock:
-            self._clean_old_calls()
-            self.calls.append(time.time())
-    
-    def wait_if_needed(self):
-        while not self.can_make_call():
-            time.sleep(1)
-        self.record_call()
-    
-    def get_remaining_calls(self) -> int:
-        with self.lock:
-            self._clean_old_calls()
-            return self.max_calls - len(self.calls)
-    
-    def get_reset_time(self) -> float:
-        with self.lock:
-            if not self.calls:
-                return 0
-            return self.calls[0] + self.time_window
+        self.buckets = {resource: RateLimitBucket(limit, windows.get(resource, time_window))
+                        for resource, limit in limits.items()}
+        self.condition = Condition()
+    
+    @staticmethod
+    def resource_for(url: str) -> str:
+        if url.rstrip("/").endswith("/graphql"):
+            return "graphql"
+        if "/search/" in url:
+            return "search"
+        return "core"
+    
+    def _bucket(self, resource: str) -> RateLimitBucket:
+        if resource not in self.buckets:
+            self.buckets[resource] = RateLimitBucket(self.max_calls, self.time_window)
+        return self.buckets[resource]
+    
+    def _reserve(self, resource: str) -> float:
+        bucket = self._bucket(resource)
+        delay = bucket.delay(time.time())
+        if delay <= 0:
+            bucket.remaining -= 1
+        return delay
+    
+    def try_reserve(self, resource: str = "core") -> float:
+        with self.condition:
+            return self._reserve(resource)
+    
+    def wait_if_needed(self, resource: str = "core") -> None:
+        with self.condition:
+            delay = self._reserve(resource)
+            while delay > 0:
+                # Sleep until the bucket resets, or until a response tells us the budget moved
+                self.condition.wait(timeout=delay)
+                delay = self._reserve(resource)
+    
+    async def wait_if_needed_async(self, resource: str = "core") -> None:
+        while True:
+            with self.condition:
+                delay = self._reserve(resource)
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+    
+    def update_from_headers(self, headers, status_code: Optional[int] = None, resource: Optional[str] = None) -> None:
+        resource = headers.get("X-RateLimit-Resource") or resource or "core"
+        now = time.time()
+        
+        with self.condition:
+            bucket = self._bucket(resource)
+            
+            if headers.get("X-RateLimit-Limit"):
+                bucket.limit = int(headers["X-RateLimit-Limit"])
+            
+            if headers.get("X-RateLimit-Reset"):
+                reset_at = float(headers["X-RateLimit-Reset"])
+                remaining = int(headers.get("X-RateLimit-Remaining", bucket.remaining))
+                if not bucket.synced or reset_at > bucket.reset_at:
+                    bucket.reset_at = reset_at
+                    bucket.remaining = remaining
+                    bucket.synced = True
+                else:
+                    # 304s are free on GitHub, so hand back the unit reserved for this call
+                    local = bucket.remaining + 1 if status_code == 304 else bucket.remaining
+                    bucket.remaining = min(local, remaining)
+            
+            retry_after = retry_after_deadline(headers["Retry-After"], now) if headers.get("Retry-After") else None
+            if retry_after is not None:
+                bucket.blocked_until = retry_after
+            elif status_code in (403, 429) and bucket.remaining <= 0:
+                bucket.blocked_until = bucket.reset_at
+            
+            self.condition.notify_all()
+    
+    def can_make_call(self, resource: str = "core") -> bool:
+        with self.condition:
+            return self._bucket(resource).delay(time.time()) <= 0
+    
+    def record_call(self, resource: str = "core"):
+        with self.condition:
+            bucket = self._bucket(resource)
+            bucket.roll_window(time.time())
+            bucket.remaining -= 1
+    
+    def get_remaining_calls(self, resource: str = "core") -> int:
+        with self.condition:
+            bucket = self._bucket(resource)
+            bucket.roll_window(time.time())
+            return max(bucket.remaining, 0)
+    
+    def get_reset_time(self, resource: str = "core") -> float:
+        with self.condition:
+            return self._bucket(resource).reset_at
+    
+    def get_stats(self) -> Dict:
+        with self.condition:
+            now = time.time()
+            return {
+                resource: {
+                    "limit": bucket.limit,
+                    "remaining": max(bucket.remaining, 0),
+                    "reset_in_seconds": round(max(bucket.reset_at - now, 0), 1),
+                    "blocked_for_seconds": round(max(bucket.blocked_until - now, 0), 1),
+                }
+                for resource, bucket in self.buckets.items()
+            }
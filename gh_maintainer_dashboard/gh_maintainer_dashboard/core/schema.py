@@ -0,0 +1,94 @@
+import os
+import tempfile
+import time
+from threading import Lock
+from typing import Callable, Optional, Tuple
+
+from graphql import GraphQLSchema, build_client_schema, build_schema, get_introspection_query, print_schema
+
+DEFAULT_SCHEMA_PATH = os.path.join(os.path.expanduser("~"), ".cache", "gh_maintainer_dashboard", "github_schema.graphql")
+RETRY_AFTER_FAILURE = 600
+# GitHub's schema changes a few times a month; a week-old copy is refetched the next time it is needed
+DEFAULT_SCHEMA_TTL = 7 * 86400
+
+_schema: Optional[GraphQLSchema] = None
+_expires_at = 0.0
+_retry_at = 0.0
+_schema_lock = Lock()
+
+
+def schema_path() -> str:
+    return os.getenv("GITHUB_SCHEMA_PATH", DEFAULT_SCHEMA_PATH)
+
+
+def schema_ttl() -> int:
+    return int(os.getenv("GITHUB_SCHEMA_TTL", str(DEFAULT_SCHEMA_TTL)))
+
+
+def introspection_payload() -> dict:
+    return {"query": get_introspection_query(descriptions=False)}
+
+
+def sdl_from_introspection(result: dict) -> str:
+    return print_schema(build_client_schema(result["data"]))
+
+
+def _write_atomically(path: str, text: str) -> None:
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def _load_schema(fetch_sdl: Optional[Callable[[], str]]) -> Tuple[Optional[GraphQLSchema], float]:
+    # Returns the schema and when it goes stale; the file's mtime is shared by every process on the machine
+    path = schema_path()
+    ttl = schema_ttl()
+    stale_sdl = None
+    if os.path.exists(path):
+        age = time.time() - os.path.getmtime(path)
+        with open(path, encoding="utf-8") as f:
+            sdl = f.read()
+        if age < ttl:
+            return build_schema(sdl), time.time() + ttl - age
+        stale_sdl = sdl
+    
+    if fetch_sdl is None:
+        if stale_sdl is None:
+            return None, 0.0
+        return build_schema(stale_sdl), time.time() + RETRY_AFTER_FAILURE
+    
+    # First run on this machine, or the saved copy expired: introspect and keep the SDL for every later process
+    try:
+        sdl = fetch_sdl()
+    except Exception as e:
+        if stale_sdl is None:
+            raise
+        print(f"GraphQL schema refresh failed, validating against the saved copy: {e}")
+        return build_schema(stale_sdl), time.time() + RETRY_AFTER_FAILURE
+    _write_atomically(path, sdl)
+    return build_schema(sdl), time.time() + ttl
+
+
+def get_schema(fetch_sdl: Optional[Callable[[], str]] = None) -> Optional[GraphQLSchema]:
+    global _schema, _expires_at, _retry_at
+    if (_schema is None or time.time() >= _expires_at) and time.time() >= _retry_at:
+        with _schema_lock:
+            if (_schema is None or time.time() >= _expires_at) and time.time() >= _retry_at:
+                try:
+                    _schema, _expires_at = _load_schema(fetch_sdl)
+                except Exception as e:
+                    # A schema already in memory keeps validating until a retry succeeds
+                    print(f"GraphQL schema unavailable, skipping local validation: {e}")
+                    _retry_at = time.time() + RETRY_AFTER_FAILURE
+    return _schema
+
+
+def reset_schema() -> None:
+    global _schema, _expires_at, _retry_at
+    with _schema_lock:
+        _schema = None
+        _expires_at = 0.0
+        _retry_at = 0.0
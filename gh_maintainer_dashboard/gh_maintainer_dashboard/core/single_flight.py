@@ -0,0 +1,96 @@
+import asyncio
+import hashlib
+from concurrent.futures import Future
+from threading import Lock
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+def normalize_url(url: str) -> str:
+    # Parameter order carries no meaning, so ?page=2&per_page=100 and ?per_page=100&page=2 share a call;
+    # the sort is stable and keeps repeated parameters in their original order
+    base, _, rest = url.partition("?")
+    query = rest.partition("#")[0]
+    if not query:
+        return base
+    params = sorted((param for param in query.split("&") if param), key=lambda param: param.partition("=")[0])
+    return f"{base}?{'&'.join(params)}"
+
+
+def request_key(method: str, url: str, headers: Dict) -> Tuple:
+    # Token scope is part of the key so callers never receive data fetched with someone else's credentials
+    scope = hashlib.sha256((headers.get("Authorization") or "").encode("utf-8")).hexdigest()[:16]
+    return method.upper(), normalize_url(url), scope, headers.get("Accept", "")
+
+
+class SingleFlight:
+    def __init__(self):
+        self._lock = Lock()
+        self._calls: Dict[Hashable, Future] = {}
+        self.executed = 0
+        self.coalesced = 0
+    
+    def _join(self, key: Hashable) -> Tuple[Future, bool]:
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return future, False
+            
+            future = Future()
+            self._calls[key] = future
+            self.executed += 1
+            return future, True
+    
+    def _finish(self, key: Hashable) -> None:
+        with self._lock:
+            self._calls.pop(key, None)
+    
+    def do(self, key: Hashable, fn: Callable[[], Any], on_shared: Optional[Callable[[], None]] = None) -> Any:
+        future, leader = self._join(key)
+        if not leader:
+            if on_shared:
+                on_shared()
+            return future.result()
+        
+        try:
+            result = fn()
+        except BaseException as error:
+            self._finish(key)
+            future.set_exception(error)
+            raise
+        
+        self._finish(key)
+        future.set_result(result)
+        return result
+    
+    async def do_async(self, key: Hashable, fn: Callable[[], Awaitable],
+                       on_shared: Optional[Callable[[], None]] = None) -> Any:
+        # concurrent.futures lets callers on other threads and event loops wait on the same call
+        future, leader = self._join(key)
+        if not leader:
+            if on_shared:
+                on_shared()
+            return await asyncio.wrap_future(future)
+        
+        try:
+            result = await fn()
+        except BaseException as error:
+            self._finish(key)
+            future.set_exception(error)
+            raise
+        
+        self._finish(key)
+        future.set_result(result)
+        return result
+    
+    def get_stats(self) -> Dict:
+        with self._lock:
+            in_flight = len(self._calls)
+        
+        total = self.executed + self.coalesced
+        return {
+            "in_flight": in_flight,
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "coalesce_ratio": round(self.coalesced / total, 2) if total > 0 else 0.0,
+        }
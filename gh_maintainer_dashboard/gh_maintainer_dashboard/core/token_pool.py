@@ -0,0 +1,118 @@
+import asyncio
+import os
+from threading import Condition
+from typing import Dict, List, Optional, Tuple
+
+from gh_maintainer_dashboard.core.rate_limiter import RateLimiter
+
+
+def _split_authorization(value: Optional[str]) -> Tuple[str, Optional[str]]:
+    if not value:
+        return "token", None
+    scheme, _, token = value.partition(" ")
+    # Clients format the header even when no token is configured
+    if not token or token == "None":
+        return scheme, None
+    return scheme, token
+
+
+class TokenPool:
+    def __init__(self, tokens: Optional[List[str]] = None, max_calls: int = 5000):
+        self.tokens = list(dict.fromkeys(token for token in tokens or [] if token))
+        self.max_calls = max_calls
+        self.limiters: Dict[Optional[str], RateLimiter] = {token: RateLimiter(max_calls=max_calls) for token in self.tokens}
+        self.selections = {token: 0 for token in self.tokens}
+        self.condition = Condition()
+    
+    @classmethod
+    def from_env(cls) -> "TokenPool":
+        tokens = [token.strip() for token in os.getenv("GITHUB_TOKENS", "").split(",")]
+        tokens.append(os.getenv("GITHUB_TOKEN"))
+        return cls(tokens, max_calls=int(os.getenv("API_RATE_LIMIT", "5000")))
+    
+    def __len__(self) -> int:
+        return len(self.tokens)
+    
+    def __contains__(self, token: Optional[str]) -> bool:
+        return token in self.selections
+    
+    def limiter_for(self, token: Optional[str]) -> RateLimiter:
+        # Tokens outside the pool still get their own budget; they just never get swapped
+        with self.condition:
+            if token not in self.limiters:
+                self.limiters[token] = RateLimiter(max_calls=self.max_calls)
+            return self.limiters[token]
+    
+    def _try_acquire(self, resource: str) -> Tuple[Optional[str], float]:
+        ranked = sorted(self.tokens, key=lambda token: self.limiters[token].get_remaining_calls(resource), reverse=True)
+        shortest = None
+        for token in ranked:
+            delay = self.limiters[token].try_reserve(resource)
+            if delay <= 0:
+                self.selections[token] += 1
+                return token, 0.0
+            shortest = delay if shortest is None else min(shortest, delay)
+        return None, shortest
+    
+    def acquire(self, resource: str = "core") -> str:
+        with self.condition:
+            token, delay = self._try_acquire(resource)
+            while token is None:
+                # Every token is parked; wake at the earliest reset or when a response frees budget
+                self.condition.wait(timeout=delay)
+                token, delay = self._try_acquire(resource)
+            return token
+    
+    async def acquire_async(self, resource: str = "core") -> str:
+        while True:
+            with self.condition:
+                token, delay = self._try_acquire(resource)
+            if token is not None:
+                return token
+            await asyncio.sleep(delay)
+    
+    def _uses_pool(self, token: Optional[str]) -> bool:
+        return bool(self.tokens) and (token is None or token in self)
+    
+    def authorize(self, headers: Dict, resource: str = "core") -> Optional[str]:
+        scheme, token = _split_authorization(headers.get("Authorization"))
+        if self._uses_pool(token):
+            token = self.acquire(resource)
+            headers["Authorization"] = f"{scheme} {token}"
+        else:
+            self.limiter_for(token).wait_if_needed(resource)
+        return token
+    
+    async def authorize_async(self, headers: Dict, resource: str = "core") -> Optional[str]:
+        scheme, token = _split_authorization(headers.get("Authorization"))
+        if self._uses_pool(token):
+            token = await self.acquire_async(resource)
+            headers["Authorization"] = f"{scheme} {token}"
+        else:
+            await self.limiter_for(token).wait_if_needed_async(resource)
+        return token
+    
+    def update_from_headers(self, token: Optional[str], headers, status_code: Optional[int] = None,
+                            resource: Optional[str] = None) -> None:
+        self.limiter_for(token).update_from_headers(headers, status_code, resource)
+        with self.condition:
+            self.condition.notify_all()
+    
+    def get_stats(self) -> Dict:
+        with self.condition:
+            limiters = list(self.limiters.items())
+            selections = dict(self.selections)
+        
+        by_token = {}
+        for token, limiter in limiters:
+            label = f"...{token[-4:]}" if token else "anonymous"
+            by_token[label] = {
+                "pooled": token in selections,
+                "selected": selections.get(token, 0),
+                "buckets": limiter.get_stats(),
+            }
+        
+        return {
+            "pool_size": len(self.tokens),
+            "tokens": by_token,
+        }
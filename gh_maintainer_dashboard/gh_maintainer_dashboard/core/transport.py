@@ -0,0 +1,203 @@
+import os
+import time
+from threading import Lock
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from gql.transport.requests import RequestsHTTPTransport
+
+from gh_maintainer_dashboard.core import pagination
+from gh_maintainer_dashboard.core.accounting import record_cache, record_call, tag_request
+from gh_maintainer_dashboard.core.cache import CacheManager, ConditionalCache
+from gh_maintainer_dashboard.core.rate_limiter import RateLimiter
+from gh_maintainer_dashboard.core.single_flight import SingleFlight, request_key
+from gh_maintainer_dashboard.core.token_pool import TokenPool
+
+
+class GitHubTransport:
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10, timeout: float = 30.0,
+                 conditional_cache: Optional[ConditionalCache] = None, token_pool: Optional[TokenPool] = None,
+                 single_flight: Optional[SingleFlight] = None):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.timeout = timeout
+        self.conditional_cache = conditional_cache
+        self.token_pool = token_pool or TokenPool()
+        self.single_flight = single_flight or SingleFlight()
+        
+        # One keep-alive pool per host; pool_maxsize bounds the sockets kept open to each host
+        self.adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session = requests.Session()
+        self.session.mount("https://", self.adapter)
+        self.session.mount("http://", self.adapter)
+    
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        if method.upper() != "GET":
+            return self._send(method, url, **kwargs)
+        
+        url = requests.Request("GET", url, params=kwargs.pop("params", None)).prepare().url
+        key = request_key("GET", url, kwargs.get("headers") or {})
+        return self.single_flight.do(key, lambda: self._get(url, **kwargs), on_shared=lambda: record_cache(url, "shared"))
+    
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        if self.conditional_cache is not None:
+            return self._conditional_get(url, **kwargs)
+        return self._send("GET", url, **kwargs)
+    
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        resource = RateLimiter.resource_for(url)
+        headers = dict(kwargs.pop("headers", None) or {})
+        started = time.monotonic()
+        token = self.token_pool.authorize(headers, resource)
+        waited = time.monotonic() - started
+        tag_request(headers)
+        
+        started = time.monotonic()
+        try:
+            response = self.session.request(method, url, headers=headers, **kwargs)
+        except requests.RequestException:
+            record_call(url, None, 0, resource, started, waited)
+            raise
+        self.token_pool.update_from_headers(token, response.headers, response.status_code, resource)
+        record_call(url, response.status_code, len(response.content), resource, started, waited)
+        return response
+    
+    def _conditional_get(self, url: str, **kwargs) -> requests.Response:
+        cache = self.conditional_cache
+        headers = dict(kwargs.pop("headers", None) or {})
+        key = cache.make_key(url, headers)
+        
+        entry = cache.get(key)
+        if entry and cache.is_fresh(entry):
+            cache.record_hit()
+            record_cache(url, "cache_hits")
+            return self._cached_response(entry)
+        
+        if entry:
+            headers.update(cache.validators(entry))
+        
+        response = self._send("GET", url, headers=headers, **kwargs)
+        
+        if response.status_code == 304 and entry:
+            cache.record_revalidation()
+            record_cache(url, "revalidated")
+            entry = cache.refresh(key, entry, response.headers)
+            return self._cached_response(entry, revalidated=response)
+        
+        cache.record_miss()
+        record_cache(url, "misses")
+        if response.status_code == 200:
+            cache.store(key, response.url, response.headers, response.content.decode("utf-8"))
+        return response
+    
+    def _cached_response(self, entry: Dict, revalidated: Optional[requests.Response] = None) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = entry["url"]
+        response.encoding = "utf-8"
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response._content = entry["body"].encode("utf-8")
+        if revalidated is not None:
+            response.request = revalidated.request
+            response.elapsed = revalidated.elapsed
+        return response
+    
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+    
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+    
+    def get_page(self, url: str, headers: Optional[Dict] = None) -> Tuple[Any, Dict[str, str]]:
+        response = self.get(url, headers=headers)
+        response.raise_for_status()
+        return response.json(), pagination.parse_links(response.headers.get("Link"))
+    
+    def paginate(self, url: str, headers: Optional[Dict] = None, params: Optional[Dict] = None,
+                 max_pages: Optional[int] = None, items_key: Optional[str] = None) -> Iterator:
+        first_page = requests.Request("GET", url, params=params).prepare().url
+        return pagination.paginate(lambda page_url: self.get_page(page_url, headers=headers), first_page,
+                                   max_pages=max_pages, items_key=items_key)
+    
+    def get_stats(self) -> Dict:
+        pools = self.adapter.poolmanager.pools
+        
+        requests_sent = 0
+        connections_opened = 0
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            requests_sent += pool.num_requests
+            connections_opened += pool.num_connections
+        
+        connections_reused = max(requests_sent - connections_opened, 0)
+        
+        return {
+            "pool_connections": self.pool_connections,
+            "pool_maxsize": self.pool_maxsize,
+            "active_host_pools": len(pools),
+            "requests_sent": requests_sent,
+            "connections_opened": connections_opened,
+            "connections_reused": connections_reused,
+            "reuse_ratio": round(connections_reused / requests_sent, 2) if requests_sent > 0 else 0.0,
+            "conditional_cache": self.conditional_cache.get_stats() if self.conditional_cache else None,
+            "rate_limit": self.token_pool.get_stats(),
+            "single_flight": self.single_flight.get_stats(),
+        }
+    
+    def close(self) -> None:
+        self.session.close()
+
+
+class PooledGraphQLTransport(RequestsHTTPTransport):
+    def __init__(self, url: str, transport: Optional[GitHubTransport] = None, **kwargs):
+        super().__init__(url=url, **kwargs)
+        self.github_transport = transport or get_transport()
+        self.session = self.github_transport
+    
+    def connect(self):
+        # gql calls connect/close around every execute, and one client serves many request threads;
+        # the session always stays on the shared pool, so one thread's close() can't pull it from another
+        pass
+    
+    def close(self):
+        pass
+
+
+_transport: Optional[GitHubTransport] = None
+_transport_lock = Lock()
+
+
+def _default_conditional_cache() -> Optional[ConditionalCache]:
+    if os.getenv("HTTP_CONDITIONAL_CACHE", "1") == "0":
+        return None
+    ttl = int(os.getenv("HTTP_CONDITIONAL_CACHE_TTL", "86400"))
+    return ConditionalCache(CacheManager(ttl=ttl, name="conditional"), ttl=ttl)
+
+
+def get_transport() -> GitHubTransport:
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = GitHubTransport(
+                    pool_connections=int(os.getenv("HTTP_POOL_CONNECTIONS", "10")),
+                    pool_maxsize=int(os.getenv("HTTP_POOL_MAXSIZE", "10")),
+                    timeout=float(os.getenv("HTTP_TIMEOUT", "30")),
+                    conditional_cache=_default_conditional_cache(),
+                    token_pool=TokenPool.from_env(),
+                )
+    return _transport
+
+
+def set_transport(transport: Optional[GitHubTransport]) -> None:
+    global _transport
+    with _transport_lock:
+        if _transport is not None and _transport is not transport:
+            _transport.close()
+        _transport = transport
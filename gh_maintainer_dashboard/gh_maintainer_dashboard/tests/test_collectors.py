@@ -3,6 +3,8 @@ from unittest.mock import Mock
 from datetime import datetime
 from gh_maintainer_dashboard.collectors.review_collector import ReviewCollector
 from gh_maintainer_dashboard.collectors.issue_collector import IssueCollector
+from gh_maintainer_dashboard.collectors.comment_collector import CommentCollector
+from gh_maintainer_dashboard.collectors.events import EventDispatcher
 from gh_maintainer_dashboard.core.github_client import GitHubClient
 
 
@@ -66,3 +68,58 @@ class TestIssueCollector:
         assert len(activities) > 0
         assert activities[0].issue_number == 10
         assert activities[0].action == "opened"
+
+
+class TestEventDispatcher:
+    def setup_method(self):
+        self.mock_client = Mock(spec=GitHubClient)
+        self.mock_client.get_user_events.return_value = [
+            {
+                "id": "1",
+                "type": "PullRequestReviewEvent",
+                "created_at": "2025-10-01T10:00:00Z",
+                "repo": {"name": "owner/repo"},
+                "payload": {"review": {"state": "changes_requested"}, "pull_request": {"number": 42}}
+            },
+            {
+                "id": "2",
+                "type": "PushEvent",
+                "created_at": "2025-10-01T11:00:00Z",
+                "repo": {"name": "owner/repo"},
+                "payload": {"commits": [{"sha": "a", "message": "Fix CI workflow"}, {"sha": "b", "message": "Update docs"}]}
+            },
+            {
+                "id": "3",
+                "type": "IssueCommentEvent",
+                "created_at": "2025-10-01T12:00:00Z",
+                "repo": {"name": "owner/repo"},
+                "payload": {"comment": {"body": "Thanks for the fix"}, "issue": {"number": 7, "author_association": "FIRST_TIMER"}}
+            },
+            {"id": "4", "type": "WatchEvent", "created_at": "2025-10-01T13:00:00Z", "repo": {"name": "owner/repo"}, "payload": {}},
+        ]
+    
+    def test_one_pass_builds_every_activity_list_and_stats(self):
+        events = EventDispatcher().decompose_user(self.mock_client, "testuser")
+        
+        assert self.mock_client.get_user_events.call_count == 1
+        assert [len(events.activities[kind]) for kind in ("reviews", "issues", "comments", "commits")] == [1, 0, 1, 2]
+        assert events.stats["reviews"]["request_changes_rate"] == 1.0
+        assert events.stats["commits"]["ci_fixes"] == 1
+        assert events.stats["commits"]["documentation_commits"] == 1
+        assert events.stats["comments"]["mentorship_interactions"] == 1
+    
+    def test_collectors_share_a_decomposition(self):
+        dispatcher = EventDispatcher()
+        events = dispatcher.decompose_user(self.mock_client, "testuser")
+        
+        reviews = ReviewCollector(self.mock_client, dispatcher).collect_user_reviews("testuser", events)
+        comment_stats = CommentCollector(self.mock_client, dispatcher).get_comment_stats("testuser", events)
+        
+        assert reviews[0].pr_number == 42
+        assert comment_stats["avg_word_count"] == 4
+        assert self.mock_client.get_user_events.call_count == 1
+    
+    def test_view_on_its_own_builds_only_its_kind(self):
+        events = EventDispatcher().decompose_user(self.mock_client, "testuser", kinds=["reviews"])
+        
+        assert list(events.activities) == ["reviews"]
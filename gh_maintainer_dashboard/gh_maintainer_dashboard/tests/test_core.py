@@ -0,0 +1,1153 @@
+import asyncio
+import contextvars
+import json
+import os
+import threading
+import time
+import pytest
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import islice
+from urllib.parse import parse_qs
+from gql import Client, gql
+from graphql import GraphQLError
+from gh_maintainer_dashboard.core.accounting import current_account, record_call, set_call_observer, start_account
+from gh_maintainer_dashboard.core.async_client import (
+    AsyncGitHubClient, gather_bounded, iter_bounded, iter_user_batch, run_sync, use_client,
+)
+from gh_maintainer_dashboard.core.bulk_issues import IssueBulkQuery, fetch_issues_bulk_async
+from gh_maintainer_dashboard.core.cache import (
+    CacheManager, ConditionalCache, InMemoryCache, RedisCache, SQLiteCache, cached, invalidate_repo, invalidate_user,
+    repo_scope, user_scope
+)
+from gh_maintainer_dashboard.core.config import Config
+from gh_maintainer_dashboard.core.pagination import pages_for
+from gh_maintainer_dashboard.core.projection import FieldSet, project, wants
+from gh_maintainer_dashboard.core.github_client import GitHubClient
+from gh_maintainer_dashboard.core import schema as schema_module
+from gh_maintainer_dashboard.core.schema import get_schema, reset_schema
+from gh_maintainer_dashboard.core.rate_limiter import RateLimiter
+from gh_maintainer_dashboard.core.single_flight import SingleFlight, request_key
+from gh_maintainer_dashboard.core.token_pool import TokenPool
+from gh_maintainer_dashboard.core.transport import GitHubTransport, PooledGraphQLTransport
+
+
+class FakeGitHubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    routes = {}
+    requests_seen = []
+    
+    def do_GET(self):
+        path, _, query = self.path.partition("?")
+        route = self.routes.get(path, (404, {}, {"message": "Not Found"}))
+        if isinstance(route, dict):
+            route = route[int(parse_qs(query).get("page", ["1"])[0])]
+        status, headers, body = route
+        self.requests_seen.append((self.path, dict(self.headers)))
+        if headers.get("ETag") and self.headers.get("If-None-Match") == headers["ETag"]:
+            status, body = 304, None
+        payload = json.dumps(body).encode() if body is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+    
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        self.requests_seen.append((self.path, dict(self.headers)))
+        body = json.dumps(self.routes[("POST", self.path)](payload)).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def fake_github():
+    FakeGitHubHandler.routes = {}
+    FakeGitHubHandler.requests_seen = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeGitHubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", FakeGitHubHandler.routes
+    server.shutdown()
+    server.server_close()
+
+
+class TestGitHubTransport:
+    def test_connection_is_reused_across_requests(self, fake_github):
+        base_url, routes = fake_github
+        routes["/users/octocat"] = (200, {}, {"login": "octocat"})
+        transport = GitHubTransport(pool_maxsize=2)
+        
+        for _ in range(3):
+            response = transport.get(f"{base_url}/users/octocat")
+            assert response.json()["login"] == "octocat"
+        
+        stats = transport.get_stats()
+        assert stats["requests_sent"] == 3
+        assert stats["connections_opened"] == 1
+        assert stats["connections_reused"] == 2
+        transport.close()
+    
+    def test_stats_before_any_request(self):
+        stats = GitHubTransport().get_stats()
+        
+        assert stats["requests_sent"] == 0
+        assert stats["reuse_ratio"] == 0.0
+
+
+class TestPooledGraphQLTransport:
+    def test_concurrent_executes_share_one_client(self, fake_github):
+        base_url, routes = fake_github
+        
+        routes[("POST", "/graphql")] = lambda payload: {"data": {"viewer": {"login": "octocat"}}}
+        client = Client(transport=PooledGraphQLTransport(f"{base_url}/graphql", transport=GitHubTransport()))
+        query = gql("query { viewer { login } }")
+        results = []
+        errors = []
+        
+        def execute():
+            for _ in range(25):
+                try:
+                    results.append(client.execute(query)["viewer"]["login"])
+                except Exception as error:
+                    errors.append(error)
+        
+        threads = [threading.Thread(target=execute) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert errors == []
+        assert results == ["octocat"] * 200
+    
+    def test_close_from_one_execute_leaves_session_for_others(self, fake_github):
+        base_url, routes = fake_github
+        routes[("POST", "/graphql")] = lambda payload: {"data": {"viewer": {"login": "octocat"}}}
+        transport = PooledGraphQLTransport(f"{base_url}/graphql", transport=GitHubTransport())
+        query = gql("query { viewer { login } }")
+        
+        # What a thread sees between its own connect() and request when another thread's execute has just closed
+        Client(transport=transport).execute(query)
+        
+        assert transport.session is transport.github_transport
+        assert transport.execute(query).data == {"viewer": {"login": "octocat"}}
+
+
+class TestRateLimiter:
+    def setup_method(self):
+        self.limiter = RateLimiter()
+    
+    def test_budget_follows_response_headers(self):
+        reset_at = time.time() + 600
+        self.limiter.update_from_headers({
+            "X-RateLimit-Resource": "core",
+            "X-RateLimit-Limit": "5000",
+            "X-RateLimit-Remaining": "42",
+            "X-RateLimit-Reset": str(reset_at),
+        })
+        
+        assert self.limiter.get_remaining_calls("core") == 42
+        assert self.limiter.get_reset_time("core") == reset_at
+    
+    def test_buckets_are_independent(self):
+        self.limiter.update_from_headers({
+            "X-RateLimit-Resource": "search",
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(time.time() + 60),
+        })
+        
+        assert not self.limiter.can_make_call("search")
+        assert self.limiter.can_make_call("core")
+        assert self.limiter.resource_for("https://api.github.com/search/issues") == "search"
+        assert self.limiter.resource_for("https://api.github.com/graphql") == "graphql"
+    
+    def test_wait_wakes_at_reset(self):
+        self.limiter.update_from_headers({
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(time.time() + 0.3),
+        })
+        
+        start = time.time()
+        self.limiter.wait_if_needed("core")
+        
+        assert 0.25 <= time.time() - start < 1.0
+    
+    def test_retry_after_blocks_the_bucket(self):
+        self.limiter.update_from_headers({"Retry-After": "30"}, status_code=403)
+        
+        assert not self.limiter.can_make_call("core")
+        assert self.limiter.get_stats()["core"]["blocked_for_seconds"] > 25
+    
+    def test_retry_after_accepts_an_http_date(self):
+        self.limiter.update_from_headers({"Retry-After": formatdate(time.time() + 60, usegmt=True)}, status_code=429)
+        
+        assert not self.limiter.can_make_call("core")
+        assert 55 < self.limiter.get_stats()["core"]["blocked_for_seconds"] <= 61
+    
+    def test_unparseable_retry_after_is_ignored(self):
+        self.limiter.update_from_headers({"Retry-After": "soon"}, status_code=503)
+        
+        assert self.limiter.can_make_call("core")
+
+
+class TestTokenPool:
+    def setup_method(self):
+        self.pool = TokenPool(["token-a", "token-b"])
+    
+    def test_least_loaded_token_is_selected(self):
+        self.pool.update_from_headers("token-a", {"X-RateLimit-Remaining": "10", "X-RateLimit-Reset": str(time.time() + 600)})
+        self.pool.update_from_headers("token-b", {"X-RateLimit-Remaining": "900", "X-RateLimit-Reset": str(time.time() + 600)})
+        
+        assert self.pool.acquire() == "token-b"
+    
+    def test_exhausted_token_is_parked_until_reset(self):
+        self.pool.update_from_headers("token-a", {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(time.time() + 600)})
+        
+        assert {self.pool.acquire() for _ in range(5)} == {"token-b"}
+        
+        self.pool.update_from_headers("token-b", {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(time.time() + 0.3)})
+        start = time.time()
+        
+        assert self.pool.acquire() == "token-b"
+        assert time.time() - start >= 0.25
+    
+    def test_transport_sends_pooled_token(self, fake_github):
+        base_url, routes = fake_github
+        routes["/users/octocat"] = (200, {}, {"login": "octocat"})
+        transport = GitHubTransport(token_pool=self.pool)
+        
+        transport.get(f"{base_url}/users/octocat", headers={"Authorization": "token None"})
+        transport.get(f"{base_url}/users/octocat", headers={"Authorization": "Bearer token-a"})
+        transport.get(f"{base_url}/users/octocat", headers={"Authorization": "token personal"})
+        
+        sent = [headers["Authorization"] for _, headers in FakeGitHubHandler.requests_seen]
+        assert sent[0] in ("token token-a", "token token-b")
+        assert sent[1] in ("Bearer token-a", "Bearer token-b")
+        assert sent[2] == "token personal"
+        assert transport.get_stats()["rate_limit"]["pool_size"] == 2
+        transport.close()
+
+
+class TestSingleFlight:
+    def test_concurrent_callers_share_one_call(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+        
+        def fetch():
+            calls.append(1)
+            release.wait(timeout=5)
+            return "payload"
+        
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(flight.do("key", fetch))) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        while flight.get_stats()["coalesced"] < 4:
+            time.sleep(0.01)
+        release.set()
+        for thread in threads:
+            thread.join()
+        
+        assert results == ["payload"] * 5
+        assert len(calls) == 1
+        assert flight.get_stats()["executed"] == 1
+        assert flight.get_stats()["in_flight"] == 0
+    
+    def test_errors_reach_every_waiter_and_are_not_kept(self):
+        flight = SingleFlight()
+        
+        def fail():
+            raise ValueError("boom")
+        
+        with pytest.raises(ValueError):
+            flight.do("key", fail)
+        
+        assert flight.do("key", lambda: "retried") == "retried"
+    
+    @pytest.mark.asyncio
+    async def test_async_client_coalesces_identical_requests(self, fake_github):
+        base_url, routes = fake_github
+        routes["/users/octocat/events"] = (200, {}, [{"type": "PushEvent"}])
+        flight = SingleFlight()
+        
+        async with AsyncGitHubClient("token", base_url=base_url, single_flight=flight) as client:
+            results = await asyncio.gather(*(client.get_user_events("octocat") for _ in range(5)))
+        
+        assert all(result == [{"type": "PushEvent"}] for result in results)
+        assert len(FakeGitHubHandler.requests_seen) == 1
+        assert flight.get_stats()["coalesced"] == 4
+    
+    def test_request_key_ignores_query_parameter_order(self):
+        headers = {"Authorization": "token a", "Accept": "application/json"}
+        url = "https://api.github.com/repos/octocat/hello/issues"
+        
+        def key(query, method="GET"):
+            return request_key(method, f"{url}?{query}", headers)
+        
+        assert key("state=open&per_page=100&page=2", "get") == key("page=2&per_page=100&state=open")
+        assert key("page=2") != key("page=3")
+        assert key("labels=a&labels=b") != key("labels=b&labels=a")
+        assert key("") == request_key("GET", url, headers)
+
+
+def paged_route(base_url, path, pages):
+    last = f"<{base_url}{path}?per_page=1&page={len(pages)}>; rel=\"last\""
+    return {
+        number: (200, {"Link": f"<{base_url}{path}?per_page=1&page={number + 1}>; rel=\"next\", {last}"}, items)
+        for number, items in enumerate(pages, start=1)
+    }
+
+
+class TestPagination:
+    def test_all_pages_are_fetched_in_order(self, fake_github):
+        base_url, routes = fake_github
+        routes["/repos/octocat/hello/issues"] = paged_route(base_url, "/repos/octocat/hello/issues", [[{"number": n}] for n in range(1, 6)])
+        transport = GitHubTransport()
+        
+        issues = list(transport.paginate(f"{base_url}/repos/octocat/hello/issues", params={"per_page": 1}))
+        
+        assert [issue["number"] for issue in issues] == [1, 2, 3, 4, 5]
+        assert len(FakeGitHubHandler.requests_seen) == 5
+        transport.close()
+    
+    def test_early_stop_skips_remaining_pages(self, fake_github):
+        base_url, routes = fake_github
+        routes["/repos/octocat/hello/issues"] = paged_route(base_url, "/repos/octocat/hello/issues", [[{"number": n}] for n in range(1, 21)])
+        transport = GitHubTransport()
+        
+        pages = transport.paginate(f"{base_url}/repos/octocat/hello/issues", params={"per_page": 1}, max_pages=20)
+        first_two = list(islice(pages, 2))
+        pages.close()
+        time.sleep(0.1)
+        
+        assert [issue["number"] for issue in first_two] == [1, 2]
+        assert len(FakeGitHubHandler.requests_seen) <= 5
+        transport.close()
+    
+    def test_pages_for_covers_only_the_requested_items(self):
+        assert pages_for(20) == 1
+        assert pages_for(100) == 1
+        assert pages_for(101) == 2
+        assert pages_for(0) == 1
+        assert pages_for(5, per_page=2) == 3
+    
+    def test_max_pages_caps_the_walk(self, fake_github):
+        base_url, routes = fake_github
+        routes["/repos/octocat/hello/issues"] = paged_route(base_url, "/repos/octocat/hello/issues", [[{"number": n}] for n in range(1, 6)])
+        transport = GitHubTransport()
+        
+        issues = list(transport.paginate(f"{base_url}/repos/octocat/hello/issues", params={"per_page": 1}, max_pages=2))
+        
+        assert len(issues) == 2
+        transport.close()
+    
+    def test_truncated_walk_is_logged(self, fake_github, caplog):
+        base_url, routes = fake_github
+        routes["/repos/octocat/hello/issues"] = paged_route(base_url, "/repos/octocat/hello/issues", [[{"number": n}] for n in range(1, 6)])
+        transport = GitHubTransport()
+        
+        with caplog.at_level("WARNING", logger="gh_maintainer_dashboard.core.pagination"):
+            list(transport.paginate(f"{base_url}/repos/octocat/hello/issues", params={"per_page": 1}, max_pages=2))
+            truncated = len(caplog.records)
+            list(transport.paginate(f"{base_url}/repos/octocat/hello/issues", params={"per_page": 1}, max_pages=5))
+        
+        assert truncated == 1
+        assert "after 2 of 5 pages" in caplog.records[0].getMessage()
+        assert len(caplog.records) == 1
+        transport.close()
+    
+    def test_zero_max_pages_fetches_nothing(self, fake_github):
+        base_url, routes = fake_github
+        routes["/repos/octocat/hello/issues"] = paged_route(base_url, "/repos/octocat/hello/issues", [[{"number": n}] for n in range(1, 6)])
+        transport = GitHubTransport()
+        
+        issues = list(transport.paginate(f"{base_url}/repos/octocat/hello/issues", params={"per_page": 1}, max_pages=0))
+        
+        assert issues == []
+        assert FakeGitHubHandler.requests_seen == []
+        transport.close()
+    
+    @pytest.mark.asyncio
+    async def test_async_client_follows_link_header(self, fake_github):
+        base_url, routes = fake_github
+        routes["/repos/octocat/hello/pulls"] = paged_route(base_url, "/repos/octocat/hello/pulls", [[{"number": n}] for n in range(1, 4)])
+        
+        async with AsyncGitHubClient("token", base_url=base_url, conditional_cache=ConditionalCache()) as client:
+            pulls = await client.get_pull_requests("octocat/hello", state="all")
+        
+        assert [pull["number"] for pull in pulls] == [1, 2, 3]
+
+
+def issue_node(number, comments, has_next_page=False):
+    return {
+        "number": number,
+        "title": f"Issue {number}",
+        "url": f"https://github.com/octocat/hello/issues/{number}",
+        "state": "OPEN",
+        "createdAt": "2024-01-01T00:00:00Z",
+        "updatedAt": "2024-01-02T00:00:00Z",
+        "assignees": {"nodes": []},
+        "labels": {"nodes": [{"name": "good first issue"}]},
+        "comments": comment_page(comments, has_next_page),
+        "timelineItems": {"nodes": [
+            {"__typename": "CrossReferencedEvent", "source": {
+                "number": 9, "title": "Fix it", "url": "https://github.com/octocat/hello/pull/9", "state": "OPEN",
+                "body": f"Fixes #{number}", "createdAt": "2024-01-03T00:00:00Z", "author": {"login": "mona"},
+            }},
+            {"__typename": "ReferencedEvent", "actor": {"login": "mona"}, "commit": {
+                "oid": "abc123", "url": "https://github.com/octocat/hello/commit/abc123",
+                "message": f"Start #{number}", "committedDate": "2024-01-04T00:00:00Z",
+            }},
+        ]},
+    }
+
+
+def comment_page(bodies, has_next_page=False):
+    return {
+        "pageInfo": {"hasNextPage": has_next_page, "endCursor": "cursor-1" if has_next_page else None},
+        "nodes": [{"author": {"login": "mona"}, "body": body, "createdAt": "2024-01-05T00:00:00Z"} for body in bodies],
+    }
+
+
+class TestBulkIssues:
+    def test_query_is_limited_to_fifty_issues(self):
+        with pytest.raises(ValueError):
+            IssueBulkQuery("octocat/hello", list(range(51)))
+    
+    @pytest.mark.asyncio
+    async def test_bulk_fetch_follows_comment_cursors(self, fake_github):
+        base_url, routes = fake_github
+        
+        def resolve(payload):
+            if "c1" in payload.get("variables", {}):
+                assert payload["variables"]["c1"] == "cursor-1"
+                return {"data": {"repository": {"i1": {"comments": comment_page(["I'll take this"])}}}}
+            return {"data": {"repository": {"i1": issue_node(1, ["first"], has_next_page=True), "i2": issue_node(2, [])}}}
+        
+        routes[("POST", "/graphql")] = resolve
+        
+        async with AsyncGitHubClient("token", base_url=base_url) as client:
+            issues = await fetch_issues_bulk_async(client.graphql, "octocat/hello", [1, 2])
+        
+        assert len(FakeGitHubHandler.requests_seen) == 2
+        assert [c["body"] for c in issues[1]["comments"]] == ["first", "I'll take this"]
+        assert issues[1]["linked_prs"][0]["user"]["login"] == "mona"
+        assert issues[2]["referenced_commits"][0]["commit"]["message"] == "Start #2"
+        assert issues[2]["labels"] == [{"name": "good first issue"}]
+
+
+SCHEMA_SDL = """
+type Query {
+  user(login: String!): User
+}
+
+type User {
+  login: String!
+}
+"""
+
+
+class TestGraphQLSchema:
+    def setup_method(self):
+        reset_schema()
+    
+    def teardown_method(self):
+        reset_schema()
+    
+    def test_schema_is_read_from_disk_without_fetching(self, tmp_path, monkeypatch):
+        path = tmp_path / "schema.graphql"
+        path.write_text(SCHEMA_SDL)
+        monkeypatch.setenv("GITHUB_SCHEMA_PATH", str(path))
+        
+        def fetch():
+            raise AssertionError("schema should come from disk")
+        
+        schema = get_schema(fetch)
+        
+        assert schema.get_type("User") is not None
+        assert get_schema(fetch) is schema
+    
+    def test_missing_schema_is_fetched_once_and_saved(self, tmp_path, monkeypatch):
+        path = tmp_path / "cache" / "schema.graphql"
+        monkeypatch.setenv("GITHUB_SCHEMA_PATH", str(path))
+        calls = []
+        
+        def fetch():
+            calls.append(1)
+            return SCHEMA_SDL
+        
+        get_schema(fetch)
+        get_schema(fetch)
+        
+        assert calls == [1]
+        assert path.read_text() == SCHEMA_SDL
+    
+    def test_expired_schema_file_is_refetched(self, tmp_path, monkeypatch):
+        path = tmp_path / "schema.graphql"
+        path.write_text("type Query { old: String }")
+        week_ago = time.time() - 8 * 86400
+        os.utime(path, (week_ago, week_ago))
+        monkeypatch.setenv("GITHUB_SCHEMA_PATH", str(path))
+        calls = []
+        
+        def fetch():
+            calls.append(1)
+            return SCHEMA_SDL
+        
+        schema = get_schema(fetch)
+        
+        assert schema.get_type("User") is not None
+        assert calls == [1]
+        assert path.read_text() == SCHEMA_SDL
+        assert get_schema(fetch) is schema
+    
+    def test_failed_refetch_keeps_the_saved_schema(self, tmp_path, monkeypatch):
+        path = tmp_path / "schema.graphql"
+        path.write_text(SCHEMA_SDL)
+        os.utime(path, (0, 0))
+        monkeypatch.setenv("GITHUB_SCHEMA_PATH", str(path))
+        
+        def fetch():
+            raise ConnectionError("GitHub unreachable")
+        
+        schema = get_schema(fetch)
+        
+        assert schema.get_type("User") is not None
+        assert get_schema(fetch) is schema
+    
+    def test_schema_in_memory_expires_with_ttl(self, tmp_path, monkeypatch):
+        path = tmp_path / "schema.graphql"
+        path.write_text("type Query { old: String }")
+        monkeypatch.setenv("GITHUB_SCHEMA_PATH", str(path))
+        monkeypatch.setenv("GITHUB_SCHEMA_TTL", "60")
+        first = get_schema(lambda: SCHEMA_SDL)
+        
+        later = time.time() + 120
+        monkeypatch.setattr(schema_module, "time", type("Clock", (), {"time": staticmethod(lambda: later)}))
+        refreshed = get_schema(lambda: SCHEMA_SDL)
+        
+        assert first.get_type("User") is None
+        assert refreshed.get_type("User") is not None
+    
+    def test_client_validates_queries_locally(self, tmp_path, monkeypatch):
+        path = tmp_path / "schema.graphql"
+        path.write_text(SCHEMA_SDL)
+        monkeypatch.setenv("GITHUB_SCHEMA_PATH", str(path))
+        client = GitHubClient(Config(github_token="token"))
+        
+        with pytest.raises(GraphQLError):
+            client._make_graphql_request("query { viewer { login } }")
+
+
+class TestCacheManager:
+    def test_counts_hits_and_misses(self):
+        cache = CacheManager(backend="memory")
+        
+        cache.set("user:octocat", {"login": "octocat"})
+        cache.get("user:octocat")
+        cache.get("user:hubot")
+        
+        assert cache.get_stats() == {"backend": "memory", "hits": 1, "misses": 1, "hit_ratio": 0.5}
+    
+    def test_serves_stale_value_while_one_refresh_runs(self):
+        cache = CacheManager(backend="memory")
+        cache.set("user:octocat", {"value": "old", "fresh_until": time.time() - 1}, 60)
+        release = threading.Event()
+        loads = []
+        
+        def load():
+            loads.append(1)
+            release.wait(5)
+            return "new"
+        
+        results = [cache.get_or_load("user:octocat", load, ttl=60, stale_ttl=60) for _ in range(5)]
+        refresh = cache.refreshing["user:octocat"]
+        release.set()
+        refresh.result(timeout=5)
+        
+        assert results == ["old"] * 5
+        assert len(loads) == 1
+        assert cache.stale_hits == 5
+        assert cache.get_or_load("user:octocat", load, ttl=60, stale_ttl=60) == "new"
+    
+    def test_blocks_on_load_past_hard_ttl(self):
+        cache = CacheManager(backend="memory")
+        cache.set("user:octocat", {"value": "old", "fresh_until": time.time() - 120}, -1)
+        
+        assert cache.get_or_load("user:octocat", lambda: "new", ttl=60, stale_ttl=60) == "new"
+        assert cache.refreshing == {}
+    
+    def test_failed_refresh_keeps_serving_stale_value(self):
+        cache = CacheManager(backend="memory")
+        cache.set("user:octocat", {"value": "old", "fresh_until": time.time() - 1}, 60)
+        
+        def fail():
+            raise ConnectionError("GitHub unavailable")
+        
+        assert cache.get_or_load("user:octocat", fail, ttl=60, stale_ttl=60) == "old"
+        cache.refresh("user:octocat", fail, 60, 60).result(timeout=5)
+        assert cache.get_or_load("user:octocat", fail, ttl=60, stale_ttl=60) == "old"
+
+
+class TestInMemoryCache:
+    def test_evicts_least_recently_used_past_entry_limit(self):
+        cache = InMemoryCache(max_entries=2)
+        
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        
+        assert cache.get("b") is None
+        assert cache.get("a") == 1 and cache.get("c") == 3
+        assert cache.get_stats()["evictions"] == 1
+    
+    def test_stays_within_byte_budget(self):
+        cache = InMemoryCache(max_bytes=2000)
+        
+        for i in range(50):
+            cache.set(f"key:{i}", "x" * 200)
+        
+        assert cache.get_stats()["bytes"] <= 2000
+        assert cache.get("key:49") == "x" * 200
+        assert cache.get("key:0") is None
+    
+    def test_explicit_zero_limits_are_not_replaced_by_defaults(self, monkeypatch):
+        monkeypatch.setenv("CACHE_MEMORY_MAX_ENTRIES", "5")
+        no_entries = InMemoryCache(max_entries=0)
+        no_bytes = InMemoryCache(max_bytes=0)
+        no_entries.set("user:octocat", {"login": "octocat"})
+        no_bytes.set("user:octocat", {"login": "octocat"})
+        
+        assert (no_entries.max_entries, InMemoryCache().max_entries) == (0, 5)
+        assert len(no_entries) == 0
+        assert len(no_bytes) == 0
+    
+    def test_honours_per_entry_ttl(self):
+        cache = CacheManager(ttl=3600, backend="memory")
+        
+        cache.set("short", 1, ttl=-1)
+        cache.set("long", 2)
+        
+        assert cache.get("short") is None
+        assert cache.get("long") == 2
+    
+    def test_sweep_expires_entries_that_are_never_read(self):
+        cache = InMemoryCache()
+        
+        cache.set("expired", "x" * 100, ttl=-1)
+        cache.set("live", 1, ttl=60)
+        cache.set("rewritten", 1, ttl=-1)
+        cache.set("rewritten", 2, ttl=60)
+        
+        assert cache.sweep() == 1
+        assert len(cache) == 2
+        assert cache.get("rewritten") == 2
+        assert cache.get_stats()["expirations"] == 1
+
+
+class TestCachedKeys:
+    class Client:
+        def __init__(self):
+            self.cache = CacheManager(backend="memory")
+            self.calls = 0
+        
+        @cached(ttl=60, scope=user_scope)
+        def get_user_events(self, username, per_page=100):
+            self.calls += 1
+            return [username, per_page]
+        
+        @cached(ttl=60, scope=repo_scope, version=2)
+        def get_repo_info(self, owner, repo):
+            self.calls += 1
+            return {"full_name": f"{owner}/{repo}"}
+    
+    def test_keys_include_function_kwargs_and_version(self):
+        key = self.Client.get_user_events.cache_key("octocat", per_page=50)
+        
+        assert key.startswith("user:octocat|gh_maintainer_dashboard.tests.test_core.TestCachedKeys.Client.get_user_events|v1.1|")
+        assert key != self.Client.get_user_events.cache_key("octocat", per_page=100)
+        assert key != self.Client.get_user_events.cache_key("octocat:50")
+        assert "|v1.2|" in self.Client.get_repo_info.cache_key("octocat", "hello")
+    
+    def test_kwargs_are_part_of_the_cached_call(self):
+        client = self.Client()
+        
+        assert client.get_user_events("octocat", per_page=50) == ["octocat", 50]
+        assert client.get_user_events("octocat") == ["octocat", 100]
+        assert client.calls == 2
+    
+    def test_invalidating_a_user_reaches_every_manager(self):
+        first, second = self.Client(), self.Client()
+        first.get_user_events("Octocat")
+        second.get_user_events("octocat")
+        second.get_user_events("hubot")
+        first.get_repo_info("octocat", "hello")
+        
+        assert invalidate_user("octocat") == 2
+        
+        second.get_user_events("hubot")
+        first.get_repo_info("octocat", "hello")
+        assert (first.calls, second.calls) == (2, 2)
+        first.get_user_events("Octocat")
+        assert first.calls == 3
+        
+        assert invalidate_repo("OctoCat", "Hello") == 1
+
+
+class TestSQLiteCache:
+    def test_entries_are_shared_between_instances(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        writer = SQLiteCache(path)
+        reader = SQLiteCache(path)
+        
+        writer.set("user:octocat", {"login": "octocat"}, ttl=60)
+        
+        assert reader.get("user:octocat") == {"login": "octocat"}
+    
+    def test_expired_entries_are_not_returned(self, tmp_path):
+        cache = SQLiteCache(str(tmp_path / "cache.sqlite3"))
+        
+        cache.set("user:octocat", {"login": "octocat"}, ttl=-1)
+        
+        assert cache.get("user:octocat") is None
+    
+    def test_eviction_keeps_cache_under_budget(self, tmp_path):
+        cache = SQLiteCache(str(tmp_path / "cache.sqlite3"), max_bytes=5000)
+        
+        for i in range(50):
+            cache.set(f"key:{i}", "x" * 200, ttl=60)
+        cache.evict()
+        
+        assert cache.size() <= 5000
+        assert cache.get("key:49") == "x" * 200
+        assert cache.get("key:0") is None
+    
+    def test_concurrent_writers(self, tmp_path):
+        cache = SQLiteCache(str(tmp_path / "cache.sqlite3"))
+        
+        def write(worker):
+            for i in range(50):
+                cache.set(f"{worker}:{i}", i, ttl=60)
+        
+        threads = [threading.Thread(target=write, args=(worker,)) for worker in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert all(cache.get(f"{worker}:49") == 49 for worker in range(4))
+    
+    def test_delete_prefix_removes_one_scope(self, tmp_path):
+        cache = SQLiteCache(str(tmp_path / "cache.sqlite3"))
+        cache.set("user:octocat|get_user", 1, ttl=60)
+        cache.set("user:octocat|get_user_events", 2, ttl=60)
+        cache.set("user:octocat2|get_user", 3, ttl=60)
+        
+        assert cache.delete_prefix("user:octocat|") == 2
+        assert cache.get("user:octocat2|get_user") == 3
+    
+    def test_cache_manager_uses_sqlite_backend(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+        
+        CacheManager(backend="sqlite").set("repo:hello", {"stars": 1}, ttl=60)
+        
+        assert CacheManager(backend="sqlite").get("repo:hello") == {"stars": 1}
+
+
+class TestRedisCache:
+    def setup_method(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        self.client = fakeredis.FakeRedis()
+        self.cache = RedisCache(self.client, compress_min_bytes=1024)
+    
+    def test_round_trips_values_in_binary_form(self):
+        self.cache.set("user:octocat", {"login": "octocat", "id": 1}, ttl=60)
+        
+        assert self.client.get("user:octocat").startswith(RedisCache.RAW)
+        assert self.cache.get("user:octocat") == {"login": "octocat", "id": 1}
+        assert 0 < self.client.ttl("user:octocat") <= 60
+    
+    def test_compresses_large_payloads(self):
+        events = [{"type": "PushEvent", "repo": {"name": "octocat/hello"}, "id": str(i)} for i in range(200)]
+        
+        self.cache.set("events:octocat", events, ttl=60)
+        
+        raw = self.client.get("events:octocat")
+        assert raw.startswith(RedisCache.COMPRESSED)
+        assert len(raw) < len(json.dumps(events)) / 4
+        assert self.cache.get("events:octocat") == events
+    
+    def test_reads_entries_written_as_json_text(self):
+        self.client.set("user:octocat", json.dumps({"login": "octocat"}))
+        
+        assert self.cache.get("user:octocat") == {"login": "octocat"}
+    
+    def test_batches_reads_and_writes(self):
+        commands = []
+        original_mget, original_pipeline = self.client.mget, self.client.pipeline
+        self.client.mget = lambda keys: commands.append("mget") or original_mget(keys)
+        self.client.pipeline = lambda **kwargs: commands.append("pipeline") or original_pipeline(**kwargs)
+        
+        self.cache.set_many({"a": 1, "b": [2]}, ttl=60)
+        
+        assert self.cache.get_many(["a", "b", "missing"]) == {"a": 1, "b": [2]}
+        assert commands == ["pipeline", "mget"]
+    
+    def test_delete_prefix_removes_one_scope(self):
+        self.cache.set_many({"repo:octocat/hello|info": 1, "repo:octocat/hello|issues": 2, "repo:octocat/hello2|info": 3},
+                            ttl=60)
+        
+        assert self.cache.delete_prefix("repo:octocat/hello|") == 2
+        assert self.cache.get("repo:octocat/hello2|info") == 3
+    
+    def test_cache_manager_connects_with_configured_settings(self, monkeypatch):
+        import fakeredis
+        import redis
+        monkeypatch.setattr(redis, "Redis", fakeredis.FakeRedis)
+        monkeypatch.setenv("REDIS_PORT", "6390")
+        monkeypatch.setenv("REDIS_DB", "3")
+        
+        cache = CacheManager(config=Config(github_token="token"), backend="redis")
+        
+        assert cache.backend == "redis"
+        connection = cache.cache.client.connection_pool.connection_kwargs
+        assert (connection["port"], connection["db"]) == (6390, 3)
+    
+    def test_prefetch_answers_cached_reads_from_one_round_trip(self):
+        class Client:
+            def __init__(self, cache):
+                self.cache = cache
+                self.calls = 0
+            
+            @cached(ttl=60)
+            def get_user(self, username):
+                self.calls += 1
+                return {"login": username}
+            
+            @cached(ttl=60)
+            def get_user_repos(self, username):
+                self.calls += 1
+                return [{"name": "hello"}]
+        
+        manager = CacheManager(backend="memory")
+        manager.cache = self.cache
+        client = Client(manager)
+        manager.set(client.get_user.cache_key("octocat"), {"login": "octocat"})
+        reads = []
+        original_get = self.client.get
+        self.client.get = lambda key: reads.append(key) or original_get(key)
+        
+        with manager.prefetch([client.get_user.cache_key("octocat"), client.get_user_repos.cache_key("octocat")]):
+            assert client.get_user("octocat") == {"login": "octocat"}
+            assert client.get_user_repos("octocat") == [{"name": "hello"}]
+            assert client.get_user_repos("octocat") == [{"name": "hello"}]
+        
+        assert reads == []
+        assert client.calls == 1
+        assert manager.get(client.get_user_repos.cache_key("octocat")) == [{"name": "hello"}]
+
+
+class TestConditionalCache:
+    def setup_method(self):
+        self.transport = GitHubTransport(conditional_cache=ConditionalCache())
+    
+    def teardown_method(self):
+        self.transport.close()
+    
+    def test_stale_entry_is_revalidated_with_etag(self, fake_github):
+        base_url, routes = fake_github
+        routes["/users/octocat"] = (200, {"ETag": '"abc"', "Cache-Control": "private, max-age=0"}, {"login": "octocat"})
+        
+        first = self.transport.get(f"{base_url}/users/octocat", headers={"Authorization": "token t"})
+        second = self.transport.get(f"{base_url}/users/octocat", headers={"Authorization": "token t"})
+        
+        assert first.json() == second.json() == {"login": "octocat"}
+        assert second.status_code == 200
+        assert self.transport.conditional_cache.get_stats()["revalidations"] == 1
+        assert self.transport.conditional_cache.get_stats()["misses"] == 1
+    
+    def test_fresh_entry_is_served_without_a_request(self, fake_github):
+        base_url, routes = fake_github
+        routes["/users/octocat"] = (200, {"ETag": '"abc"', "Cache-Control": "private, max-age=60"}, {"login": "octocat"})
+        
+        self.transport.get(f"{base_url}/users/octocat")
+        response = self.transport.get(f"{base_url}/users/octocat")
+        
+        assert response.json() == {"login": "octocat"}
+        assert self.transport.conditional_cache.get_stats()["hits"] == 1
+        assert self.transport.get_stats()["requests_sent"] == 1
+    
+    def test_retention_follows_endpoint(self):
+        cache = self.transport.conditional_cache
+        
+        assert cache.ttl_for("https://api.github.com/search/issues?q=bug") == 3600
+        assert cache.ttl_for("https://api.github.com/repos/octocat/hello/languages") == 7 * 86400
+        assert cache.ttl_for("https://api.github.com/repos/octocat/hello/issues") == cache.ttl
+    
+    def test_entries_are_not_shared_across_tokens(self, fake_github):
+        base_url, routes = fake_github
+        routes["/users/octocat"] = (200, {"ETag": '"abc"', "Cache-Control": "private, max-age=60"}, {"login": "octocat"})
+        
+        self.transport.get(f"{base_url}/users/octocat", headers={"Authorization": "token a"})
+        self.transport.get(f"{base_url}/users/octocat", headers={"Authorization": "token b"})
+        
+        assert self.transport.conditional_cache.get_stats()["misses"] == 2
+
+
+class TestAsyncGitHubClient:
+    def test_run_sync_without_a_loop(self):
+        async def answer():
+            return threading.current_thread()
+        
+        assert run_sync(answer()) is threading.current_thread()
+    
+    @pytest.mark.asyncio
+    async def test_run_sync_inside_a_running_loop(self):
+        account = start_account("run-sync", "test")
+        
+        async def answer():
+            record_call("https://api.github.com/repos/octocat/hello", 200, 10, "core", time.monotonic(), 0.0)
+            return threading.current_thread()
+        
+        # asyncio.run would raise here; the coroutine moves to a worker thread and keeps the request context
+        assert run_sync(answer()) is not threading.current_thread()
+        assert current_account() is account
+        assert account.to_dict()["upstream_calls"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_gather_bounded_limits_concurrency(self):
+        running = 0
+        peak = 0
+        
+        async def task(value):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return value
+        
+        results = await gather_bounded((task(i) for i in range(10)), limit=3)
+        
+        assert results == list(range(10))
+        assert peak == 3
+    
+    @pytest.mark.asyncio
+    async def test_iter_bounded_yields_in_completion_order(self):
+        running = 0
+        peak = 0
+        
+        async def task(value):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01 * (3 - value))
+            running -= 1
+            return value
+        
+        results = [value async for value in iter_bounded((task(i) for i in range(3)), limit=3)]
+        
+        assert results == [2, 1, 0]
+        assert peak == 3
+    
+    @pytest.mark.asyncio
+    async def test_iter_bounded_starts_work_only_as_slots_free(self):
+        started = []
+        
+        async def task(value):
+            started.append(value)
+            await asyncio.sleep(0)
+            return value
+        
+        stream = iter_bounded((task(i) for i in range(10)), limit=2)
+        first = await stream.__anext__()
+        await stream.aclose()
+        
+        assert first in (0, 1)
+        assert len(started) <= 3
+    
+    @pytest.mark.asyncio
+    async def test_iter_user_batch_reports_failures_per_user(self):
+        async def fetch(username):
+            if username == "ghost":
+                raise ValueError("Not Found")
+            return {"login": username}
+        
+        results = [result async for result in iter_user_batch(["octocat", "ghost"], fetch, limit=2)]
+        
+        assert sorted(results, key=lambda result: result["username"]) == [
+            {"username": "ghost", "success": False, "error": "Not Found"},
+            {"username": "octocat", "success": True, "data": {"login": "octocat"}},
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_search_repositories_returns_items(self, fake_github):
+        base_url, routes = fake_github
+        routes["/search/repositories"] = (200, {}, {"items": [{"full_name": "octocat/hello"}]})
+        
+        async with AsyncGitHubClient("token", base_url=base_url) as client:
+            repos = await client.search_repositories("language:python")
+        
+        assert repos == [{"full_name": "octocat/hello"}]
+    
+    @pytest.mark.asyncio
+    async def test_async_client_revalidates_with_shared_cache(self, fake_github):
+        base_url, routes = fake_github
+        routes["/repos/octocat/hello"] = (200, {"ETag": '"v1"', "Cache-Control": "max-age=0"}, {"full_name": "octocat/hello"})
+        cache = ConditionalCache()
+        
+        async with AsyncGitHubClient("token", base_url=base_url, conditional_cache=cache) as client:
+            await client.get_repo_info("octocat/hello")
+            repo = await client.get_repo_info("octocat/hello")
+        
+        assert repo == {"full_name": "octocat/hello"}
+        assert cache.get_stats()["revalidations"] == 1
+    
+    def test_shared_client_is_only_reused_on_its_own_loop(self):
+        async def lease(client):
+            async with use_client(client, "token") as leased:
+                return leased
+        
+        async def serve():
+            shared = await AsyncGitHubClient("token").open()
+            try:
+                leased = await lease(shared)
+                # A job thread runs its own loop and must not touch the shared connector
+                other = await asyncio.to_thread(asyncio.run, lease(shared))
+                return shared, leased, other
+            finally:
+                await shared.close()
+        
+        shared, leased, other = asyncio.run(serve())
+        
+        assert leased is shared
+        assert other is not shared
+        assert other._session is None
+    
+    @pytest.mark.asyncio
+    async def test_user_snapshot_fetches_misses_and_caches_them(self, fake_github, monkeypatch):
+        base_url, routes = fake_github
+        routes["/users/octocat/repos"] = (200, {}, [{"full_name": "octocat/hello"}])
+        routes["/users/octocat/events"] = (200, {}, [{"type": "PushEvent"}])
+        monkeypatch.setenv("CACHE_BACKEND", "memory")
+        github = GitHubClient(Config(github_token="token"))
+        GitHubClient.get_user.fill(github, {"login": "octocat"}, "octocat")
+        
+        async with AsyncGitHubClient("token", base_url=base_url, conditional_cache=ConditionalCache()) as client:
+            snapshot = await github.snapshot_user(client, "octocat")
+        
+        assert snapshot.get_user("octocat") == {"login": "octocat"}
+        assert snapshot.get_user_repos("octocat") == [{"full_name": "octocat/hello"}]
+        assert sorted(path.partition("?")[0] for path, headers in FakeGitHubHandler.requests_seen) == [
+            "/users/octocat/events", "/users/octocat/repos",
+        ]
+        # The sync client now answers the same reads from its cache
+        assert GitHubClient.get_user_events.peek(github, "octocat") == [{"type": "PushEvent"}]
+        with pytest.raises(KeyError):
+            snapshot.get_user("hubot")
+
+
+class TestFieldSet:
+    def test_missing_or_blank_fields_select_everything(self):
+        assert FieldSet.parse(None) is None
+        assert FieldSet.parse(" , ") is None
+        assert wants(None, "all_claimed_issues", "generated_messages")
+        assert project({"a": 1}, None) == {"a": 1}
+    
+    def test_project_keeps_listed_paths_through_lists(self):
+        fields = FieldSet.parse("summary_by_user,all_claimed_issues.issue_id")
+        data = {
+            "scan_metadata": {"repository": "octocat/hello"},
+            "summary_by_user": {"alice": 1},
+            "all_claimed_issues": [{"issue_id": 1, "generated_messages": {}}, {"issue_id": 2}],
+        }
+        
+        assert fields.project(data) == {
+            "summary_by_user": {"alice": 1},
+            "all_claimed_issues": [{"issue_id": 1}, {"issue_id": 2}],
+        }
+    
+    def test_shorter_path_selects_whole_subtree(self):
+        fields = FieldSet.parse("all_claimed_issues.issue_id,all_claimed_issues")
+        
+        assert fields.wants("all_claimed_issues", "generated_messages")
+        assert fields.child("all_claimed_issues") is None
+        assert not fields.wants("summary_by_user")
+    
+    def test_child_narrows_to_nested_fields(self):
+        fields = FieldSet.parse("all_claimed_issues.issue_id,all_claimed_issues.claimant_details.username")
+        issue = {"issue_id": 1, "claimant_details": {"username": "alice", "past_performance": []}, "health_status": "stale"}
+        
+        assert fields.child("all_claimed_issues").project(issue) == {"issue_id": 1, "claimant_details": {"username": "alice"}}
+        assert not fields.wants("all_claimed_issues", "claimant_details", "past_performance")
+
+
+class TestRequestAccounting:
+    def test_transport_attributes_calls_to_current_request(self, fake_github):
+        base_url, routes = fake_github
+        routes["/repos/octocat/hello"] = (200, {"ETag": '"v1"', "Cache-Control": "max-age=0"}, {"full_name": "octocat/hello"})
+        transport = GitHubTransport(conditional_cache=ConditionalCache())
+        
+        def handle_request():
+            account = start_account("req-1")
+            transport.get(f"{base_url}/repos/octocat/hello")
+            transport.get(f"{base_url}/repos/octocat/hello")
+            return account.to_dict()
+        
+        report = contextvars.copy_context().run(handle_request)
+        
+        assert report["upstream_calls"] == 2
+        assert report["cache"] == {"cache_hits": 0, "revalidated": 1, "misses": 1, "shared": 0}
+        assert report["rate_limit_used"] == {"core": 1}
+        assert report["endpoints"]["/repos/octocat/hello"]["bytes"] > 0
+        assert all(headers.get("X-Request-Id") == "req-1" for path, headers in FakeGitHubHandler.requests_seen)
+        assert current_account() is None
+        transport.close()
+    
+    @pytest.mark.asyncio
+    async def test_async_client_counts_cache_hits_without_calls(self, fake_github):
+        base_url, routes = fake_github
+        routes["/users/octocat"] = (200, {"ETag": '"v1"', "Cache-Control": "max-age=60"}, {"login": "octocat"})
+        account = start_account()
+        
+        async with AsyncGitHubClient("token", base_url=base_url, conditional_cache=ConditionalCache()) as client:
+            await client.get_user("octocat")
+            await client.get_user("octocat")
+        
+        report = account.to_dict()
+        assert report["upstream_calls"] == 1
+        assert report["cache"]["cache_hits"] == 1
+        assert FakeGitHubHandler.requests_seen[0][1]["X-Request-Id"] == account.request_id
+    
+    def test_call_observer_sees_responses_and_connection_errors(self, fake_github):
+        base_url, routes = fake_github
+        routes["/users/octocat"] = (200, {}, {"login": "octocat"})
+        transport = GitHubTransport(timeout=1)
+        observed = []
+        set_call_observer(lambda service, resource, status, seconds: observed.append((service, resource, status)))
+        
+        def handle_request():
+            start_account(service="dashboard")
+            transport.get(f"{base_url}/users/octocat")
+            with pytest.raises(Exception):
+                transport.get("http://127.0.0.1:1/users/octocat")
+        
+        try:
+            contextvars.copy_context().run(handle_request)
+        finally:
+            set_call_observer(None)
+        
+        assert observed == [("dashboard", "core", 200), ("dashboard", "core", None)]
+        transport.close()
@@ -31,6 +31,7 @@ setup(
         "pydantic>=2.5.0",
         "python-dotenv>=1.0.0",
         "redis>=5.0.0",
+        "orjson>=3.8.0",
         "textblob>=0.17.1",
         "nltk>=3.8.1",
         "aiohttp>=3.9.0",
@@ -39,6 +40,7 @@ setup(
         "dev": [
             "pytest>=7.4.0",
             "pytest-asyncio>=0.21.0",
+            "fakeredis>=2.20.0",
             "black>=23.0.0",
             "flake8>=6.0.0",
         ],
@@ -0,0 +1,90 @@
+import hashlib
+import re
+import time
+from threading import Lock
+from typing import Dict, Optional
+
+from gh_maintainer_dashboard.core.cache import (
+    CACHE_SCHEMA_VERSION, GLOBAL_SCOPE, CacheManager, repo_scope, scoped_key, user_scope
+)
+
+# Seconds a response stays fresh per route, following the TTLs of the upstream data it is built from
+MAX_AGES = {
+    "dashboard_profile": 1800,
+    "dashboard_repositories": 1800,
+    "dashboard_timeline": 900,
+    "dashboard_similar": 3600,
+    "dashboard_export_cv": 1800,
+    "milestones": 900,
+    "stale_claims": 300,
+    "discover": 600,
+}
+
+
+def make_etag(body: bytes) -> str:
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    # Compressed representations carry an encoding suffix on the same underlying tag
+    candidates = [re.sub(r'-(gzip|br)"$', '"', candidate.strip()) for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates or f"W/{etag}" in candidates
+
+
+def view_scope(params: Dict) -> str:
+    # Route parameters name the user or repo a response is built from, so invalidating that scope drops it too
+    if "username" in params:
+        return user_scope(params["username"])
+    if "owner" in params and "repo" in params:
+        return repo_scope(params["owner"], params["repo"])
+    return GLOBAL_SCOPE
+
+
+class ResponseCache:
+    def __init__(self, cache: Optional[CacheManager] = None):
+        self.cache = cache or CacheManager(ttl=max(MAX_AGES.values()), name="response")
+    
+    def make_key(self, key: str, scope: str) -> str:
+        return scoped_key(scope, "response", f"v{CACHE_SCHEMA_VERSION}", key)
+    
+    def get(self, key: str, scope: str = GLOBAL_SCOPE) -> Optional[Dict]:
+        entry = self.cache.get(self.make_key(key, scope))
+        if entry and entry["fresh_until"] > time.time():
+            return entry
+        return None
+    
+    def store(self, key: str, body: bytes, content_type: str, max_age: int, scope: str = GLOBAL_SCOPE) -> Dict:
+        entry = {
+            "etag": make_etag(body),
+            "body": body.decode("utf-8"),
+            "content_type": content_type,
+            "fresh_until": time.time() + max_age,
+        }
+        self.cache.set(self.make_key(key, scope), entry, max_age)
+        return entry
+    
+    def headers(self, entry: Dict) -> Dict:
+        # Clients get the remaining lifetime so a copy never outlives the one kept here
+        max_age = max(round(entry["fresh_until"] - time.time()), 0)
+        return {"ETag": entry["etag"], "Cache-Control": f"public, max-age={max_age}"}
+
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    global _response_cache
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                _response_cache = ResponseCache()
+    return _response_cache
+
+
+def set_response_cache(response_cache: Optional[ResponseCache]) -> None:
+    global _response_cache
+    with _response_cache_lock:
+        _response_cache = response_cache
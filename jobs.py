@@ -0,0 +1,187 @@
+import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from gh_maintainer_dashboard.core.accounting import RequestAccount, start_account
+from gh_maintainer_dashboard.core.cache import CacheManager
+from encoding import dumps, loads
+
+DEFAULT_WORKERS = int(os.getenv("JOB_WORKERS", "4"))
+DEFAULT_RETENTION = int(os.getenv("JOB_RETENTION", "3600"))
+
+
+class Job:
+    def __init__(self, kind: str, key: Hashable):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.key = key
+        self.status = "queued"
+        self.done = 0
+        self.total: Optional[int] = None
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.account: Optional[RequestAccount] = None
+        self.upstream: Optional[Dict] = None
+    
+    @property
+    def active(self) -> bool:
+        return self.status in ("queued", "running")
+    
+    def report_progress(self, done: int, total: int) -> None:
+        self.done = done
+        self.total = total
+    
+    def to_dict(self) -> Dict:
+        data = {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status_url": f"/api/jobs/{self.id}",
+            "status": self.status,
+            "progress": {"done": self.done, "total": self.total},
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+        }
+        if self.error is not None:
+            data["error"] = self.error
+        if self.account is not None:
+            data["upstream"] = self.account.to_dict()
+        elif self.upstream is not None:
+            data["upstream"] = self.upstream
+        if self.status == "done":
+            data["result"] = self.result
+        return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Job":
+        job = cls(data["kind"], None)
+        job.id = data["job_id"]
+        job.status = data["status"]
+        job.done = data["progress"]["done"]
+        job.total = data["progress"]["total"]
+        job.result = data.get("result")
+        job.error = data.get("error")
+        job.created_at = data["created_at"]
+        job.finished_at = data["finished_at"]
+        job.upstream = data.get("upstream")
+        return job
+
+
+class JobQueue:
+    def __init__(self, max_workers: int = DEFAULT_WORKERS, retention: int = DEFAULT_RETENTION,
+                 store: Optional[CacheManager] = None):
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scan-jobs")
+        self.retention = retention
+        # Job records and the dedupe claims live in the cache backend, so with CACHE_BACKEND=sqlite or redis
+        # any gunicorn worker can answer a status poll and duplicate submissions dedupe across workers
+        self.store = store or CacheManager(ttl=retention, name="jobs")
+        self.jobs: Dict[str, Job] = {}
+        self.active: Dict[Hashable, Job] = {}
+        self.lock = Lock()
+    
+    def _record_key(self, job_id: str) -> str:
+        return f"job:{job_id}"
+    
+    def _claim_key(self, kind: str, key: Hashable) -> str:
+        return f"job-active:{kind}:{key!r}"
+    
+    def _publish(self, job: Job) -> None:
+        self.store.set(self._record_key(job.id), dumps(job.to_dict()).decode("utf-8"), self.retention)
+    
+    def _load(self, job_id: str) -> Optional[Job]:
+        data = self.store.get(self._record_key(job_id))
+        return Job.from_dict(loads(data)) if data else None
+    
+    def submit(self, kind: str, key: Hashable, fn: Callable[[Callable[[int, int], None]], Any]) -> Job:
+        with self.lock:
+            self._prune()
+            # A scan of the same target that is still queued or running answers this request too
+            job = self.active.get((kind, key))
+            if job is not None:
+                return job
+            
+            job = Job(kind, key)
+            self._publish(job)
+            claim = self._claim_key(kind, key)
+            if not self.store.add(claim, job.id, self.retention):
+                # Another worker holds the claim; fall through to running our own only if its record is gone
+                existing = self._load(self.store.get(claim) or "")
+                if existing is not None and existing.active:
+                    self.store.delete(self._record_key(job.id))
+                    return existing
+                self.store.set(claim, job.id, self.retention)
+            
+            self.jobs[job.id] = job
+            self.active[(kind, key)] = job
+        
+        self.executor.submit(self._run, job, fn)
+        return job
+    
+    def _run(self, job: Job, fn: Callable[[Callable[[int, int], None]], Any]) -> None:
+        job.status = "running"
+        # Upstream calls made by the scan are tagged with the job id rather than the submitting request
+        job.account = start_account(job.id, service=job.kind)
+        self._publish(job)
+        
+        def report_progress(done: int, total: int) -> None:
+            job.report_progress(done, total)
+            self._publish(job)
+        
+        try:
+            job.result = fn(report_progress)
+            job.status = "done"
+        except Exception as e:
+            job.error = str(e)
+            job.status = "failed"
+        
+        with self.lock:
+            job.finished_at = time.time()
+            self.active.pop((job.kind, job.key), None)
+        
+        self._publish(job)
+        claim = self._claim_key(job.kind, job.key)
+        if self.store.get(claim) == job.id:
+            self.store.delete(claim)
+    
+    def _prune(self) -> None:
+        cutoff = time.time() - self.retention
+        for job_id in [job_id for job_id, job in self.jobs.items() if job.finished_at and job.finished_at < cutoff]:
+            del self.jobs[job_id]
+    
+    def get(self, job_id: str) -> Optional[Job]:
+        with self.lock:
+            job = self.jobs.get(job_id)
+        # Jobs started by another worker are read back from their published record
+        return job if job is not None else self._load(job_id)
+    
+    def get_stats(self) -> Dict:
+        with self.lock:
+            jobs = list(self.jobs.values())
+        return {
+            "active": len([job for job in jobs if job.active]),
+            "done": len([job for job in jobs if job.status == "done"]),
+            "failed": len([job for job in jobs if job.status == "failed"]),
+        }
+
+
+_job_queue: Optional[JobQueue] = None
+_job_queue_lock = Lock()
+
+
+def get_job_queue() -> JobQueue:
+    global _job_queue
+    if _job_queue is None:
+        with _job_queue_lock:
+            if _job_queue is None:
+                _job_queue = JobQueue()
+    return _job_queue
+
+
+def set_job_queue(job_queue: Optional[JobQueue]) -> None:
+    global _job_queue
+    with _job_queue_lock:
+        _job_queue = job_queue
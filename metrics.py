@@ -0,0 +1,114 @@
+import os
+import time
+from typing import Dict, List, Optional
+
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+from gh_maintainer_dashboard.core.accounting import set_call_observer
+from gh_maintainer_dashboard.core.cache import CacheManager, InMemoryCache, get_managers
+from gh_maintainer_dashboard.core.transport import get_transport
+from jobs import get_job_queue
+
+REGISTRY = CollectorRegistry()
+
+REQUEST_LATENCY = Histogram(
+    "api_request_duration_seconds", "Time to produce a response, by route template",
+    ["route", "method", "status"], registry=REGISTRY,
+)
+REQUESTS_IN_FLIGHT = Gauge("api_requests_in_flight", "Requests currently being handled",
+                           multiprocess_mode="livesum", registry=REGISTRY)
+UPSTREAM_LATENCY = Histogram(
+    "github_request_duration_seconds", "GitHub API call latency, by the service that made the call",
+    ["service", "resource"], registry=REGISTRY,
+)
+UPSTREAM_RESPONSES = Counter(
+    "github_responses_total", "GitHub API responses by status code; 'error' means no response arrived",
+    ["service", "status"], registry=REGISTRY,
+)
+
+
+def observe_request(route: str, method: str, status: int, started: float) -> None:
+    REQUEST_LATENCY.labels(route, method, str(status)).observe(time.perf_counter() - started)
+
+
+def observe_upstream_call(service: Optional[str], resource: str, status: Optional[int], seconds: float) -> None:
+    service = service or "none"
+    UPSTREAM_LATENCY.labels(service, resource).observe(seconds)
+    UPSTREAM_RESPONSES.labels(service, "error" if status is None else str(status)).inc()
+
+
+class StateCollector:
+    # Cache, rate-limit and job state is read only when scraped, so it costs nothing per request
+    def collect(self):
+        hits = CounterMetricFamily("cache_hits", "Cache lookups that found an entry", labels=["cache"])
+        misses = CounterMetricFamily("cache_misses", "Cache lookups that found nothing", labels=["cache"])
+        ratio = GaugeMetricFamily("cache_hit_ratio", "Share of cache lookups that found an entry", labels=["cache"])
+        stale = CounterMetricFamily("cache_stale_hits", "Expired entries served while a background refresh runs",
+                                    labels=["cache"])
+        entries = GaugeMetricFamily("cache_entries", "Entries held by in-memory caches", labels=["cache"])
+        size = GaugeMetricFamily("cache_bytes", "Approximate bytes held by in-memory caches", labels=["cache"])
+        evictions = CounterMetricFamily("cache_evictions", "Entries dropped to stay within the size budget",
+                                        labels=["cache"])
+        # Every live manager counts, including the one each GitHubClient builds, summed per name
+        managers: Dict[str, List[CacheManager]] = {}
+        for manager in get_managers():
+            managers.setdefault(manager.name, []).append(manager)
+        for name, group in sorted(managers.items()):
+            hit_count = sum(manager.hits for manager in group)
+            miss_count = sum(manager.misses for manager in group)
+            hits.add_metric([name], hit_count)
+            misses.add_metric([name], miss_count)
+            ratio.add_metric([name], round(hit_count / (hit_count + miss_count), 2) if hit_count + miss_count else 0.0)
+            stale.add_metric([name], sum(manager.stale_hits for manager in group))
+            memory = {id(manager.cache): manager.cache for manager in group if isinstance(manager.cache, InMemoryCache)}
+            if memory:
+                stats = [cache.get_stats() for cache in memory.values()]
+                entries.add_metric([name], sum(stat["entries"] for stat in stats))
+                size.add_metric([name], sum(stat["bytes"] for stat in stats))
+                evictions.add_metric([name], sum(stat["evictions"] for stat in stats))
+        yield hits
+        yield misses
+        yield ratio
+        yield stale
+        yield entries
+        yield size
+        yield evictions
+        
+        remaining = GaugeMetricFamily("github_rate_limit_remaining", "Calls left in the current rate-limit window",
+                                      labels=["token", "resource"])
+        reset = GaugeMetricFamily("github_rate_limit_reset_seconds", "Seconds until the rate-limit window resets",
+                                  labels=["token", "resource"])
+        for token, token_stats in get_transport().token_pool.get_stats()["tokens"].items():
+            for resource, bucket in token_stats["buckets"].items():
+                remaining.add_metric([token, resource], bucket["remaining"])
+                reset.add_metric([token, resource], bucket["reset_in_seconds"])
+        yield remaining
+        yield reset
+        
+        jobs = GaugeMetricFamily("background_jobs", "Retained background jobs by state", labels=["state"])
+        for state, count in get_job_queue().get_stats().items():
+            jobs.add_metric([state], count)
+        yield jobs
+
+
+STATE_COLLECTOR = StateCollector()
+REGISTRY.register(STATE_COLLECTOR)
+set_call_observer(observe_upstream_call)
+
+
+def render() -> bytes:
+    if not os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        return generate_latest(REGISTRY)
+    # Under gunicorn each worker writes its request and upstream metrics to the shared directory and
+    # any worker's scrape sums them; cache, rate-limit and job state is the scraped worker's own view
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    registry.register(STATE_COLLECTOR)
+    return generate_latest(registry)
+
+
+def mark_worker_exited(pid: int) -> None:
+    # Call from gunicorn's child_exit hook so live gauges drop the exited worker's values
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        multiprocess.mark_process_dead(pid)
@@ -1,10 +1,14 @@
 from .milestone_detector import MilestoneDetector
 from .post_generator import PostGenerator
 from .cli_formatter import CLIFormatter
-from typing import Dict, List
+from gh_maintainer_dashboard.core.async_client import AsyncGitHubClient, iter_user_batch, use_client
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional
+import asyncio
 
 class MilestoneCelebrations:
-    def __init__(self, github_token: str = None):
+    def __init__(self, github_token: str = None, async_client: Optional[AsyncGitHubClient] = None):
+        self.github_token = github_token
+        self.async_client = async_client
         self.detector = MilestoneDetector(github_token)
         self.post_generator = PostGenerator()
         self.formatter = CLIFormatter()
@@ -43,6 +47,68 @@ class MilestoneCelebrations:
             "total_sections": len(sections)
         }
     
+    async def get_milestone_sections_async(self, username: str, repos: List[str] = None) -> Dict:
+        async with use_client(self.async_client, self.github_token) as client:
+            return await self._milestone_sections_async(
+                client, username, repos, lambda repo: self.detector.detect_repo_milestones_async(client, repo)
+            )
+    
+    async def get_milestone_sections_batch(self, usernames: List[str], repos: List[str] = None,
+                                           concurrency: int = 5) -> AsyncIterator[Dict]:
+        async with use_client(self.async_client, self.github_token) as client:
+            # Repository milestones are the same for every user, so the batch fetches each repo once
+            repo_milestones = {}
+            
+            def repo_milestones_for(repo: str) -> Awaitable[List[Dict]]:
+                if repo not in repo_milestones:
+                    repo_milestones[repo] = asyncio.ensure_future(self.detector.detect_repo_milestones_async(client, repo))
+                return repo_milestones[repo]
+            
+            async for result in iter_user_batch(
+                usernames,
+                lambda username: self._milestone_sections_async(client, username, repos, repo_milestones_for),
+                limit=concurrency,
+            ):
+                yield result
+    
+    async def _milestone_sections_async(self, client: AsyncGitHubClient, username: str, repos: Optional[List[str]],
+                                        repo_milestones_for: Callable[[str], Awaitable[List[Dict]]]) -> Dict:
+        # Each search result feeds both the achieved and the upcoming milestones, so fetch it once
+        async def repo_section(repo: str) -> Dict:
+            (pr_count, issue_count), repo_milestones = await asyncio.gather(
+                self.detector.get_user_counts_async(client, username, repo),
+                repo_milestones_for(repo),
+            )
+            return {
+                "type": "repository",
+                "repo": repo,
+                "milestones": self.detector.milestones_from_counts(pr_count, issue_count) + repo_milestones,
+                "upcoming": self.detector.predictions_from_counts(pr_count, issue_count)
+            }
+        
+        (pr_count, issue_count), *repo_sections = await asyncio.gather(
+            self.detector.get_user_counts_async(client, username),
+            *(repo_section(repo) for repo in repos or []),
+        )
+        
+        sections = {
+            "Personal Achievements": {
+                "type": "personal",
+                "username": username,
+                "milestones": self.detector.milestones_from_counts(pr_count, issue_count),
+                "upcoming": self.detector.predictions_from_counts(pr_count, issue_count)
+            }
+        }
+        for repo, section in zip(repos or [], repo_sections):
+            repo_name = repo.split("/")[-1] if "/" in repo else repo
+            sections[f"Repository: {repo_name}"] = section
+        
+        return {
+            "username": username,
+            "sections": sections,
+            "total_sections": len(sections)
+        }
+    
     def display_milestone_table(self, username: str, repos: List[str] = None) -> str:
         data = self.get_milestone_sections(username, repos)
         return self.formatter.format_milestones_table(data)
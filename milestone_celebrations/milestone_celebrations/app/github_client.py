@@ -1,5 +1,5 @@
-import requests
 from typing import Dict, List
+from gh_maintainer_dashboard.core.transport import get_transport
 from .config import Config
 
 class GitHubClient:
@@ -10,6 +10,7 @@ class GitHubClient:
             "Authorization": f"token {self.token}",
             "Accept": "application/vnd.github.v3+json"
         }
+        self.transport = get_transport()
     
     def get_user_prs(self, username: str, repo: str = None) -> List[Dict]:
         url = f"{self.base_url}/search/issues"
@@ -18,7 +19,7 @@ class GitHubClient:
             query += f" repo:{repo}"
         
         params = {"q": query, "per_page": 100}
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self.transport.get(url, headers=self.headers, params=params)
         response.raise_for_status()
         return response.json().get("items", [])
     
@@ -29,12 +30,12 @@ class GitHubClient:
             query += f" repo:{repo}"
         
         params = {"q": query, "per_page": 100}
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self.transport.get(url, headers=self.headers, params=params)
         response.raise_for_status()
         return response.json().get("items", [])
     
     def get_repo_stats(self, repo: str) -> Dict:
         url = f"{self.base_url}/repos/{repo}"
-        response = requests.get(url, headers=self.headers)
+        response = self.transport.get(url, headers=self.headers)
         response.raise_for_status()
         return response.json()
@@ -1,5 +1,7 @@
-from typing import Dict, List
+import asyncio
+from typing import Dict, List, Tuple
 from datetime import datetime
+from gh_maintainer_dashboard.core.async_client import AsyncGitHubClient
 from .github_client import GitHubClient
 from .config import Config
 
@@ -9,23 +11,29 @@ class MilestoneDetector:
         self.config = Config()
     
     def detect_user_milestones(self, username: str, repo: str = None) -> List[Dict]:
-        milestones = []
-        
         prs = self.client.get_user_prs(username, repo)
-        pr_count = len(prs)
-        milestones.extend(self._check_threshold("pr_merged", pr_count))
-        
         issues = self.client.get_user_issues(username, repo)
-        issue_count = len(issues)
+        return self.milestones_from_counts(len(prs), len(issues))
+    
+    async def get_user_counts_async(self, client: AsyncGitHubClient, username: str, repo: str = None) -> Tuple[int, int]:
+        prs, issues = await asyncio.gather(client.get_user_prs(username, repo), client.get_user_issues(username, repo))
+        return len(prs), len(issues)
+    
+    def milestones_from_counts(self, pr_count: int, issue_count: int) -> List[Dict]:
+        milestones = []
+        milestones.extend(self._check_threshold("pr_merged", pr_count))
         milestones.extend(self._check_threshold("issues", issue_count))
-        
         return milestones
     
     def detect_repo_milestones(self, repo: str) -> List[Dict]:
+        return self._repo_milestones(self.client.get_repo_stats(repo))
+    
+    async def detect_repo_milestones_async(self, client: AsyncGitHubClient, repo: str) -> List[Dict]:
+        return self._repo_milestones(await client.get_repo_stats(repo))
+    
+    def _repo_milestones(self, repo_data: Dict) -> List[Dict]:
         milestones = []
         
-        repo_data = self.client.get_repo_stats(repo)
-        
         stars = repo_data.get("stargazers_count", 0)
         milestones.extend(self._check_threshold("stars", stars))
         
@@ -35,13 +43,12 @@ class MilestoneDetector:
         return milestones
     
     def predict_next_milestones(self, username: str, repo: str = None) -> List[Dict]:
-        predictions = []
-        
         prs = self.client.get_user_prs(username, repo)
-        pr_count = len(prs)
-        
         issues = self.client.get_user_issues(username, repo)
-        issue_count = len(issues)
+        return self.predictions_from_counts(len(prs), len(issues))
+    
+    def predictions_from_counts(self, pr_count: int, issue_count: int) -> List[Dict]:
+        predictions = []
         
         next_pr = self._find_next_threshold("pr_merged", pr_count)
         if next_pr:
@@ -8,5 +8,6 @@ setup(
     install_requires=[
         "requests>=2.31.0",
         "python-dotenv>=1.0.0",
+        "gh_maintainer_dashboard>=0.1.0",
     ],
 )
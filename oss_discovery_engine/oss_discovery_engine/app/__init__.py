@@ -3,54 +3,95 @@ from .ai_predictor import AIPredictor
 from .repo_searcher import RepoSearcher
 from .match_scorer import MatchScorer
 from .health_analyzer import HealthAnalyzer
-from .github_client import GitHubClient
-from typing import Dict, List
+from gh_maintainer_dashboard.core.async_client import AsyncGitHubClient, gather_bounded, run_sync, use_client
+from gh_maintainer_dashboard.core.projection import FieldSet, wants
+from typing import Callable, Dict, List, Optional
 
 class OSSDiscoveryEngine:
-    def __init__(self, github_token: str = None):
+    def __init__(self, github_token: str = None, concurrency: int = 10,
+                 async_client: Optional[AsyncGitHubClient] = None):
+        self.github_token = github_token
+        self.async_client = async_client
+        self.concurrency = concurrency
         self.profile_analyzer = ProfileAnalyzer(github_token)
         self.ai_predictor = AIPredictor()
         self.repo_searcher = RepoSearcher(github_token)
         self.match_scorer = MatchScorer()
         self.health_analyzer = HealthAnalyzer(github_token)
-        self.github_client = GitHubClient(github_token)
     
     def discover_projects(self, username: str, intent: str = "solve_issues", 
-                         query: str = "", filters: Dict = None, limit: int = 10) -> Dict:
+                         query: str = "", filters: Dict = None, limit: int = 10,
+                         progress_callback: Optional[Callable[[int, int], None]] = None,
+                         fields: Optional[FieldSet] = None) -> Dict:
+        return run_sync(self.discover_projects_async(username, intent, query, filters, limit, progress_callback, fields))
+    
+    async def discover_projects_async(self, username: str, intent: str = "solve_issues",
+                                      query: str = "", filters: Dict = None, limit: int = 10,
+                                      progress_callback: Optional[Callable[[int, int], None]] = None,
+                                      fields: Optional[FieldSet] = None) -> Dict:
+        need_health = wants(fields, "recommended_projects", "health_metrics")
+        need_issues = intent == "solve_issues" and (wants(fields, "recommended_projects", "recommended_issues")
+                                                    or wants(fields, "recommended_projects", "why_recommended"))
+        
         print(f"\n{'='*80}")
         print(f"  🔍 OSS DISCOVERY ENGINE")
         print(f"{'='*80}\n")
         
-        user_profile = self.profile_analyzer.analyze_user_profile(username)
-        
-        print("Predicting capabilities with AI...")
-        ai_predictions = self.ai_predictor.predict_capabilities(user_profile)
-        
-        repos = self.repo_searcher.search_repos(user_profile, intent, query, filters)
-        
-        print(f"Scoring and ranking {len(repos)} repositories...\n")
-        
-        scored_repos = []
-        
-        for idx, repo in enumerate(repos[:limit], 1):
-            print(f"  [{idx}/{min(limit, len(repos))}] Analyzing {repo['full_name']}...")
+        async with use_client(self.async_client, self.github_token) as client:
+            user_profile = await self.profile_analyzer.analyze_user_profile_async(client, username)
             
-            match_result = self.match_scorer.calculate_match_score(repo, user_profile, intent)
+            print("Predicting capabilities with AI...")
+            ai_predictions = self.ai_predictor.predict_capabilities(user_profile)
             
-            health_metrics = self.health_analyzer.analyze_repo_health(repo["full_name"])
+            repos = await self.repo_searcher.search_repos_async(client, user_profile, intent, query, filters)
             
-            recommended_issues = []
-            if intent == "solve_issues":
-                recommended_issues = self._get_recommended_issues(repo["full_name"], user_profile)
+            print(f"Scoring and ranking {len(repos)} repositories...\n")
             
-            scored_repos.append({
-                "repo": repo,
-                "match_score": match_result["total_score"],
-                "match_breakdown": match_result["breakdown"],
-                "match_reasons": match_result["match_reasons"],
-                "health_metrics": health_metrics,
-                "recommended_issues": recommended_issues
-            })
+            analyzed = 0
+            if progress_callback:
+                progress_callback(0, len(repos[:limit]))
+            
+            async def score(repo: Dict) -> Dict:
+                match_result = self.match_scorer.calculate_match_score(repo, user_profile, intent)
+                
+                # Good-first-issue listings feed both the health check and the recommendations
+                good_first_issues = None
+                if need_health or need_issues:
+                    try:
+                        # One page is plenty: three are recommended and the health check only needs to know any exist
+                        good_first_issues = await client.get_repo_issues(
+                            repo["full_name"], labels="good first issue", state="open", max_pages=1
+                        )
+                    except Exception as e:
+                        good_first_issues = e
+                
+                health_metrics = None
+                if need_health:
+                    health_metrics = await self.health_analyzer.analyze_repo_health_async(
+                        client, repo["full_name"], good_first_issues=good_first_issues
+                    )
+                
+                recommended_issues = []
+                if need_issues and not isinstance(good_first_issues, Exception):
+                    recommended_issues = self._format_recommended_issues(good_first_issues)
+                
+                print(f"  Analyzed {repo['full_name']}")
+                
+                nonlocal analyzed
+                analyzed += 1
+                if progress_callback:
+                    progress_callback(analyzed, len(repos[:limit]))
+                
+                return {
+                    "repo": repo,
+                    "match_score": match_result["total_score"],
+                    "match_breakdown": match_result["breakdown"],
+                    "match_reasons": match_result["match_reasons"],
+                    "health_metrics": health_metrics,
+                    "recommended_issues": recommended_issues
+                }
+            
+            scored_repos = await gather_bounded((score(repo) for repo in repos[:limit]), limit=self.concurrency)
         
         scored_repos.sort(key=lambda x: x["match_score"], reverse=True)
         
@@ -72,28 +113,19 @@ class OSSDiscoveryEngine:
             }
         }
     
-    def _get_recommended_issues(self, repo_full_name: str, user_profile: Dict, limit: int = 3) -> List[Dict]:
-        try:
-            issues = self.github_client.get_repo_issues(
-                repo_full_name, 
-                labels="good first issue",
-                state="open"
-            )
-            
-            recommended = []
-            
-            for issue in issues[:limit]:
-                recommended.append({
-                    "number": issue["number"],
-                    "title": issue["title"],
-                    "url": issue["html_url"],
-                    "labels": [label["name"] for label in issue.get("labels", [])],
-                    "created_at": issue["created_at"]
-                })
-            
-            return recommended
-        except:
-            return []
+    def _format_recommended_issues(self, issues: List[Dict], limit: int = 3) -> List[Dict]:
+        recommended = []
+        
+        for issue in issues[:limit]:
+            recommended.append({
+                "number": issue["number"],
+                "title": issue["title"],
+                "url": issue["html_url"],
+                "labels": [label["name"] for label in issue.get("labels", [])],
+                "created_at": issue["created_at"]
+            })
+        
+        return recommended
     
     def _format_recommendations(self, scored_repos: List[Dict]) -> List[Dict]:
         formatted = []
@@ -1,5 +1,5 @@
-import requests
 from typing import Dict, List, Optional
+from gh_maintainer_dashboard.core.transport import get_transport
 from .config import Config
 
 class GitHubClient:
@@ -10,26 +10,23 @@ class GitHubClient:
             "Authorization": f"token {self.token}",
             "Accept": "application/vnd.github.v3+json"
         }
+        self.transport = get_transport()
     
     def get_user_profile(self, username: str) -> Dict:
         url = f"{self.base_url}/users/{username}"
-        response = requests.get(url, headers=self.headers)
+        response = self.transport.get(url, headers=self.headers)
         response.raise_for_status()
         return response.json()
     
     def get_user_repos(self, username: str) -> List[Dict]:
         url = f"{self.base_url}/users/{username}/repos"
         params = {"per_page": 100, "sort": "updated"}
-        response = requests.get(url, headers=self.headers, params=params)
-        response.raise_for_status()
-        return response.json()
+        return list(self.transport.paginate(url, headers=self.headers, params=params))
     
     def get_user_events(self, username: str) -> List[Dict]:
         url = f"{self.base_url}/users/{username}/events"
         params = {"per_page": 100}
-        response = requests.get(url, headers=self.headers, params=params)
-        response.raise_for_status()
-        return response.json()
+        return list(self.transport.paginate(url, headers=self.headers, params=params))
     
     def search_repositories(self, query: str, language: str = None, 
                            sort: str = "stars", per_page: int = 30) -> List[Dict]:
@@ -45,45 +42,42 @@ class GitHubClient:
             "per_page": per_page
         }
         
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self.transport.get(url, headers=self.headers, params=params)
         response.raise_for_status()
         return response.json().get("items", [])
     
-    def get_repo_issues(self, repo: str, labels: str = None, state: str = "open") -> List[Dict]:
+    def get_repo_issues(self, repo: str, labels: str = None, state: str = "open",
+                        max_pages: Optional[int] = None) -> List[Dict]:
         url = f"{self.base_url}/repos/{repo}/issues"
         params = {"state": state, "per_page": 100}
         if labels:
             params["labels"] = labels
         
-        response = requests.get(url, headers=self.headers, params=params)
-        response.raise_for_status()
-        return response.json()
+        return list(self.transport.paginate(url, headers=self.headers, params=params, max_pages=max_pages))
     
     def get_repo_details(self, repo: str) -> Dict:
         url = f"{self.base_url}/repos/{repo}"
-        response = requests.get(url, headers=self.headers)
+        response = self.transport.get(url, headers=self.headers)
         response.raise_for_status()
         return response.json()
     
     def get_repo_languages(self, repo: str) -> Dict:
         url = f"{self.base_url}/repos/{repo}/languages"
-        response = requests.get(url, headers=self.headers)
+        response = self.transport.get(url, headers=self.headers)
         response.raise_for_status()
         return response.json()
     
     def get_repo_contributors(self, repo: str) -> List[Dict]:
         url = f"{self.base_url}/repos/{repo}/contributors"
         params = {"per_page": 30}
-        response = requests.get(url, headers=self.headers, params=params)
+        response = self.transport.get(url, headers=self.headers, params=params)
         response.raise_for_status()
         return response.json()
     
-    def get_repo_commits(self, repo: str, since: str = None) -> List[Dict]:
+    def get_repo_commits(self, repo: str, since: str = None, max_pages: Optional[int] = None) -> List[Dict]:
         url = f"{self.base_url}/repos/{repo}/commits"
         params = {"per_page": 100}
         if since:
             params["since"] = since
         
-        response = requests.get(url, headers=self.headers, params=params)
-        response.raise_for_status()
-        return response.json()
+        return list(self.transport.paginate(url, headers=self.headers, params=params, max_pages=max_pages))
@@ -1,5 +1,7 @@
+import asyncio
 from typing import Dict, List
 from datetime import datetime, timedelta, timezone
+from gh_maintainer_dashboard.core.async_client import AsyncGitHubClient
 from .github_client import GitHubClient
 from .config import Config
 
@@ -14,46 +16,94 @@ class HealthAnalyzer:
             
             recent_commits = self._check_recent_activity(repo_full_name)
             maintainer_responsiveness = self._estimate_responsiveness(repo_full_name)
-            community_activity = self._assess_community_activity(repo_details)
             beginner_friendly = self._check_beginner_friendliness(repo_full_name, repo_details)
             
-            overall_health = self._calculate_overall_health(
-                recent_commits, maintainer_responsiveness, 
-                community_activity, beginner_friendly
+            return self._build_health(repo_details, recent_commits, maintainer_responsiveness, beginner_friendly)
+        except Exception as e:
+            return self._unknown_health(e)
+    
+    async def analyze_repo_health_async(self, client: AsyncGitHubClient, repo_full_name: str,
+                                        good_first_issues: List[Dict] = None) -> Dict:
+        fetches = [
+            client.get_repo_details(repo_full_name),
+            client.get_repo_commits(repo_full_name, since=self._thirty_days_ago(), max_pages=1),
+            client.get_repo_issues(repo_full_name, state="closed", max_pages=1),
+        ]
+        if good_first_issues is None:
+            fetches.append(client.get_repo_issues(repo_full_name, labels="good first issue", max_pages=1))
+        
+        results = await asyncio.gather(*fetches, return_exceptions=True)
+        repo_details, commits, closed_issues = results[:3]
+        if good_first_issues is None:
+            good_first_issues = results[3]
+        
+        if isinstance(repo_details, Exception):
+            return self._unknown_health(repo_details)
+        
+        try:
+            recent_commits = not isinstance(commits, Exception) and len(commits) > 0
+            maintainer_responsiveness = (
+                "unknown" if isinstance(closed_issues, Exception)
+                else self._responsiveness_from_issues(closed_issues[:10])
+            )
+            beginner_friendly = (
+                False if isinstance(good_first_issues, Exception)
+                else self._beginner_friendly_from_issues(good_first_issues, repo_details)
             )
             
-            return {
-                "maintainer_responsiveness": maintainer_responsiveness,
-                "community_activity": community_activity,
-                "recent_activity": recent_commits,
-                "beginner_friendly": beginner_friendly,
-                "overall_health": overall_health,
-                "has_contributing_guide": self._has_file(repo_details, "CONTRIBUTING"),
-                "has_code_of_conduct": self._has_file(repo_details, "CODE_OF_CONDUCT"),
-                "has_license": repo_details.get("license") is not None
-            }
+            return self._build_health(repo_details, recent_commits, maintainer_responsiveness, beginner_friendly)
         except Exception as e:
-            return {
-                "maintainer_responsiveness": "unknown",
-                "community_activity": "unknown",
-                "recent_activity": False,
-                "beginner_friendly": False,
-                "overall_health": "unknown",
-                "error": str(e)
-            }
+            return self._unknown_health(e)
+    
+    def _build_health(self, repo_details: Dict, recent_commits: bool, maintainer_responsiveness: str,
+                      beginner_friendly: bool) -> Dict:
+        community_activity = self._assess_community_activity(repo_details)
+        
+        overall_health = self._calculate_overall_health(
+            recent_commits, maintainer_responsiveness, 
+            community_activity, beginner_friendly
+        )
+        
+        return {
+            "maintainer_responsiveness": maintainer_responsiveness,
+            "community_activity": community_activity,
+            "recent_activity": recent_commits,
+            "beginner_friendly": beginner_friendly,
+            "overall_health": overall_health,
+            "has_contributing_guide": self._has_file(repo_details, "CONTRIBUTING"),
+            "has_code_of_conduct": self._has_file(repo_details, "CODE_OF_CONDUCT"),
+            "has_license": repo_details.get("license") is not None
+        }
+    
+    def _unknown_health(self, error: Exception) -> Dict:
+        return {
+            "maintainer_responsiveness": "unknown",
+            "community_activity": "unknown",
+            "recent_activity": False,
+            "beginner_friendly": False,
+            "overall_health": "unknown",
+            "error": str(error)
+        }
+    
+    def _thirty_days_ago(self) -> str:
+        return (datetime.now(timezone.utc) - timedelta(days=30)).isoformat()
     
     def _check_recent_activity(self, repo: str) -> bool:
         try:
-            thirty_days_ago = (datetime.now(timezone.utc) - timedelta(days=30)).isoformat()
-            commits = self.client.get_repo_commits(repo, since=thirty_days_ago)
+            commits = self.client.get_repo_commits(repo, since=self._thirty_days_ago(), max_pages=1)
             return len(commits) > 0
         except:
             return False
     
     def _estimate_responsiveness(self, repo: str) -> str:
         try:
-            issues = self.client.get_repo_issues(repo, state="closed")[:10]
-            
+            issues = self.client.get_repo_issues(repo, state="closed", max_pages=1)[:10]
+        except:
+            return "unknown"
+        return self._responsiveness_from_issues(issues)
+    
+    def _responsiveness_from_issues(self, issues: List[Dict]) -> str:
+        try:
             if not issues:
                 return "unknown"
             
@@ -97,16 +147,18 @@ class HealthAnalyzer:
     
     def _check_beginner_friendliness(self, repo: str, repo_details: Dict) -> bool:
         try:
-            issues = self.client.get_repo_issues(repo, labels="good first issue")
-            
-            has_good_first_issues = len(issues) > 0
-            has_description = repo_details.get("description") is not None
-            has_topics = len(repo_details.get("topics", [])) > 0
-            
-            return has_good_first_issues or (has_description and has_topics)
+            issues = self.client.get_repo_issues(repo, labels="good first issue", max_pages=1)
+            return self._beginner_friendly_from_issues(issues, repo_details)
         except:
             return False
     
+    def _beginner_friendly_from_issues(self, issues: List[Dict], repo_details: Dict) -> bool:
+        has_good_first_issues = len(issues) > 0
+        has_description = repo_details.get("description") is not None
+        has_topics = len(repo_details.get("topics", [])) > 0
+        
+        return has_good_first_issues or (has_description and has_topics)
+    
     def _has_file(self, repo_details: Dict, filename: str) -> bool:
         return True
     
@@ -1,5 +1,7 @@
+import asyncio
 from typing import Dict, List
 from datetime import datetime, timedelta, timezone
+from gh_maintainer_dashboard.core.async_client import AsyncGitHubClient
 from .github_client import GitHubClient
 from .config import Config
 
@@ -15,6 +17,20 @@ class ProfileAnalyzer:
         repos = self.client.get_user_repos(username)
         events = self.client.get_user_events(username)
         
+        return self._build_profile(username, user_info, repos, events)
+    
+    async def analyze_user_profile_async(self, client: AsyncGitHubClient, username: str) -> Dict:
+        print(f"Analyzing GitHub profile: @{username}...")
+        
+        user_info, repos, events = await asyncio.gather(
+            client.get_user_profile(username),
+            client.get_user_repos(username, sort="updated"),
+            client.get_user_events(username),
+        )
+        
+        return self._build_profile(username, user_info, repos, events)
+    
+    def _build_profile(self, username: str, user_info: Dict, repos: List[Dict], events: List[Dict]) -> Dict:
         languages = self._extract_languages(repos)
         topics = self._extract_topics(repos)
         contribution_stats = self._calculate_contributions(events)
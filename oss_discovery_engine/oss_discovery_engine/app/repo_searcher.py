@@ -1,4 +1,5 @@
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
+from gh_maintainer_dashboard.core.async_client import AsyncGitHubClient
 from .github_client import GitHubClient
 from .config import Config
 
@@ -9,32 +10,52 @@ class RepoSearcher:
     
     def search_repos(self, user_profile: Dict, intent: str, query: str = "", 
                      filters: Dict = None) -> List[Dict]:
+        repos = []
+        for search_query in self._search_queries(user_profile, intent, query, filters):
+            repos = self.client.search_repositories(search_query, per_page=50)
+            if self._found(repos):
+                break
+        return self._filter_results(repos, intent, filters)
+    
+    async def search_repos_async(self, client: AsyncGitHubClient, user_profile: Dict, intent: str,
+                                 query: str = "", filters: Dict = None) -> List[Dict]:
+        repos = []
+        for search_query in self._search_queries(user_profile, intent, query, filters):
+            repos = await client.search_repositories(search_query, per_page=50)
+            if self._found(repos):
+                break
+        return self._filter_results(repos, intent, filters)
+    
+    def _search_queries(self, user_profile: Dict, intent: str, query: str = "",
+                        filters: Dict = None) -> Iterator[str]:
+        # The tailored query first; the broad fallback is only pulled when it finds nothing
         print(f"\nSearching repositories for intent: {intent}...")
         
-        languages = user_profile["analyzed_skills"]["languages"]
-        primary_language = list(languages.keys())[0] if languages else "Python"
-        
+        primary_language = self._primary_language(user_profile)
         search_query = self._build_search_query(query, intent, primary_language, filters)
-        
         print(f"Search query: {search_query}")
+        yield search_query
         
-        repos = self.client.search_repositories(search_query, per_page=50)
-        
+        print("No results. Trying broader search...")
+        search_query = f"language:{primary_language} stars:>100"
+        print(f"Fallback query: {search_query}")
+        yield search_query
+    
+    def _found(self, repos: List[Dict]) -> bool:
         print(f"Found {len(repos)} repositories.")
-        
-        if len(repos) == 0:
-            print("No results. Trying broader search...")
-            search_query = f"language:{primary_language} stars:>100"
-            print(f"Fallback query: {search_query}")
-            repos = self.client.search_repositories(search_query, per_page=50)
-            print(f"Found {len(repos)} repositories with fallback.\n")
-        
+        return len(repos) > 0
+    
+    def _filter_results(self, repos: List[Dict], intent: str, filters: Dict = None) -> List[Dict]:
         filtered_repos = self._apply_intent_filters(repos, intent, filters)
         
         print(f"After filtering: {len(filtered_repos)} repositories.\n")
         
         return filtered_repos
     
+    def _primary_language(self, user_profile: Dict) -> str:
+        languages = user_profile["analyzed_skills"]["languages"]
+        return list(languages.keys())[0] if languages else "Python"
+    
     def _build_search_query(self, query: str, intent: str, language: str = None, 
                            filters: Dict = None) -> str:
         search_parts = []
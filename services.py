@@ -0,0 +1,109 @@
+import os
+from threading import Lock
+from typing import Any, Callable, Dict, Optional
+
+from gh_maintainer_dashboard import MaintainerDashboard
+from gh_maintainer_dashboard.core.async_client import AsyncGitHubClient
+from gh_maintainer_dashboard.core.accounting import current_account
+from milestone_celebrations import MilestoneCelebrations
+from cookie_licking_detector import CookieLickingDetector
+from oss_discovery_engine import OSSDiscoveryEngine
+
+SERVICE_CLASSES = {
+    "dashboard": MaintainerDashboard,
+    "milestones": MilestoneCelebrations,
+    "stale_claims": CookieLickingDetector,
+    "discovery": OSSDiscoveryEngine,
+}
+
+API_INDEX = {
+    "status": "API Running",
+    "version": "1.0.0",
+    "endpoints": {
+        "dashboard": {
+            "profile": "/api/dashboard/:username/profile",
+            "repositories": "/api/dashboard/:username/repositories",
+            "timeline": "/api/dashboard/:username/timeline",
+            "similar": "/api/dashboard/:username/similar",
+            "export_cv": "/api/dashboard/:username/export-cv",
+            "profiles_batch": "POST /api/dashboard/profiles/batch"
+        },
+        "milestones": "/api/milestones/:username",
+        "milestones_batch": "POST /api/milestones/batch",
+        "stale_claims": "/api/stale-claims/:owner/:repo",
+        "stale_claims_stream": "/api/stale-claims/:owner/:repo/stream?format=ndjson|sse",
+        "discovery": "/api/discover/:username",
+        "jobs": {
+            "stale_claims": "POST /api/stale-claims/:owner/:repo/jobs",
+            "discovery": "POST /api/discover/:username/jobs",
+            "status": "/api/jobs/:job_id"
+        },
+        "metrics": "/metrics"
+    },
+    "fields": "?fields=summary_by_user,all_claimed_issues.issue_details.number returns only the listed (dotted) fields"
+}
+
+
+class ServiceRegistry:
+    def __init__(self, factories: Dict[str, Callable[[], Any]]):
+        self.factories = dict(factories)
+        self.instances: Dict[str, Any] = {}
+        self.lock = Lock()
+    
+    def get(self, name: str) -> Any:
+        # Every route resolves its service here, so this labels the request's upstream calls
+        account = current_account()
+        if account is not None and account.service is None:
+            account.service = name
+        
+        service = self.instances.get(name)
+        if service is None:
+            with self.lock:
+                # Two requests racing on a cold worker must still end up sharing one instance
+                service = self.instances.get(name)
+                if service is None:
+                    service = self.factories[name]()
+                    self.instances[name] = service
+        return service
+    
+    def override(self, name: str, service: Any) -> None:
+        with self.lock:
+            self.instances[name] = service
+    
+    def reset(self, name: Optional[str] = None) -> None:
+        with self.lock:
+            if name is None:
+                self.instances.clear()
+            else:
+                self.instances.pop(name, None)
+    
+    def get_stats(self) -> Dict:
+        with self.lock:
+            built = sorted(self.instances)
+        return {"registered": sorted(self.factories), "built": built}
+
+
+def default_registry(token: Optional[str] = None, async_client: Optional[AsyncGitHubClient] = None) -> ServiceRegistry:
+    token = token or os.getenv("GITHUB_TOKEN")
+    return ServiceRegistry({
+        name: (lambda cls=cls: cls(token, async_client=async_client)) for name, cls in SERVICE_CLASSES.items()
+    })
+
+
+_registry: Optional[ServiceRegistry] = None
+_registry_lock = Lock()
+
+
+def get_registry() -> ServiceRegistry:
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = default_registry()
+    return _registry
+
+
+def set_registry(registry: Optional[ServiceRegistry]) -> None:
+    global _registry
+    with _registry_lock:
+        _registry = registry
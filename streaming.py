@@ -0,0 +1,35 @@
+from typing import Dict, Optional
+
+from encoding import dumps
+from gh_maintainer_dashboard.core.projection import FieldSet, project
+
+STREAM_FORMATS = {"ndjson": "application/x-ndjson", "sse": "text/event-stream"}
+# Proxies must pass each record through as it is written instead of buffering the response
+STREAM_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def stream_format(requested: Optional[str], accept: Optional[str]) -> str:
+    if requested in STREAM_FORMATS:
+        return requested
+    return "sse" if "text/event-stream" in (accept or "") else "ndjson"
+
+
+def encode_record(record: Dict, fmt: str) -> bytes:
+    if fmt == "sse":
+        return f"event: {record['type']}\ndata: ".encode() + dumps(record["data"]) + b"\n\n"
+    return dumps(record) + b"\n"
+
+
+def error_record(error: Exception) -> Dict:
+    return {"type": "error", "data": {"error": str(error)}}
+
+
+def project_record(record: Dict, fields: Optional[FieldSet], items_key: str) -> Optional[Dict]:
+    # Item records carry one element of the full report's items list, so they take that part of the field set
+    if fields is None or record["type"] == "error":
+        return record
+    if record["type"] == "summary":
+        return {"type": "summary", "data": fields.project(record["data"])}
+    if not fields.wants(items_key):
+        return None
+    return {"type": record["type"], "data": project(record["data"], fields.child(items_key))}
@@ -0,0 +1,9 @@
+import os
+import sys
+
+# The API modules (app, jobs, services, ...) live at the repository root rather than in a package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# The apps default to the on-disk response cache; the suite keeps everything in memory instead
+os.environ.setdefault("CACHE_BACKEND", "memory")
+
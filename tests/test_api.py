@@ -0,0 +1,690 @@
+import asyncio
+import gzip
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import brotli
+import pytest
+from starlette.testclient import TestClient
+
+from gh_maintainer_dashboard.core.accounting import current_account, start_account
+from gh_maintainer_dashboard.core.async_client import AsyncGitHubClient, iter_sync, iter_user_batch
+from gh_maintainer_dashboard.core.cache import CacheManager, invalidate_user
+from gh_maintainer_dashboard.core.projection import FieldSet
+from batch import BATCH_MAX_USERS
+from encoding import COMPRESS_MIN_BYTES, choose_encoding, encode_body
+from http_cache import ResponseCache, set_response_cache
+from jobs import JobQueue
+from metrics import render
+from services import SERVICE_CLASSES, ServiceRegistry, default_registry, set_registry
+from cookie_licking_detector import CookieLickingDetector
+from milestone_celebrations import MilestoneCelebrations
+from oss_discovery_engine import OSSDiscoveryEngine
+import app as flask_api
+import asgi
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def wait_for(condition, timeout: float = 5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
+
+
+class TestJobQueue:
+    def setup_method(self):
+        self.release = threading.Event()
+        self.calls = []
+    
+    def scan(self, report_progress):
+        self.calls.append(1)
+        report_progress(1, 2)
+        self.release.wait(5)
+        report_progress(2, 2)
+        return {"claimed": 3}
+    
+    def test_duplicate_submissions_share_one_job(self):
+        queue = JobQueue(store=CacheManager(backend="memory"))
+        
+        first = queue.submit("stale_claims", ("octocat", "hello"), self.scan)
+        second = queue.submit("stale_claims", ("octocat", "hello"), self.scan)
+        other = queue.submit("stale_claims", ("octocat", "world"), self.scan)
+        self.release.set()
+        wait_for(lambda: not first.active and not other.active)
+        
+        assert second is first
+        assert other is not first
+        assert len(self.calls) == 2
+    
+    def test_progress_and_result_are_reported(self):
+        queue = JobQueue(store=CacheManager(backend="memory"))
+        
+        job = queue.submit("discovery", "octocat", self.scan)
+        wait_for(lambda: queue.get(job.id).to_dict()["progress"] == {"done": 1, "total": 2})
+        assert queue.get(job.id).to_dict()["status"] == "running"
+        self.release.set()
+        wait_for(lambda: queue.get(job.id).status == "done")
+        
+        status = queue.get(job.id).to_dict()
+        assert status["progress"] == {"done": 2, "total": 2}
+        assert status["result"] == {"claimed": 3}
+        assert status["upstream"]["service"] == "discovery"
+    
+    def test_finished_jobs_are_pruned_after_retention(self):
+        queue = JobQueue(retention=-1, store=CacheManager(backend="memory"))
+        self.release.set()
+        
+        job = queue.submit("discovery", "octocat", self.scan)
+        wait_for(lambda: job.finished_at is not None)
+        queue.submit("discovery", "hubot", self.scan)
+        
+        assert job.id not in queue.jobs
+        assert queue.get(job.id) is None
+    
+    def test_workers_sharing_a_store_see_each_others_jobs(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("CACHE_PATH", str(tmp_path / "cache.sqlite3"))
+        worker_a = JobQueue(store=CacheManager(backend="sqlite"))
+        worker_b = JobQueue(store=CacheManager(backend="sqlite"))
+        
+        job = worker_a.submit("stale_claims", ("octocat", "hello"), self.scan)
+        wait_for(lambda: worker_b.get(job.id) is not None and worker_b.get(job.id).status == "running")
+        duplicate = worker_b.submit("stale_claims", ("octocat", "hello"), self.scan)
+        self.release.set()
+        wait_for(lambda: worker_b.get(job.id).status == "done")
+        
+        assert duplicate.id == job.id
+        assert len(self.calls) == 1
+        assert worker_b.get(job.id).to_dict()["result"] == {"claimed": 3}
+        # Once finished, the claim is released and a new scan can start anywhere
+        rerun = worker_b.submit("stale_claims", ("octocat", "hello"), self.scan)
+        assert rerun.id != job.id
+
+
+class TestMetrics:
+    def test_every_cache_manager_is_reported_by_name(self):
+        managers = [CacheManager(backend="memory", name="test-client") for _ in range(2)]
+        managers[0].set("user:octocat", {"login": "octocat"})
+        managers[0].get("user:octocat")
+        managers[1].get("user:hubot")
+        
+        body = render().decode()
+        
+        assert 'cache_hits_total{cache="test-client"} 1.0' in body
+        assert 'cache_misses_total{cache="test-client"} 1.0' in body
+        assert 'cache_hit_ratio{cache="test-client"} 0.5' in body
+        assert 'cache_entries{cache="test-client"} 1.0' in body
+    
+    def test_multiprocess_scrape_sums_every_worker(self, tmp_path, monkeypatch):
+        env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)}
+        worker = "import time; from metrics import observe_request; observe_request('/api/health', 'GET', 200, time.perf_counter())"
+        for _ in range(2):
+            subprocess.run([sys.executable, "-c", worker], cwd=ROOT, env=env, check=True)
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+        
+        body = render().decode()
+        
+        assert 'api_request_duration_seconds_count{method="GET",route="/api/health",status="200"} 2.0' in body
+        assert 'cache_hit_ratio' in body
+
+
+class TestServiceRegistry:
+    def setup_method(self):
+        self.built = []
+        self.release = threading.Event()
+    
+    def build(self):
+        self.release.wait(5)
+        self.built.append(object())
+        return self.built[-1]
+    
+    def test_get_builds_each_service_once(self):
+        registry = ServiceRegistry({"dashboard": self.build, "milestones": self.build})
+        self.release.set()
+        
+        assert registry.get("dashboard") is registry.get("dashboard")
+        assert registry.get("milestones") is not registry.get("dashboard")
+        assert len(self.built) == 2
+        assert registry.get_stats() == {"registered": ["dashboard", "milestones"], "built": ["dashboard", "milestones"]}
+    
+    def test_concurrent_first_requests_share_one_instance(self):
+        registry = ServiceRegistry({"dashboard": self.build})
+        seen = []
+        threads = [threading.Thread(target=lambda: seen.append(registry.get("dashboard"))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        self.release.set()
+        for thread in threads:
+            thread.join()
+        
+        assert len(self.built) == 1
+        assert all(service is self.built[0] for service in seen)
+    
+    def test_override_and_reset(self):
+        registry = ServiceRegistry({"dashboard": self.build, "milestones": self.build})
+        self.release.set()
+        stub = object()
+        registry.override("dashboard", stub)
+        milestones = registry.get("milestones")
+        
+        assert registry.get("dashboard") is stub
+        registry.reset("dashboard")
+        assert registry.get("dashboard") is self.built[-1]
+        assert registry.get("milestones") is milestones
+        registry.reset()
+        assert registry.get("milestones") is not milestones
+    
+    def test_get_labels_the_current_request(self):
+        registry = ServiceRegistry({"discovery": object, "milestones": object})
+        account = start_account()
+        
+        registry.get("discovery")
+        registry.get("milestones")
+        
+        # The route's own service keeps the label even if it resolves others on the way
+        assert current_account() is account
+        assert account.service == "discovery"
+    
+    def test_default_registry_injects_the_shared_async_client(self):
+        client = object()
+        registry = default_registry("token", async_client=client)
+        
+        assert registry.get("milestones").async_client is client
+        assert registry.get("stale_claims").async_client is client
+
+
+class StubDashboard:
+    def __init__(self):
+        self.calls = 0
+        self.batches = []
+    
+    def get_profile(self, username):
+        self.calls += 1
+        if username == "ghost":
+            raise LookupError("Not Found")
+        # Large enough to clear the compression threshold
+        return {"login": username, "bio": "maintainer " * 200}
+    
+    async def get_profile_async(self, username):
+        return self.get_profile(username)
+    
+    async def get_profiles_batch(self, usernames, concurrency=5):
+        self.batches.append(usernames)
+        async for result in iter_user_batch(usernames, self.get_profile_async, limit=concurrency):
+            yield result
+
+
+def body(response) -> bytes:
+    # Flask's test client exposes the payload as .data, httpx as .content
+    return response.data if hasattr(response, "data") else response.content
+
+
+def json_body(response):
+    return json.loads(body(response))
+
+
+@pytest.fixture
+def stubs():
+    # Stand-ins for the registry's services; tests add the ones their routes need
+    return {"dashboard": StubDashboard()}
+
+
+@pytest.fixture
+def dashboard(stubs):
+    return stubs["dashboard"]
+
+
+@pytest.fixture(params=["flask", "asgi"])
+def client(request, stubs):
+    def install():
+        set_registry(ServiceRegistry({name: (lambda name=name: stubs[name]) for name in SERVICE_CLASSES}))
+    
+    set_response_cache(ResponseCache(CacheManager(backend="memory", name="response")))
+    try:
+        if request.param == "flask":
+            install()
+            yield flask_api.app.test_client()
+        else:
+            with TestClient(asgi.app) as client:
+                # The lifespan installs its own registry; the stubs go back in for the test
+                install()
+                yield client
+    finally:
+        set_registry(None)
+        set_response_cache(None)
+
+
+class TestConditionalResponses:
+    path = "/api/dashboard/octocat/profile"
+    
+    def test_matching_etag_gets_304_without_a_body(self, client, dashboard):
+        first = client.get(self.path, headers={"Accept-Encoding": "identity"})
+        etag = first.headers["ETag"]
+        
+        second = client.get(self.path, headers={"Accept-Encoding": "identity", "If-None-Match": etag})
+        weak = client.get(self.path, headers={"Accept-Encoding": "identity", "If-None-Match": f'"other", W/{etag}'})
+        stale = client.get(self.path, headers={"Accept-Encoding": "identity", "If-None-Match": '"other"'})
+        
+        assert first.status_code == 200
+        assert "max-age=" in first.headers["Cache-Control"]
+        assert (second.status_code, body(second)) == (304, b"")
+        assert second.headers["ETag"] == etag
+        assert weak.status_code == 304
+        assert stale.status_code == 200 and body(stale) == body(first)
+        assert dashboard.calls == 1
+    
+    @pytest.mark.parametrize("encoding", ["gzip", "br"])
+    def test_compressed_etag_revalidates(self, client, dashboard, encoding):
+        plain = client.get(self.path, headers={"Accept-Encoding": "identity"}).headers["ETag"]
+        compressed = client.get(self.path, headers={"Accept-Encoding": encoding})
+        
+        assert compressed.headers["Content-Encoding"] == encoding
+        assert compressed.headers["ETag"] == plain[:-1] + f'-{encoding}"'
+        revalidated = client.get(self.path, headers={"Accept-Encoding": encoding,
+                                                     "If-None-Match": compressed.headers["ETag"]})
+        assert revalidated.status_code == 304
+        assert dashboard.calls == 1
+    
+    def test_invalidating_the_user_rebuilds_the_response(self, client, dashboard):
+        etag = client.get(self.path).headers["ETag"]
+        client.get(self.path)
+        assert dashboard.calls == 1
+        
+        invalidate_user("OctoCat")
+        refreshed = client.get(self.path, headers={"If-None-Match": etag})
+        
+        assert dashboard.calls == 2
+        # Same data, so the rebuilt response still validates the client's copy
+        assert refreshed.status_code == 304
+
+
+class TestEncoding:
+    @pytest.mark.parametrize("accept_encoding, expected", [
+        ("gzip, deflate, br", "br"),
+        ("gzip", "gzip"),
+        ("br;q=0, gzip;q=0.5", "gzip"),
+        ("gzip;q=0", None),
+        ("*", "br"),
+        ("*, br;q=0", "gzip"),
+        ("identity", None),
+        (None, None),
+    ])
+    def test_accept_encoding_selection(self, accept_encoding, expected):
+        assert choose_encoding(accept_encoding) == expected
+    
+    def test_bodies_under_the_threshold_are_left_alone(self):
+        small = b"x" * (COMPRESS_MIN_BYTES - 1)
+        large = b'{"bio": "' + b"x" * COMPRESS_MIN_BYTES + b'"}'
+        
+        assert encode_body(small, "application/json", "gzip") == (small, None)
+        assert encode_body(large, "text/html", "gzip") == (large, None)
+        body, encoding = encode_body(large, "application/json", "gzip")
+        assert encoding == "gzip" and gzip.decompress(body) == large
+        body, encoding = encode_body(large, "application/json", "br")
+        assert encoding == "br" and brotli.decompress(body) == large
+    
+    def test_json_responses_vary_on_accept_encoding(self, client):
+        compressed = client.get("/api/dashboard/octocat/profile", headers={"Accept-Encoding": "gzip"})
+        small = client.get("/api/health", headers={"Accept-Encoding": "gzip"})
+        
+        assert "Accept-Encoding" in compressed.headers["Vary"]
+        assert compressed.headers["Content-Encoding"] == "gzip"
+        # Too small to compress, but caches still must not hand it to clients that asked differently
+        assert "Accept-Encoding" in small.headers["Vary"]
+        assert "Content-Encoding" not in small.headers
+
+
+def claimed_issue(number):
+    return {
+        "issue_details": {"number": number, "title": f"Issue {number}"},
+        "claimant_details": {"username": "hubot"},
+        "health_status": "critical",
+    }
+
+
+class StubScanner:
+    def __init__(self, fail=False):
+        self.fail = fail
+    
+    async def analyze_repository_stream(self, repo, limit=20, fields=None):
+        for number in (1, 2):
+            yield {"type": "issue", "data": claimed_issue(number)}
+        if self.fail:
+            raise RuntimeError("GitHub unreachable")
+        yield {"type": "summary", "data": {"repository_stats": {"total_claimed_issues": 2}, "summary_by_user": {}}}
+    
+    def analyze_repository_iter(self, repo, limit=20, fields=None):
+        return iter_sync(self.analyze_repository_stream(repo, limit, fields))
+
+
+def ndjson_records(response):
+    return [json.loads(line) for line in body(response).decode().splitlines()]
+
+
+class TestStaleClaimsStream:
+    path = "/api/stale-claims/octocat/hello/stream"
+    
+    def test_ndjson_is_the_default(self, client, stubs):
+        stubs["stale_claims"] = StubScanner()
+        
+        response = client.get(self.path)
+        records = ndjson_records(response)
+        
+        assert response.headers["Content-Type"].startswith("application/x-ndjson")
+        assert response.headers["Cache-Control"] == "no-cache"
+        assert [record["type"] for record in records] == ["issue", "issue", "summary"]
+        assert records[0]["data"] == claimed_issue(1)
+    
+    @pytest.mark.parametrize("query, headers", [("?format=sse", {}), ("", {"Accept": "text/event-stream"})])
+    def test_sse_framing(self, client, stubs, query, headers):
+        stubs["stale_claims"] = StubScanner()
+        
+        response = client.get(self.path + query, headers=headers)
+        events = body(response).decode().split("\n\n")
+        
+        assert response.headers["Content-Type"].startswith("text/event-stream")
+        assert events[-1] == ""
+        assert events[0] == "event: issue\ndata: " + json.dumps(claimed_issue(1), separators=(",", ":"))
+        assert events[2].startswith("event: summary\ndata: {")
+    
+    def test_format_parameter_wins_over_accept(self, client, stubs):
+        stubs["stale_claims"] = StubScanner()
+        
+        response = client.get(self.path + "?format=ndjson", headers={"Accept": "text/event-stream"})
+        
+        assert response.headers["Content-Type"].startswith("application/x-ndjson")
+    
+    def test_failure_mid_stream_ends_with_an_error_record(self, client, stubs):
+        stubs["stale_claims"] = StubScanner(fail=True)
+        
+        records = ndjson_records(client.get(self.path))
+        
+        assert [record["type"] for record in records] == ["issue", "issue", "error"]
+        assert records[-1]["data"] == {"error": "GitHub unreachable"}
+    
+    def test_each_record_is_projected(self, client, stubs):
+        stubs["stale_claims"] = StubScanner()
+        
+        projected = ndjson_records(client.get(self.path + "?fields=all_claimed_issues.issue_details.number,repository_stats"))
+        summary_only = ndjson_records(client.get(self.path + "?fields=repository_stats"))
+        
+        assert projected == [
+            {"type": "issue", "data": {"issue_details": {"number": 1}}},
+            {"type": "issue", "data": {"issue_details": {"number": 2}}},
+            {"type": "summary", "data": {"repository_stats": {"total_claimed_issues": 2}}},
+        ]
+        # Issue records carry nothing that was asked for, so they are left out entirely
+        assert summary_only == [{"type": "summary", "data": {"repository_stats": {"total_claimed_issues": 2}}}]
+
+
+def fake_scan(detector, delays):
+    # Claims and their lookups come back without GitHub; later issues finish first
+    calls = {"profiles": [], "messages": 0}
+    
+    async def detect_claimed_issues_async(client, repo, limit=20, concurrency=10):
+        return [{
+            "issue": {
+                "number": number, "title": f"Issue {number}", "html_url": f"https://github.com/{repo}/issues/{number}",
+                "state": "open", "labels": [], "created_at": "2026-01-01T00:00:00Z", "updated_at": "2026-01-02T00:00:00Z",
+            },
+            "claim_info": {"claimed_by": f"user{number % 2}", "claimed_at": "2026-01-01T00:00:00Z"},
+            "details": {},
+        } for number in delays]
+    
+    async def get_issue_progress_async(client, repo, number, claimed_by, prs=None, details=None):
+        await asyncio.sleep(delays[number])
+        return {"has_commits": number == 1, "has_linked_pr": False, "last_activity": None, "user_comments": []}
+    
+    async def get_user_profile_async(client, username, repo=None, include_past_performance=True):
+        calls["profiles"].append((username, include_past_performance))
+        return {
+            "username": username,
+            "reliability_metrics": {"reliability_score": 0.5},
+            "recent_activity_30d": {"commits": 3, "prs_opened": 1},
+            "past_performance": [],
+        }
+    
+    def generate_messages(issue, user_profile, staleness, ai_analysis):
+        calls["messages"] += 1
+        return {"gentle_reminder": f"Any news on #{issue['number']}?"}
+    
+    detector.claim_detector.detect_claimed_issues_async = detect_claimed_issues_async
+    detector.claim_detector.get_issue_progress_async = get_issue_progress_async
+    detector.user_profiler.get_user_profile_async = get_user_profile_async
+    detector.message_generator.generate_messages = generate_messages
+    return calls
+
+
+class TestStaleClaimsService:
+    def test_stream_matches_the_report(self):
+        detector = CookieLickingDetector("token")
+        fake_scan(detector, {1: 0.15, 2: 0.1, 3: 0.05})
+        
+        report = detector.analyze_repository("octocat/hello")
+        records = list(detector.analyze_repository_iter("octocat/hello"))
+        
+        issues = [record["data"] for record in records if record["type"] == "issue"]
+        summary = records[-1]
+        assert [record["type"] for record in records] == ["issue"] * 3 + ["summary"]
+        # The stream yields in completion order; the report keeps the issue listing order
+        assert [issue["issue_details"]["number"] for issue in issues] == [3, 2, 1]
+        assert [issue["issue_details"]["number"] for issue in report["all_claimed_issues"]] == [1, 2, 3]
+        assert sorted(issues, key=lambda issue: issue["issue_details"]["number"]) == report["all_claimed_issues"]
+        assert set(report) == {"scan_metadata", "repository_stats", "all_claimed_issues", "summary_by_user",
+                               "recommendations_summary"}
+        for key in ("repository_stats", "summary_by_user", "recommendations_summary"):
+            assert summary["data"][key] == report[key]
+
+
+class BrokenBatch:
+    async def get_profiles_batch(self, usernames, concurrency=5):
+        yield {"username": usernames[0], "success": True, "data": {"login": usernames[0]}}
+        raise RuntimeError("connection pool closed")
+
+
+class TestBatchRoutes:
+    path = "/api/dashboard/profiles/batch"
+    
+    @pytest.mark.parametrize("payload", [None, {}, {"usernames": []}, {"usernames": "octocat"}])
+    def test_missing_or_empty_usernames_are_rejected(self, client, payload):
+        response = client.post(self.path, json=payload) if payload is not None else client.post(self.path)
+        
+        assert response.status_code == 400
+        assert "usernames" in json_body(response)["error"]
+    
+    def test_oversized_batches_are_rejected(self, client, dashboard):
+        usernames = [f"user{i}" for i in range(BATCH_MAX_USERS + 1)]
+        
+        response = client.post(self.path, json={"usernames": usernames})
+        
+        assert response.status_code == 400
+        assert dashboard.batches == []
+    
+    def test_duplicates_are_dropped_and_the_summary_counts_outcomes(self, client, dashboard):
+        response = client.post(self.path, json={"usernames": ["octocat", "ghost", "octocat", "hubot"]})
+        records = ndjson_records(response)
+        
+        assert dashboard.batches == [["octocat", "ghost", "hubot"]]
+        users = {record["data"]["username"]: record["data"] for record in records[:-1]}
+        assert sorted(users) == ["ghost", "hubot", "octocat"]
+        assert users["ghost"] == {"username": "ghost", "success": False, "error": "Not Found"}
+        assert records[-1] == {"type": "summary", "data": {"total": 3, "succeeded": 2, "failed": 1}}
+    
+    def test_user_records_are_projected(self, client):
+        records = ndjson_records(client.post(self.path + "?fields=login", json={"usernames": ["octocat"]}))
+        
+        assert records[0]["data"] == {"username": "octocat", "success": True, "data": {"login": "octocat"}}
+    
+    def test_batch_failure_ends_with_an_error_record(self, client, stubs):
+        stubs["dashboard"] = BrokenBatch()
+        
+        records = ndjson_records(client.post(self.path, json={"usernames": ["octocat", "hubot"]}))
+        
+        assert [record["type"] for record in records] == ["user", "error"]
+        assert records[-1]["data"] == {"error": "connection pool closed"}
+
+
+class TestMilestonesBatch:
+    def test_repo_milestones_are_fetched_once_per_batch(self):
+        service = MilestoneCelebrations("token")
+        repo_fetches = []
+        user_counts = []
+        
+        async def detect_repo_milestones_async(client, repo):
+            repo_fetches.append(repo)
+            await asyncio.sleep(0.01)
+            return [{"type": "stars", "repo": repo}]
+        
+        async def get_user_counts_async(client, username, repo=None):
+            user_counts.append((username, repo))
+            return 12, 3
+        
+        service.detector.detect_repo_milestones_async = detect_repo_milestones_async
+        service.detector.get_user_counts_async = get_user_counts_async
+        
+        async def run():
+            return [result async for result in service.get_milestone_sections_batch(
+                ["octocat", "hubot", "monalisa"], ["octocat/hello", "octocat/world"], concurrency=3
+            )]
+        
+        results = asyncio.run(run())
+        
+        assert sorted(repo_fetches) == ["octocat/hello", "octocat/world"]
+        assert len(user_counts) == 9
+        assert all(result["success"] for result in results)
+        sections = results[0]["data"]["sections"]
+        assert {"type": "stars", "repo": "octocat/hello"} in sections["Repository: hello"]["milestones"]
+    
+    def test_sync_report_inside_a_running_loop(self):
+        detector = CookieLickingDetector("token")
+        fake_scan(detector, {1: 0, 2: 0})
+        
+        async def caller():
+            return detector.analyze_repository("octocat/hello")
+        
+        report = asyncio.run(caller())
+        
+        assert [issue["issue_details"]["number"] for issue in report["all_claimed_issues"]] == [1, 2]
+    
+    def test_unrequested_messages_and_past_performance_are_skipped(self):
+        detector = CookieLickingDetector("token")
+        calls = fake_scan(detector, {1: 0, 2: 0})
+        
+        report = detector.analyze_repository("octocat/hello", fields=FieldSet.parse("all_claimed_issues.issue_details"))
+        
+        assert calls["messages"] == 0
+        assert sorted(calls["profiles"]) == [("user0", False), ("user1", False)]
+        assert all("generated_messages" not in issue for issue in report["all_claimed_issues"])
+    
+    def test_requested_fields_are_computed(self):
+        detector = CookieLickingDetector("token")
+        calls = fake_scan(detector, {1: 0, 2: 0})
+        
+        detector.analyze_repository(
+            "octocat/hello", fields=FieldSet.parse("all_claimed_issues.generated_messages,all_claimed_issues.past_performance")
+        )
+        
+        assert calls["messages"] == 2
+        assert sorted(calls["profiles"]) == [("user0", True), ("user1", True)]
+
+
+def fake_discovery(engine, monkeypatch):
+    # Search and scoring come back without GitHub; only the per-repo lookups are counted
+    calls = {"health": [], "issues": []}
+    
+    async def analyze_user_profile_async(client, username):
+        return {"username": username}
+    
+    async def search_repos_async(client, user_profile, intent, query, filters):
+        return [{
+            "full_name": f"octocat/repo{number}", "html_url": f"https://github.com/octocat/repo{number}",
+            "stargazers_count": 10 * number, "forks_count": number, "open_issues_count": number,
+            "updated_at": "2026-01-01T00:00:00Z",
+        } for number in (1, 2)]
+    
+    async def analyze_repo_health_async(client, repo_full_name, good_first_issues=None):
+        calls["health"].append(repo_full_name)
+        return {"overall_health": "good"}
+    
+    async def get_repo_issues(client, repo, labels=None, state="open", max_pages=None):
+        calls["issues"].append(repo)
+        return [{"number": 7, "title": "Fix typo", "html_url": f"https://github.com/{repo}/issues/7",
+                 "created_at": "2026-01-01T00:00:00Z"}]
+    
+    engine.profile_analyzer.analyze_user_profile_async = analyze_user_profile_async
+    engine.ai_predictor.predict_capabilities = lambda user_profile: {"confidence": 0.9}
+    engine.repo_searcher.search_repos_async = search_repos_async
+    engine.match_scorer.calculate_match_score = lambda repo, user_profile, intent: {
+        "total_score": repo["stargazers_count"], "breakdown": {}, "match_reasons": ["Popular"],
+    }
+    engine.health_analyzer.analyze_repo_health_async = analyze_repo_health_async
+    monkeypatch.setattr(AsyncGitHubClient, "get_repo_issues", get_repo_issues)
+    return calls
+
+
+class TestDiscoveryFields:
+    def test_unrequested_health_and_issues_are_skipped(self, monkeypatch):
+        engine = OSSDiscoveryEngine("token")
+        calls = fake_discovery(engine, monkeypatch)
+        
+        data = engine.discover_projects("octocat", fields=FieldSet.parse("recommended_projects.repo.name"))
+        
+        assert calls == {"health": [], "issues": []}
+        assert [project["health_metrics"] for project in data["recommended_projects"]] == [None, None]
+    
+    def test_sync_discovery_inside_a_running_loop(self, monkeypatch):
+        engine = OSSDiscoveryEngine("token")
+        fake_discovery(engine, monkeypatch)
+        
+        async def caller():
+            return engine.discover_projects("octocat", fields=FieldSet.parse("recommended_projects.rank"))
+        
+        data = asyncio.run(caller())
+        
+        assert [project["repo"]["name"] for project in data["recommended_projects"]] == ["octocat/repo2", "octocat/repo1"]
+    
+    def test_health_metrics_fetch_issues_once_per_repo(self, monkeypatch):
+        engine = OSSDiscoveryEngine("token")
+        calls = fake_discovery(engine, monkeypatch)
+        
+        engine.discover_projects("octocat", fields=FieldSet.parse("recommended_projects.health_metrics"))
+        
+        assert sorted(calls["health"]) == ["octocat/repo1", "octocat/repo2"]
+        assert sorted(calls["issues"]) == ["octocat/repo1", "octocat/repo2"]
+
+
+class TestProjectedRoutes:
+    def test_stale_claims_fields(self, client, stubs):
+        detector = CookieLickingDetector("token")
+        calls = fake_scan(detector, {1: 0, 2: 0})
+        stubs["stale_claims"] = detector
+        
+        response = client.get("/api/stale-claims/octocat/hello?fields=all_claimed_issues.issue_details.number")
+        
+        assert response.status_code == 200
+        issues = json_body(response)["data"]["all_claimed_issues"]
+        assert sorted(issues, key=lambda issue: issue["issue_details"]["number"]) == [
+            {"issue_details": {"number": 1}}, {"issue_details": {"number": 2}},
+        ]
+        assert calls["messages"] == 0
+        assert all(not include for username, include in calls["profiles"])
+    
+    def test_discovery_fields(self, client, stubs, monkeypatch):
+        engine = OSSDiscoveryEngine("token")
+        calls = fake_discovery(engine, monkeypatch)
+        stubs["discovery"] = engine
+        
+        response = client.get("/api/discover/octocat?fields=recommended_projects.rank,recommended_projects.repo.name")
+        
+        assert response.status_code == 200
+        assert json_body(response)["data"] == {"recommended_projects": [
+            {"rank": 1, "repo": {"name": "octocat/repo2"}}, {"rank": 2, "repo": {"name": "octocat/repo1"}},
+        ]}
+        assert calls == {"health": [], "issues": []}